@@ -8,7 +8,7 @@ from backend.core.database import get_db
 from backend.core.models import Position, Portfolio
 from backend.core.security import get_current_user
 from backend.schemas.position import PositionCreate, PositionUpdate, PositionResponse, BulkPositionCreate
-from backend.services.data_ingestion import get_current_price
+from backend.services.latest_prices import get_mark_prices
 
 router = APIRouter()
 
@@ -37,8 +37,10 @@ async def add_positions(
     
     new_positions = []
     
+    quotes = await get_mark_prices([pos_data.ticker for pos_data in positions_data.positions], db)
+    
     for pos_data in positions_data.positions:
-        current_price = await get_current_price(pos_data.ticker)
+        current_price = quotes.get(pos_data.ticker, 0.0)
         
         market_value = float(pos_data.shares) * current_price
         unrealized_pnl = (current_price - float(pos_data.cost_basis)) * float(pos_data.shares)
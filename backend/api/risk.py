@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, List, Optional
 from decimal import Decimal
 
 from backend.core.database import get_db
 from backend.core.security import get_current_user
+from backend.services.stress_testing import get_stress_scenarios, save_stress_scenario
 from backend.services.risk_management import (
+    build_risk_context,
     calculate_var,
     calculate_cvar,
+    calculate_var_grid,
     calculate_stress_test,
+    calculate_stress_scenarios,
     calculate_greeks,
     calculate_correlation_matrix,
     calculate_risk_metrics
@@ -16,8 +20,13 @@ from backend.services.risk_management import (
 from backend.schemas.risk import (
     VaRRequest,
     VaRResponse,
+    VaRGridResponse,
     StressTestRequest,
     StressTestResponse,
+    StressScenarioCreate,
+    StressScenarioResponse,
+    StressScenarioRunRequest,
+    StressScenarioRunResponse,
     GreeksResponse,
     RiskMetricsResponse
 )
@@ -34,6 +43,8 @@ async def get_portfolio_var(
     current_user: Dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
+    context = await build_risk_context(portfolio_id, db, int(current_user["id"]))
+    
     var_result = await calculate_var(
         portfolio_id=portfolio_id,
         confidence=confidence,
@@ -41,7 +52,8 @@ async def get_portfolio_var(
         method=method,
         simulations=simulations,
         db=db,
-        user_id=int(current_user["id"])
+        user_id=int(current_user["id"]),
+        context=context
     )
     
     cvar_result = await calculate_cvar(
@@ -51,7 +63,8 @@ async def get_portfolio_var(
         method=method,
         simulations=simulations,
         db=db,
-        user_id=int(current_user["id"])
+        user_id=int(current_user["id"]),
+        context=context
     )
     
     return {
@@ -62,9 +75,50 @@ async def get_portfolio_var(
         "var": var_result["var"],
         "cvar": cvar_result["cvar"],
         "var_percentage": var_result["var_percentage"],
-        "portfolio_value": var_result["portfolio_value"]
+        "portfolio_value": var_result["portfolio_value"],
+        "convergence": var_result.get("convergence")
     }
 
+@router.get("/{portfolio_id}/var/grid", response_model=VaRGridResponse)
+async def get_portfolio_var_grid(
+    portfolio_id: int,
+    confidence: Optional[List[float]] = Query(None),
+    horizon: Optional[List[int]] = Query(None),
+    method: Optional[List[str]] = Query(None),
+    simulations: int = Query(10000, ge=1000, le=100000),
+    persist: bool = Query(True),
+    current_user: Dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    if confidence and any(not 0.8 <= c <= 0.99 for c in confidence):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Confidence levels must be between 0.8 and 0.99"
+        )
+    
+    if horizon and any(not 1 <= h <= 252 for h in horizon):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Horizons must be between 1 and 252 days"
+        )
+    
+    if method and any(m not in ("historical", "parametric", "monte_carlo") for m in method):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Unsupported VaR method"
+        )
+    
+    return await calculate_var_grid(
+        portfolio_id=portfolio_id,
+        db=db,
+        user_id=int(current_user["id"]),
+        confidence_levels=confidence,
+        horizons=horizon,
+        methods=method,
+        simulations=simulations,
+        persist=persist
+    )
+
 @router.post("/{portfolio_id}/stress-test", response_model=StressTestResponse)
 async def run_stress_test(
     portfolio_id: int,
@@ -82,6 +136,70 @@ async def run_stress_test(
     
     return stress_results
 
+@router.post("/{portfolio_id}/stress-test/scenarios", response_model=StressScenarioRunResponse)
+async def run_portfolio_stress_scenarios(
+    portfolio_id: int,
+    run_request: StressScenarioRunRequest,
+    current_user: Dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    try:
+        return await calculate_stress_scenarios(
+            portfolio_id=portfolio_id,
+            db=db,
+            user_id=int(current_user["id"]),
+            scenario_names=run_request.scenarios,
+            include_positions=run_request.include_positions,
+            top_positions=run_request.top_positions
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+@router.get("/stress-scenarios", response_model=List[StressScenarioResponse])
+async def list_stress_scenarios(
+    current_user: Dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> List[Dict[str, Any]]:
+    scenarios = await get_stress_scenarios(db, int(current_user["id"]))
+    return [_stress_scenario_response(scenario) for scenario in scenarios]
+
+@router.post("/stress-scenarios", response_model=StressScenarioResponse, status_code=status.HTTP_201_CREATED)
+async def create_stress_scenario(
+    scenario_data: StressScenarioCreate,
+    current_user: Dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    try:
+        scenario = await save_stress_scenario(
+            db=db,
+            user_id=int(current_user["id"]),
+            **scenario_data.model_dump()
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    
+    return _stress_scenario_response(scenario)
+
+def _stress_scenario_response(scenario) -> Dict[str, Any]:
+    return {
+        "id": scenario.id,
+        "name": scenario.name,
+        "kind": scenario.kind,
+        "description": scenario.description,
+        "start_date": scenario.start_date,
+        "end_date": scenario.end_date,
+        "factor_shocks": scenario.factor_shocks,
+        "shocks": scenario.shocks,
+        "default_shock": scenario.default_shock,
+        "builtin": scenario.owner_id is None
+    }
+
 @router.get("/{portfolio_id}/greeks", response_model=GreeksResponse)
 async def get_portfolio_greeks(
     portfolio_id: int,
@@ -119,11 +237,14 @@ async def get_risk_metrics(
     current_user: Dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
+    context = await build_risk_context(portfolio_id, db, int(current_user["id"]), lookback_days=lookback_days)
+    
     metrics = await calculate_risk_metrics(
         portfolio_id=portfolio_id,
         lookback_days=lookback_days,
         db=db,
-        user_id=int(current_user["id"])
+        user_id=int(current_user["id"]),
+        context=context
     )
     
     return metrics
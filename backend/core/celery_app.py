@@ -25,6 +25,18 @@ celery_app.conf.beat_schedule = {
         "task": "backend.tasks.ingest_daily_prices",
         "schedule": crontab(hour=18, minute=0),
     },
+    "ingest-intraday-bars": {
+        "task": "backend.tasks.ingest_intraday_bars",
+        "schedule": crontab(minute="*/15", hour="13-21", day_of_week="mon-fri"),
+    },
+    "rollup-intraday-bars": {
+        "task": "backend.tasks.rollup_intraday_bars",
+        "schedule": crontab(hour=21, minute=30, day_of_week="mon-fri"),
+    },
+    "update-covariance-state": {
+        "task": "backend.tasks.update_covariance_state",
+        "schedule": crontab(hour=18, minute=30),
+    },
     "calculate-portfolio-metrics": {
         "task": "backend.tasks.calculate_portfolio_metrics",
         "schedule": crontab(hour=19, minute=0),
@@ -1,6 +1,8 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from functools import lru_cache
+from pathlib import Path
+import yaml
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -46,14 +48,88 @@ class Settings(BaseSettings):
     
     REDIS_MAX_CONNECTIONS: int = 50
     
+    PRICE_CACHE_ENABLED: bool = True
+    PRICE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    PRICE_CACHE_LOCAL_TTL: float = 300.0
+    PRICE_CACHE_REDIS_ENABLED: bool = True
+    PRICE_CACHE_REDIS_TTL: int = 86400
+    
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_ENABLE_HTTP2: bool = True
+    
+    QUOTE_CACHE_TTL: float = 15.0
+    QUOTE_BATCH_WINDOW: float = 0.01
+    QUOTE_MAX_BATCH_SIZE: int = 200
+    LATEST_PRICE_CACHE_TTL: float = 30.0
+    LATEST_PRICE_MAX_AGE: float = 345600.0
+    
+    PRICE_STORE_BACKEND: str = "sql"
+    PRICE_STORE_PATH: str = "data/price_store"
+    
+    PROVIDER_CACHE_ENABLED: bool = True
+    PROVIDER_CACHE_PATH: str = "data/provider_cache"
+    PROVIDER_CACHE_TTL: float = 43200.0
+    
+    PRICE_INSERT_BATCH_SIZE: int = 2000
+    PRICE_COPY_MIN_ROWS: int = 20000
+    PRICE_READ_CHUNK_ROWS: int = 50000
+    PRICE_PARTITION_HOT_YEARS: int = 2
+    
+    INTRADAY_STORE_PATH: str = "data/intraday"
+    INTRADAY_MINUTE_RETENTION_DAYS: int = 30
+    INTRADAY_FIVE_MINUTE_RETENTION_DAYS: int = 365
+    
+    DATA_QUALITY_ENABLED: bool = True
+    DATA_QUALITY_ZSCORE_THRESHOLD: float = 10.0
+    DATA_QUALITY_LOOKBACK_DAYS: int = 180
+    DATA_QUALITY_MARKET_TICKER: str = "SPY"
+    MARKET_TIMEZONE: str = "America/New_York"
+    MARKET_CLOSE_HOUR: int = 16
+    
     MAX_POSITIONS_PER_PORTFOLIO: int = 10000
     DEFAULT_CURRENCY: str = "USD"
     
     VAR_CONFIDENCE_LEVELS: List[float] = [0.90, 0.95, 0.99]
+    VAR_HORIZONS: List[int] = [1, 5, 10, 20]
     MONTE_CARLO_SIMULATIONS: int = 10000
+    MONTE_CARLO_SAMPLER: str = "antithetic"
+    MONTE_CARLO_SEED: Optional[int] = None
+    MONTE_CARLO_CHUNK_BYTES: int = 64 * 1024 * 1024
+    MONTE_CARLO_FACTOR_CACHE_SIZE: int = 32
+    MONTE_CARLO_TOLERANCE: float = 0.01
+    
+    STRESS_DEFAULT_SHOCK: float = -0.20
+    STRESS_BETA_LOOKBACK_DAYS: int = 504
+    STRESS_MIN_BETA_OBSERVATIONS: int = 60
+    
+    COVARIANCE_EWMA_ENABLED: bool = True
+    COVARIANCE_EWMA_DECAY: float = 0.94
+    COVARIANCE_STORE_PATH: str = "data/covariance"
+    COVARIANCE_UNIVERSE: str = "firm"
+    COVARIANCE_WARMUP_DAYS: int = 756
+    COVARIANCE_MIN_OBSERVATIONS: int = 60
+    COVARIANCE_PENDING_DAYS: int = 5
+    COVARIANCE_RETAIN_VERSIONS: int = 30
+    COVARIANCE_RISK_ESTIMATOR: str = "ewma"
+    COVARIANCE_OPTIMIZATION_ESTIMATOR: str = "ledoit_wolf"
+    COVARIANCE_CACHE_SIZE: int = 64
+    COVARIANCE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    COVARIANCE_FACTOR_COUNT: int = 20
+    COVARIANCE_FACTOR_MIN_ASSETS: int = 1000
+    
+    COMPUTE_POOL_ENABLED: bool = True
+    COMPUTE_POOL_WORKERS: int = 2
+    COMPUTE_POOL_START_METHOD: str = "spawn"
+    COMPUTE_POOL_SHARED_MEMORY_MIN_BYTES: int = 1024 * 1024
     
     ML_MODEL_PATH: str = "backend/models/saved"
     
+    APP_CONFIG_PATH: str = "config.yaml"
+    
     @property
     def jwt_secret(self) -> str:
         return self.JWT_SECRET_KEY or self.SECRET_KEY
@@ -63,3 +139,13 @@ def get_settings() -> Settings:
     return Settings()
 
 settings = get_settings()
+
+@lru_cache()
+def get_app_config() -> Dict[str, Any]:
+    config_path = Path(settings.APP_CONFIG_PATH)
+    
+    if not config_path.exists():
+        return {}
+    
+    with open(config_path) as f:
+        return yaml.safe_load(f) or {}
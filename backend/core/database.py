@@ -1,3 +1,4 @@
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
@@ -23,6 +24,35 @@ AsyncSessionLocal = async_sessionmaker(
 
 Base = declarative_base()
 
+def ensure_price_data_unique_index(connection):
+    inspector = inspect(connection)
+    
+    unique_columns = [c["column_names"] for c in inspector.get_unique_constraints("price_data")]
+    unique_columns += [i["column_names"] for i in inspector.get_indexes("price_data") if i["unique"]]
+    
+    if ["ticker", "date"] in unique_columns:
+        return
+    
+    connection.execute(text(
+        "DELETE FROM price_data WHERE id NOT IN "
+        "(SELECT MAX(id) FROM price_data GROUP BY ticker, date)"
+    ))
+    connection.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_price_data_ticker_date ON price_data (ticker, date)"
+    ))
+
+def dialect_insert(db: AsyncSession):
+    dialect = db.bind.dialect.name
+    
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Upsert is not supported on {dialect}")
+    
+    return insert
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
@@ -0,0 +1,234 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from backend.core.config import settings, get_app_config
+
+_provider_executor: Optional[ThreadPoolExecutor] = None
+
+def get_provider_executor() -> ThreadPoolExecutor:
+    global _provider_executor
+    
+    if _provider_executor is None:
+        ingestion_config = get_app_config().get("ingestion", {})
+        _provider_executor = ThreadPoolExecutor(
+            max_workers=ingestion_config.get("thread_pool_size", 8),
+            thread_name_prefix="price-provider"
+        )
+    
+    return _provider_executor
+
+COMPUTE_WARM_MODULES = [
+    "scipy.optimize",
+    "scipy.stats",
+    "pypfopt",
+    "backend.services.monte_carlo",
+    "backend.services.risk_management",
+    "backend.services.portfolio_optimization",
+]
+
+@dataclass
+class SharedArray:
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+@dataclass
+class SharedFrame:
+    values: SharedArray
+    index: pd.Index
+    columns: pd.Index
+
+def _warm_worker():
+    import importlib
+    
+    for module in COMPUTE_WARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            print(f"Could not preload {module} in compute worker: {e}")
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+def _attach(shared: SharedArray, handles: List[SharedMemory]) -> np.ndarray:
+    shm = SharedMemory(name=shared.name)
+    handles.append(shm)
+    
+    array = np.ndarray(shared.shape, dtype=np.dtype(shared.dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    return array
+
+def _restore(value: Any, handles: List[SharedMemory]) -> Any:
+    if isinstance(value, SharedArray):
+        return _attach(value, handles)
+    if isinstance(value, SharedFrame):
+        return pd.DataFrame(_attach(value.values, handles), index=value.index, columns=value.columns, copy=False)
+    return value
+
+def _invoke(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Any, float, float]:
+    started = time.time()
+    handles: List[SharedMemory] = []
+    
+    try:
+        args = tuple(_restore(arg, handles) for arg in args)
+        kwargs = {key: _restore(value, handles) for key, value in kwargs.items()}
+        result = fn(*args, **kwargs)
+    finally:
+        args = kwargs = None
+        for shm in handles:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+    
+    return result, started, time.time()
+
+class ComputePool:
+    def __init__(self, workers: int, shared_memory_min_bytes: int, start_method: str, history: int = 1000):
+        self.workers = workers or os.cpu_count() or 1
+        self.shared_memory_min_bytes = shared_memory_min_bytes
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._restart_lock = asyncio.Lock()
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._completed = 0
+        self._errors = 0
+        self._queue_waits = deque(maxlen=history)
+        self._run_times = deque(maxlen=history)
+        self._latencies = deque(maxlen=history)
+    
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+    
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_warm_worker
+        )
+    
+    async def _warm(self, executor: ProcessPoolExecutor):
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(executor, _worker_pid) for _ in range(self.workers)
+        ])
+    
+    async def start(self):
+        if self._executor is not None:
+            return
+        
+        self._executor = self._create_executor()
+        await self._warm(self._executor)
+    
+    async def _restart(self, broken: ProcessPoolExecutor) -> bool:
+        async with self._restart_lock:
+            if self._executor is not broken:
+                return False
+            
+            self._executor = self._create_executor()
+            broken.shutdown(wait=False, cancel_futures=True)
+            await self._warm(self._executor)
+            return True
+    
+    async def shutdown(self):
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+    
+    def _share(self, value: Any, blocks: List[SharedMemory]) -> Any:
+        if isinstance(value, pd.DataFrame) and len(value.dtypes.unique()) == 1:
+            values = value.to_numpy()
+            if values.nbytes >= self.shared_memory_min_bytes:
+                return SharedFrame(self._share_array(values, blocks), value.index, value.columns)
+        elif isinstance(value, np.ndarray) and value.dtype != object and value.nbytes >= self.shared_memory_min_bytes:
+            return self._share_array(value, blocks)
+        
+        return value
+    
+    def _share_array(self, array: np.ndarray, blocks: List[SharedMemory]) -> SharedArray:
+        shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        blocks.append(shm)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        return SharedArray(shm.name, array.shape, array.dtype.str)
+    
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        blocks: List[SharedMemory] = []
+        submitted = time.time()
+        
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        
+        try:
+            shared_args = tuple(self._share(arg, blocks) for arg in args)
+            shared_kwargs = {key: self._share(value, blocks) for key, value in kwargs.items()}
+            
+            result, started, finished = await loop.run_in_executor(
+                executor, _invoke, fn, shared_args, shared_kwargs
+            )
+        except BrokenProcessPool:
+            self._errors += 1
+            if await self._restart(executor):
+                print("Compute pool worker died, restarted the pool")
+            raise
+        except Exception:
+            self._errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+        
+        self._completed += 1
+        self._queue_waits.append(max(started - submitted, 0.0))
+        self._run_times.append(finished - started)
+        self._latencies.append(time.time() - submitted)
+        
+        return result
+    
+    def metrics(self) -> Dict[str, Any]:
+        def summarize(samples: deque) -> Dict[str, Optional[float]]:
+            if not samples:
+                return {"p50_ms": None, "p95_ms": None, "max_ms": None}
+            values = np.array(samples) * 1000
+            return {
+                "p50_ms": float(np.percentile(values, 50)),
+                "p95_ms": float(np.percentile(values, 95)),
+                "max_ms": float(values.max())
+            }
+        
+        return {
+            "started": self.started,
+            "workers": self.workers,
+            "queue_depth": max(self._in_flight - self.workers, 0),
+            "in_flight": self._in_flight,
+            "max_in_flight": self._max_in_flight,
+            "completed": self._completed,
+            "errors": self._errors,
+            "queue_wait": summarize(self._queue_waits),
+            "run_time": summarize(self._run_times),
+            "latency": summarize(self._latencies)
+        }
+
+compute_pool = ComputePool(
+    workers=settings.COMPUTE_POOL_WORKERS,
+    shared_memory_min_bytes=settings.COMPUTE_POOL_SHARED_MEMORY_MIN_BYTES,
+    start_method=settings.COMPUTE_POOL_START_METHOD
+)
@@ -0,0 +1,87 @@
+import asyncio
+import importlib.util
+from typing import Optional
+import httpx
+
+from backend.core.config import settings, get_app_config
+
+class ProviderClientManager:
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        timeout: float,
+        connect_timeout: float,
+        http2: bool = True
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+    
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._retire()
+            self._client = self._build_client()
+            self._loop = loop
+    
+    async def close(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+    
+    def _retire(self):
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        
+        if client is None or client.is_closed or loop is None or loop.is_closed():
+            return
+        
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        except RuntimeError as e:
+            print(f"Provider client could not be closed: {e}")
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._retire()
+            self._client = self._build_client()
+            self._loop = loop
+        
+        return self._client
+
+provider_clients = ProviderClientManager(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    timeout=settings.HTTP_TIMEOUT,
+    connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+    http2=settings.HTTP_ENABLE_HTTP2
+)
+
+def get_provider_client() -> httpx.AsyncClient:
+    return provider_clients.client
+
+def get_provider_timeout(provider: str) -> httpx.Timeout:
+    provider_config = get_app_config().get("data_providers", {}).get(provider, {})
+    
+    if "timeout" not in provider_config:
+        return provider_clients.timeout
+    
+    return httpx.Timeout(provider_config["timeout"], connect=settings.HTTP_CONNECT_TIMEOUT)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, JSON, Numeric, Date, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, ForeignKey, Boolean, JSON, Numeric, Date, Text, UniqueConstraint, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -130,9 +130,12 @@ class Order(Base):
 
 class PriceData(Base):
     __tablename__ = "price_data"
+    __table_args__ = (
+        UniqueConstraint("ticker", "date", name="uq_price_data_ticker_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    ticker = Column(String(20), nullable=False, index=True)
+    ticker = Column(String(20), nullable=False)
     date = Column(Date, nullable=False, index=True)
     open = Column(Numeric(20, 4))
     high = Column(Numeric(20, 4))
@@ -142,6 +145,70 @@ class PriceData(Base):
     adjusted_close = Column(Numeric(20, 4))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+class DailyReturn(Base):
+    __tablename__ = "daily_returns"
+    __table_args__ = (
+        UniqueConstraint("ticker", "date", name="uq_daily_returns_ticker_date"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    ticker = Column(String(20), nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
+    simple_return = Column(Float, nullable=False)
+    log_return = Column(Float, nullable=False)
+    volatility_20 = Column(Float)
+    momentum_20 = Column(Float)
+    rsi_14 = Column(Float)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class LatestPrice(Base):
+    __tablename__ = "latest_prices"
+    
+    ticker = Column(String(20), primary_key=True)
+    price = Column(Numeric(20, 4), nullable=False)
+    as_of = Column(DateTime(timezone=True), nullable=False)
+    source = Column(String(20), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class PriceWatermark(Base):
+    __tablename__ = "price_watermarks"
+    
+    ticker = Column(String(20), primary_key=True)
+    last_date = Column(Date, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class PriceQuarantine(Base):
+    __tablename__ = "price_quarantine"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String(32), nullable=False, index=True)
+    ticker = Column(String(20), nullable=False, index=True)
+    date = Column(Date, nullable=False)
+    open = Column(Numeric(20, 4))
+    high = Column(Numeric(20, 4))
+    low = Column(Numeric(20, 4))
+    close = Column(Numeric(20, 4))
+    volume = Column(BigInteger)
+    adjusted_close = Column(Numeric(20, 4))
+    reasons = Column(String(255), nullable=False)
+    source = Column(String(20))
+    resolved = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class DataQualityReport(Base):
+    __tablename__ = "data_quality_reports"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String(32), nullable=False, unique=True)
+    source = Column(String(20))
+    tickers = Column(Integer, nullable=False)
+    rows = Column(Integer, nullable=False)
+    clean = Column(Integer, nullable=False)
+    quarantined = Column(Integer, nullable=False)
+    checks = Column(JSON, nullable=False)
+    gaps = Column(JSON)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
 class RiskMetric(Base):
     __tablename__ = "risk_metrics"
     
@@ -164,6 +231,37 @@ class RiskMetric(Base):
     metadata = Column(JSON)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+class StressScenario(Base):
+    __tablename__ = "stress_scenarios"
+    __table_args__ = (
+        UniqueConstraint("owner_id", "name", name="uq_stress_scenarios_owner_name"),
+        Index(
+            "uq_stress_scenarios_builtin_name", "name", unique=True,
+            postgresql_where=text("owner_id IS NULL"), sqlite_where=text("owner_id IS NULL")
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    kind = Column(String(20), nullable=False)
+    description = Column(Text)
+    start_date = Column(Date)
+    end_date = Column(Date)
+    factor_shocks = Column(JSON)
+    shocks = Column(JSON)
+    default_shock = Column(Float, nullable=False, default=-0.20)
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class StressReplayShock(Base):
+    __tablename__ = "stress_replay_shocks"
+    
+    scenario_id = Column(Integer, ForeignKey("stress_scenarios.id", ondelete="CASCADE"), primary_key=True)
+    ticker = Column(String(20), primary_key=True)
+    shock = Column(Float, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
 class ComplianceRule(Base):
     __tablename__ = "compliance_rules"
     
@@ -0,0 +1,67 @@
+from datetime import date
+from typing import List
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+
+PRICE_PARTITION_PREFIX = "price_data_y"
+
+def price_partition_name(year: int) -> str:
+    return f"{PRICE_PARTITION_PREFIX}{year}"
+
+def price_partition_ddl(year: int) -> List[str]:
+    return [
+        f"CREATE TABLE IF NOT EXISTS {price_partition_name(year)} PARTITION OF price_data "
+        f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+    ]
+
+def price_brin_ddl(year: int) -> List[str]:
+    partition = price_partition_name(year)
+    return [f"CREATE INDEX IF NOT EXISTS ix_{partition}_date_brin ON {partition} USING brin (date)"]
+
+def is_cold_year(year: int) -> bool:
+    return year < date.today().year - settings.PRICE_PARTITION_HOT_YEARS + 1
+
+async def is_price_data_partitioned(db: AsyncSession) -> bool:
+    if db.bind.dialect.name != "postgresql":
+        return False
+    
+    result = await db.execute(text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('price_data')"
+    ))
+    return result.scalar() is not None
+
+async def ensure_price_partitions(db: AsyncSession, through_year: int) -> List[str]:
+    if not await is_price_data_partitioned(db):
+        return []
+    
+    result = await db.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass('price_data')"
+    ))
+    existing = {row[0] for row in result.all()}
+    
+    years = sorted(
+        int(name[len(PRICE_PARTITION_PREFIX):])
+        for name in existing
+        if name.startswith(PRICE_PARTITION_PREFIX) and name[len(PRICE_PARTITION_PREFIX):].isdigit()
+    )
+    first_year = years[0] if years else date.today().year
+    
+    created = []
+    for year in range(first_year, through_year + 1):
+        statements = []
+        if price_partition_name(year) not in existing:
+            statements.extend(price_partition_ddl(year))
+            created.append(price_partition_name(year))
+        if is_cold_year(year):
+            statements.extend(price_brin_ddl(year))
+        
+        for statement in statements:
+            await db.execute(text(statement))
+    
+    await db.commit()
+    
+    return created
@@ -9,14 +9,22 @@ import time
 from typing import Dict, Any
 
 from backend.core.config import settings
-from backend.core.database import engine, Base
+from backend.core.database import engine, Base, ensure_price_data_unique_index
+from backend.core.executors import compute_pool
+from backend.core.http_client import provider_clients
 from backend.api import auth, portfolios, positions, risk, analytics, optimization, orders, compliance, reports, ai_models
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(ensure_price_data_unique_index)
+    await provider_clients.start()
+    if settings.COMPUTE_POOL_ENABLED:
+        await compute_pool.start()
     yield
+    await compute_pool.shutdown()
+    await provider_clients.close()
     await engine.dispose()
 
 app = FastAPI(
@@ -68,6 +76,10 @@ async def health_check() -> Dict[str, Any]:
         "environment": settings.ENVIRONMENT
     }
 
+@app.get("/health/compute", tags=["System"])
+async def compute_pool_health() -> Dict[str, Any]:
+    return compute_pool.metrics()
+
 @app.get("/", tags=["System"])
 async def root() -> Dict[str, str]:
     return {
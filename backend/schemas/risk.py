@@ -18,6 +18,26 @@ class VaRResponse(BaseModel):
     cvar: Decimal
     var_percentage: float
     portfolio_value: Decimal
+    convergence: Optional[Dict[str, Any]] = None
+
+class VaRGridPoint(BaseModel):
+    method: str
+    confidence: float
+    horizon: int
+    var: Decimal
+    cvar: Decimal
+    var_percentage: float
+    cvar_percentage: float
+
+class VaRGridResponse(BaseModel):
+    portfolio_id: int
+    as_of: date
+    portfolio_value: Decimal
+    observations: int
+    confidence_levels: List[float]
+    horizons: List[int]
+    methods: List[str]
+    grid: List[VaRGridPoint]
 
 class StressTestRequest(BaseModel):
     scenario: str
@@ -31,6 +51,47 @@ class StressTestResponse(BaseModel):
     pnl_percentage: float
     position_impacts: List[Dict[str, Any]]
 
+class StressScenarioCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    kind: str = Field("custom", regex="^(historical|factor|custom)$")
+    description: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    factor_shocks: Optional[Dict[str, float]] = None
+    shocks: Optional[Dict[str, float]] = None
+    default_shock: Optional[float] = Field(None, ge=-1.0)
+
+class StressScenarioResponse(BaseModel):
+    id: int
+    name: str
+    kind: str
+    description: Optional[str]
+    start_date: Optional[date]
+    end_date: Optional[date]
+    factor_shocks: Optional[Dict[str, float]]
+    shocks: Optional[Dict[str, Optional[float]]]
+    default_shock: float
+    builtin: bool
+
+class StressScenarioRunRequest(BaseModel):
+    scenarios: Optional[List[str]] = None
+    include_positions: bool = False
+    top_positions: int = Field(5, ge=0, le=100)
+
+class StressScenarioResult(BaseModel):
+    scenario: str
+    kind: str
+    pnl: Decimal
+    pnl_percentage: float
+    portfolio_value_after: Decimal
+    worst_positions: List[Dict[str, Any]]
+
+class StressScenarioRunResponse(BaseModel):
+    portfolio_id: int
+    portfolio_value: Decimal
+    scenarios: List[StressScenarioResult]
+    position_pnl: Optional[List[Dict[str, Any]]] = None
+
 class GreeksResponse(BaseModel):
     portfolio_id: int
     delta: Optional[float]
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 import torch
 import torch.nn as nn
 from typing import Dict, Any, List, Optional
@@ -11,9 +10,16 @@ import joblib
 import os
 
 from backend.core.models import Portfolio, Position
-from backend.services.data_ingestion import get_prices_from_db
+from backend.services.daily_returns import get_return_features
 from backend.core.config import settings
 
+FEATURE_COLUMNS = {
+    'simple_return': 'returns',
+    'volatility_20': 'volatility',
+    'momentum_20': 'momentum',
+    'rsi_14': 'rsi'
+}
+
 class LSTMAlphaModel(nn.Module):
     def __init__(self, input_size: int, hidden_size: int = 64, num_layers: int = 2):
         super(LSTMAlphaModel, self).__init__()
@@ -58,24 +64,10 @@ async def predict_alpha_signals(
         model = None
         scaler = StandardScaler()
     
+    features_by_ticker = await get_return_features(tickers, start_date, end_date, db)
+    
     for ticker in tickers:
-        prices_df = await get_prices_from_db(ticker, start_date, end_date, db)
-        
-        if prices_df.empty or len(prices_df) < 60:
-            signals[ticker] = {
-                "ticker": ticker,
-                "direction": "neutral",
-                "confidence": 0.5,
-                "predicted_return": 0.0,
-                "horizon_days": horizon
-            }
-            continue
-        
-        prices_df['returns'] = prices_df['close'].pct_change()
-        prices_df['volatility'] = prices_df['returns'].rolling(20).std()
-        prices_df['momentum'] = prices_df['close'].pct_change(20)
-        prices_df['rsi'] = calculate_rsi(prices_df['close'])
-        prices_df = prices_df.dropna()
+        prices_df = features_by_ticker[ticker].rename(columns=FEATURE_COLUMNS).dropna()
         
         if len(prices_df) < 60:
             signals[ticker] = {
@@ -116,16 +108,6 @@ async def predict_alpha_signals(
     
     return signals
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
-
 async def detect_market_regime(
     lookback_days: int,
     db: AsyncSession
@@ -133,7 +115,7 @@ async def detect_market_regime(
     end_date = date.today()
     start_date = end_date - timedelta(days=lookback_days)
     
-    spy_prices = await get_prices_from_db("SPY", start_date, end_date, db)
+    spy_prices = (await get_return_features(["SPY"], start_date, end_date, db))["SPY"]
     
     if spy_prices.empty:
         return {
@@ -143,9 +125,7 @@ async def detect_market_regime(
             "transition_matrix": {}
         }
     
-    spy_prices['returns'] = spy_prices['close'].pct_change()
-    spy_prices['volatility'] = spy_prices['returns'].rolling(20).std()
-    spy_prices = spy_prices.dropna()
+    spy_prices = spy_prices.rename(columns=FEATURE_COLUMNS)[['returns', 'volatility']].dropna()
     
     recent_return = spy_prices['returns'].tail(20).mean() * 252
     recent_vol = spy_prices['volatility'].tail(20).mean() * np.sqrt(252)
@@ -298,17 +278,15 @@ async def retrain_alpha_model(db: AsyncSession) -> Dict[str, str]:
     all_features = []
     all_labels = []
     
+    features_by_ticker = await get_return_features(tickers, start_date, end_date, db)
+    
     for ticker in tickers:
-        prices_df = await get_prices_from_db(ticker, start_date, end_date, db)
+        prices_df = features_by_ticker[ticker].rename(columns=FEATURE_COLUMNS)
         
-        if prices_df.empty or len(prices_df) < 100:
+        if len(prices_df) < 100:
             continue
         
-        prices_df['returns'] = prices_df['close'].pct_change()
-        prices_df['volatility'] = prices_df['returns'].rolling(20).std()
-        prices_df['momentum'] = prices_df['close'].pct_change(20)
-        prices_df['rsi'] = calculate_rsi(prices_df['close'])
-        prices_df['future_return'] = prices_df['close'].pct_change(30).shift(-30)
+        prices_df['future_return'] = np.expm1(prices_df['log_return'].rolling(30).sum().shift(-30))
         prices_df = prices_df.dropna()
         
         if len(prices_df) < 90:
@@ -1,12 +1,12 @@
 import numpy as np
-import pandas as pd
 from typing import Dict, Any, List
 from datetime import date, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from backend.core.models import Portfolio, Position
-from backend.services.data_ingestion import get_prices_from_db
+from backend.services.daily_returns import get_returns_matrix
+from backend.utils.calculations import calculate_position_weights
 
 async def calculate_performance_attribution(
     portfolio_id: int,
@@ -52,13 +52,16 @@ async def brinson_fachler_attribution(
 ) -> Dict[str, Any]:
     portfolio_value = sum(float(p.market_value or 0) for p in positions)
     
+    benchmark_ticker = portfolio.benchmark or "SPY"
+    log_returns = await get_returns_matrix(
+        [p.ticker for p in positions] + [benchmark_ticker], start_date, end_date, db, field="log_return"
+    )
+    period_returns = np.expm1(log_returns.sum())
+    
     sector_data = {}
     for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            start_price = prices_df.iloc[0]['close']
-            end_price = prices_df.iloc[-1]['close']
-            security_return = (end_price - start_price) / start_price
+        if position.ticker in log_returns.columns and log_returns[position.ticker].notna().any():
+            security_return = period_returns[position.ticker]
             
             sector = "Technology"
             weight = float(position.market_value or 0) / portfolio_value
@@ -80,14 +83,9 @@ async def brinson_fachler_attribution(
                 "return": security_return
             })
     
-    benchmark_ticker = portfolio.benchmark or "SPY"
-    benchmark_df = await get_prices_from_db(benchmark_ticker, start_date, end_date, db)
-    
     benchmark_return = 0.0
-    if not benchmark_df.empty:
-        start_price = benchmark_df.iloc[0]['close']
-        end_price = benchmark_df.iloc[-1]['close']
-        benchmark_return = (end_price - start_price) / start_price
+    if benchmark_ticker in log_returns.columns and log_returns[benchmark_ticker].notna().any():
+        benchmark_return = period_returns[benchmark_ticker]
     
     total_return = sum(s["portfolio_return"] for s in sector_data.values())
     
@@ -125,7 +123,7 @@ async def brinson_fachler_attribution(
     active_return = total_return - benchmark_return
     
     return {
-        "portfolio_id": portfolio_id,
+        "portfolio_id": portfolio.id,
         "start_date": start_date,
         "end_date": end_date,
         "method": "brinson_fachler",
@@ -162,14 +160,9 @@ async def calculate_returns(
     
     portfolio_value = sum(float(p.market_value or 0) for p in positions)
     
-    returns_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            returns_data[position.ticker] = prices_df['returns'].dropna()
+    returns_df = await get_returns_matrix([p.ticker for p in positions], start_date, end_date, db)
     
-    if not returns_data:
+    if returns_df.empty:
         return {
             "portfolio_id": portfolio_id,
             "start_date": start_date,
@@ -182,10 +175,9 @@ async def calculate_returns(
             "mwrr": 0
         }
     
-    returns_df = pd.DataFrame(returns_data)
     returns_df = returns_df.dropna()
     
-    weights = np.array([float(p.market_value or 0) / portfolio_value for p in positions])
+    weights = calculate_position_weights(positions, list(returns_df.columns), portfolio_value)
     portfolio_returns = returns_df.dot(weights)
     
     if frequency == "daily":
@@ -240,14 +232,9 @@ async def calculate_drawdown(
     
     portfolio_value = sum(float(p.market_value or 0) for p in positions)
     
-    returns_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            returns_data[position.ticker] = prices_df['returns'].dropna()
+    returns_df = await get_returns_matrix([p.ticker for p in positions], start_date, end_date, db)
     
-    if not returns_data:
+    if returns_df.empty:
         return {
             "portfolio_id": portfolio_id,
             "start_date": start_date,
@@ -259,10 +246,9 @@ async def calculate_drawdown(
             "drawdown_series": []
         }
     
-    returns_df = pd.DataFrame(returns_data)
     returns_df = returns_df.dropna()
     
-    weights = np.array([float(p.market_value or 0) / portfolio_value for p in positions])
+    weights = calculate_position_weights(positions, list(returns_df.columns), portfolio_value)
     portfolio_returns = returns_df.dot(weights)
     
     cumulative_returns = (1 + portfolio_returns).cumprod()
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from scipy import sparse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_
+
+from backend.core.config import settings
+from backend.core.executors import compute_pool
+from backend.core.models import Portfolio, Position, RiskMetric
+from backend.services.daily_returns import get_returns_matrix
+from backend.services.stress_testing import get_stress_scenarios, prepare_shock_matrix
+from backend.utils.calculations import calculate_firm_risk
+
+@dataclass
+class FirmBook:
+    portfolio_ids: List[int]
+    tickers: List[str]
+    exposures: sparse.csr_matrix
+    
+    @property
+    def portfolio_values(self) -> np.ndarray:
+        return np.asarray(self.exposures.sum(axis=1)).ravel()
+
+async def load_firm_book(db: AsyncSession) -> FirmBook:
+    result = await db.execute(
+        select(Position.portfolio_id, Position.ticker, Position.market_value)
+        .join(Portfolio, Portfolio.id == Position.portfolio_id)
+        .where(Portfolio.is_active == True)
+    )
+    rows = pd.DataFrame(result.all(), columns=['portfolio_id', 'ticker', 'market_value'])
+    
+    portfolio_codes, portfolio_ids = pd.factorize(rows['portfolio_id'], sort=True)
+    ticker_codes, tickers = pd.factorize(rows['ticker'], sort=True)
+    values = rows['market_value'].astype(np.float64).fillna(0.0).to_numpy()
+    
+    exposures = sparse.csr_matrix(
+        (values, (portfolio_codes, ticker_codes)),
+        shape=(len(portfolio_ids), len(tickers))
+    )
+    
+    return FirmBook([int(i) for i in portfolio_ids], list(tickers), exposures)
+
+async def store_batch_risk_metrics(
+    book: FirmBook,
+    risk: Dict[str, np.ndarray],
+    confidence_levels: List[float],
+    calculation_date: date,
+    db: AsyncSession
+):
+    columns = {}
+    for confidence, suffix in [(0.95, "95"), (0.99, "99")]:
+        if confidence in confidence_levels:
+            i = confidence_levels.index(confidence)
+            columns[f"var_{suffix}"] = risk["var"][i]
+            columns[f"cvar_{suffix}"] = risk["cvar"][i]
+    
+    values = book.portfolio_values
+    volatility = np.divide(
+        risk["volatility"] * np.sqrt(252), values, out=np.zeros(len(values)), where=values > 0
+    )
+    
+    result = await db.execute(
+        select(RiskMetric).where(
+            and_(
+                RiskMetric.portfolio_id.in_(book.portfolio_ids),
+                RiskMetric.calculation_date == calculation_date
+            )
+        )
+    )
+    existing = {metric.portfolio_id: metric for metric in result.scalars().all()}
+    
+    for j, portfolio_id in enumerate(book.portfolio_ids):
+        metric = existing.get(portfolio_id)
+        if metric is None:
+            metric = RiskMetric(portfolio_id=portfolio_id, calculation_date=calculation_date)
+            db.add(metric)
+        
+        for name, column in columns.items():
+            setattr(metric, name, None if np.isnan(column[j]) else round(float(column[j]), 2))
+        metric.volatility = None if np.isnan(volatility[j]) else float(volatility[j])
+    
+    await db.commit()
+
+def _by_level(confidence_levels: List[float], values: np.ndarray) -> Dict[str, float]:
+    return {str(level): float(value) for level, value in zip(confidence_levels, values)}
+
+async def run_batch_risk(
+    db: AsyncSession,
+    as_of: Optional[date] = None,
+    lookback_days: int = 252,
+    confidence_levels: Optional[List[float]] = None,
+    persist: bool = True,
+    top_contributors: int = 10
+) -> Dict[str, Any]:
+    as_of = as_of or date.today()
+    confidence_levels = list(confidence_levels or settings.VAR_CONFIDENCE_LEVELS)
+    
+    book = await load_firm_book(db)
+    summary = {
+        "as_of": as_of.isoformat(),
+        "portfolios": len(book.portfolio_ids),
+        "tickers": len(book.tickers),
+        "positions": int(book.exposures.nnz),
+        "observations": 0
+    }
+    
+    if not book.tickers:
+        return summary
+    
+    returns = await get_returns_matrix(book.tickers, as_of - timedelta(days=lookback_days), as_of, db)
+    returns = returns.reindex(columns=book.tickers, fill_value=0.0)
+    summary["observations"] = len(returns)
+    
+    if len(returns) < 2:
+        return {**summary, "status": "skipped", "message": f"Not enough return history for batch risk on {as_of}"}
+    
+    scenarios = await get_stress_scenarios(db, None)
+    shocks = await prepare_shock_matrix(scenarios, book.tickers, db, as_of)
+    
+    risk = await compute_pool.run(
+        calculate_firm_risk, returns.to_numpy(dtype=np.float64), shocks, book.exposures, confidence_levels
+    )
+    
+    if persist:
+        await store_batch_risk_metrics(book, risk, confidence_levels, as_of, db)
+    
+    portfolio_ids = np.array(book.portfolio_ids)
+    stress_pnl = risk["stress_pnl"]
+    component_var = risk["component_var"][-1]
+    largest = np.argsort(-component_var)[:top_contributors]
+    
+    summary["firm"] = {
+        "value": float(book.portfolio_values.sum()),
+        "volatility": float(risk["firm_volatility"] * np.sqrt(252)),
+        "var": _by_level(confidence_levels, risk["firm_var"]),
+        "cvar": _by_level(confidence_levels, risk["firm_cvar"]),
+        "standalone_var": _by_level(confidence_levels, risk["var"].sum(axis=1)),
+        "diversification": _by_level(confidence_levels, risk["diversification"]),
+        "largest_var_contributors": [
+            {"portfolio_id": int(portfolio_ids[j]), "component_var": float(component_var[j])}
+            for j in largest
+        ]
+    }
+    summary["stress"] = [
+        {
+            "scenario": scenario.name,
+            "pnl": float(stress_pnl[i].sum()),
+            "worst_portfolio_id": int(portfolio_ids[stress_pnl[i].argmin()]),
+            "worst_portfolio_pnl": float(stress_pnl[i].min())
+        }
+        for i, scenario in enumerate(scenarios)
+    ]
+    
+    return summary
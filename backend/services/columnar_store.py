@@ -0,0 +1,156 @@
+import fcntl
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+from datetime import date
+import numpy as np
+import pandas as pd
+
+from backend.core.config import settings
+from backend.services.price_cache import PriceSeries, PRICE_SERIES_COLUMNS
+
+class ColumnarPriceStore:
+    def __init__(self, root: str):
+        self.root = Path(root)
+    
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.root / quote(ticker, safe='')
+    
+    def _current_version(self, ticker_dir: Path) -> Optional[Path]:
+        try:
+            version = (ticker_dir / "CURRENT").read_text().strip()
+        except FileNotFoundError:
+            return None
+        
+        return ticker_dir / version
+    
+    def _load_columns(
+        self,
+        version_dir: Path,
+        mmap_mode: Optional[str],
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        if columns is None:
+            paths = version_dir.glob("*.npy")
+        else:
+            paths = [version_dir / f"{name}.npy" for name in ["date", *columns]]
+        
+        return {path.stem: np.load(path, mmap_mode=mmap_mode) for path in paths}
+    
+    def read(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        columns: List[str] = PRICE_SERIES_COLUMNS
+    ) -> PriceSeries:
+        ticker_dir = self._ticker_dir(ticker)
+        arrays = {}
+        
+        for _ in range(3):
+            version_dir = self._current_version(ticker_dir)
+            if version_dir is None:
+                break
+            
+            try:
+                arrays = self._load_columns(version_dir, mmap_mode='r', columns=columns)
+                break
+            except FileNotFoundError:
+                continue
+        
+        if "date" not in arrays:
+            return PriceSeries(
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                dates=np.array([], dtype='datetime64[D]'),
+                columns={column: np.array([], dtype=np.float64) for column in columns}
+            )
+        
+        dates = arrays.pop("date")
+        
+        series = PriceSeries(
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            dates=dates,
+            columns=arrays
+        )
+        
+        return series.slice(start_date, end_date)
+    
+    def read_many(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        columns: List[str] = PRICE_SERIES_COLUMNS
+    ) -> Dict[str, PriceSeries]:
+        return {ticker: self.read(ticker, start_date, end_date, columns) for ticker in tickers}
+    
+    def write(self, records: pd.DataFrame) -> int:
+        written = 0
+        
+        for ticker, group in records.groupby('ticker', sort=False):
+            written += self._write_ticker(ticker, group)
+        
+        return written
+    
+    def _write_ticker(self, ticker: str, records: pd.DataFrame) -> int:
+        ticker_dir = self._ticker_dir(ticker)
+        ticker_dir.mkdir(parents=True, exist_ok=True)
+        
+        with open(ticker_dir / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            
+            current_dir = self._current_version(ticker_dir)
+            new_dates = records['date'].to_numpy(dtype='datetime64[D]')
+            new_columns = {
+                column: records[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                for column in PRICE_SERIES_COLUMNS
+            }
+            
+            if current_dir is not None:
+                existing = self._load_columns(current_dir, mmap_mode=None)
+                existing_dates = existing.pop("date")
+                
+                keep_new = ~np.isin(new_dates, existing_dates)
+                if not keep_new.any():
+                    return 0
+                
+                dates = np.concatenate([existing_dates, new_dates[keep_new]])
+                columns = {
+                    column: np.concatenate([
+                        existing.get(column, np.full(len(existing_dates), np.nan)),
+                        new_columns[column][keep_new]
+                    ])
+                    for column in PRICE_SERIES_COLUMNS
+                }
+                written = int(keep_new.sum())
+            else:
+                dates = new_dates
+                columns = new_columns
+                written = len(new_dates)
+            
+            order = np.argsort(dates, kind='stable')
+            version = uuid.uuid4().hex
+            version_dir = ticker_dir / version
+            version_dir.mkdir()
+            
+            np.save(version_dir / "date.npy", dates[order])
+            for column, values in columns.items():
+                np.save(version_dir / f"{column}.npy", np.ascontiguousarray(values[order]))
+            
+            pointer = ticker_dir / f"CURRENT.{version}"
+            pointer.write_text(version)
+            os.replace(pointer, ticker_dir / "CURRENT")
+            
+            if current_dir is not None:
+                shutil.rmtree(current_dir, ignore_errors=True)
+        
+        return written
+
+columnar_store = ColumnarPriceStore(settings.PRICE_STORE_PATH)
@@ -226,7 +226,12 @@ async def run_pre_trade_compliance(
     ticker = order_details.get("ticker")
     quantity = order_details.get("quantity", 0)
     side = order_details.get("side", "buy")
-    price = order_details.get("price", 100)
+    price = order_details.get("price")
+    
+    if not price:
+        from backend.services.latest_prices import get_mark_prices
+        marks = await get_mark_prices([ticker], db)
+        price = marks.get(ticker) or 100
     
     simulated_positions = positions.copy()
     
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import date, timedelta
+from typing import List, Optional
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.core.executors import compute_pool
+from backend.services.covariance_store import (
+    COVARIANCE_ESTIMATORS,
+    CovarianceEstimate,
+    CovarianceModel,
+    EWMACovariance,
+    covariance_cache,
+    covariance_store,
+    estimate_covariance,
+    settled_returns
+)
+from backend.services.daily_returns import get_returns_matrix
+from backend.services.data_quality import last_completed_session
+
+def _settle_before(as_of: date) -> date:
+    return as_of - timedelta(days=settings.COVARIANCE_PENDING_DAYS)
+
+async def refresh_covariance_state(
+    tickers: List[str],
+    as_of: date,
+    db: AsyncSession,
+    universe: Optional[str] = None
+) -> Optional[EWMACovariance]:
+    universe = universe or settings.COVARIANCE_UNIVERSE
+    decay = settings.COVARIANCE_EWMA_DECAY
+    wanted = sorted(set(tickers))
+    as_of = min(as_of, last_completed_session())
+    
+    state = covariance_store.load(universe, as_of)
+    
+    if state is None or state.decay != decay or set(wanted) - set(state.tickers.tolist()):
+        history = await get_returns_matrix(wanted, as_of - timedelta(days=settings.COVARIANCE_WARMUP_DAYS), as_of, db)
+        history = settled_returns(history.reindex(columns=wanted), _settle_before(as_of))
+        
+        if history.empty:
+            return None
+        
+        state = await asyncio.to_thread(EWMACovariance.from_returns, history, decay)
+    else:
+        pending = await get_returns_matrix(state.tickers.tolist(), state.as_of + timedelta(days=1), as_of, db)
+        
+        if pending.empty:
+            return state
+        
+        previous = state.as_of
+        state = state.copy()
+        await asyncio.to_thread(state.update_frame, pending, _settle_before(as_of))
+        
+        if state.as_of == previous:
+            return state
+    
+    await asyncio.to_thread(covariance_store.save, universe, state)
+    return state
+
+async def _ewma_state_estimate(tickers: List[str], as_of: date, db: AsyncSession) -> Optional[CovarianceEstimate]:
+    if not settings.COVARIANCE_EWMA_ENABLED:
+        return None
+    
+    state = covariance_store.load(settings.COVARIANCE_UNIVERSE, as_of)
+    
+    if state is None:
+        return None
+    
+    state = state.select(tickers, settings.COVARIANCE_MIN_OBSERVATIONS)
+    
+    if state is None:
+        return None
+    
+    if state.as_of < as_of:
+        pending = await get_returns_matrix(tickers, state.as_of + timedelta(days=1), as_of, db)
+        if not pending.empty:
+            state.update_frame(pending, _settle_before(as_of))
+    
+    return CovarianceEstimate(state.tickers, state.mean, state.covariance, state.observations, "ewma")
+
+async def get_covariance(
+    tickers: List[str],
+    db: AsyncSession,
+    lookback_days: int = 252,
+    as_of: Optional[date] = None,
+    estimator: Optional[str] = None,
+    returns: Optional[pd.DataFrame] = None
+) -> Optional[CovarianceModel]:
+    tickers = list(tickers)
+    as_of = as_of or date.today()
+    estimator = estimator or settings.COVARIANCE_RISK_ESTIMATOR
+    
+    if settings.COVARIANCE_FACTOR_MIN_ASSETS and len(tickers) >= settings.COVARIANCE_FACTOR_MIN_ASSETS:
+        estimator = "pca"
+    
+    if estimator not in COVARIANCE_ESTIMATORS:
+        raise ValueError(f"Unsupported covariance estimator: {estimator}")
+    
+    if not tickers:
+        return None
+    
+    if returns is None:
+        returns = await get_returns_matrix(tickers, as_of - timedelta(days=lookback_days), as_of, db)
+        returns = returns.reindex(columns=tickers).dropna()
+    
+    window = covariance_cache.returns_window(returns)
+    cached = covariance_cache.get(tickers, lookback_days, as_of, estimator, window)
+    if cached is not None:
+        return cached
+    
+    estimate = await _ewma_state_estimate(tickers, as_of, db) if estimator == "ewma" else None
+    
+    if estimate is None:
+        if len(returns) < 2:
+            return None
+        
+        estimate = await compute_pool.run(
+            estimate_covariance, returns[tickers], estimator,
+            settings.COVARIANCE_EWMA_DECAY, settings.COVARIANCE_FACTOR_COUNT
+        )
+    
+    covariance_cache.put(tickers, lookback_days, as_of, estimator, estimate, window)
+    return estimate.select(tickers)
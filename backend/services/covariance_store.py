@@ -0,0 +1,466 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from backend.core.config import settings
+
+UPDATE_BLOCK_ROWS = 512
+COVARIANCE_ESTIMATORS = ["sample", "ledoit_wolf", "ewma", "pca"]
+SLICEABLE_ESTIMATORS = ["sample", "ewma"]
+SPECIFIC_VARIANCE_FLOOR = 0.01
+
+def settled_returns(returns: pd.DataFrame, settle_before: Optional[date], listed: Optional[np.ndarray] = None) -> pd.DataFrame:
+    if settle_before is None or returns.empty:
+        return returns
+    
+    seen = returns.notna().cummax().to_numpy()
+    if listed is not None:
+        seen = seen | listed
+    
+    incomplete = (seen & returns.isna().to_numpy()).any(axis=1)
+    held = incomplete & (pd.to_datetime(returns.index) >= pd.Timestamp(settle_before))
+    
+    return returns.iloc[:int(np.argmax(held))] if held.any() else returns
+
+@dataclass
+class EWMACovariance:
+    tickers: np.ndarray
+    as_of: date
+    decay: float
+    mean: np.ndarray
+    covariance: np.ndarray
+    counts: np.ndarray
+    observations: int
+    
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame, decay: float) -> "EWMACovariance":
+        values = returns.to_numpy(dtype=np.float64)
+        counts = (~np.isnan(values)).sum(axis=0)
+        values = np.nan_to_num(values)
+        
+        weights = decay ** np.arange(len(values) - 1, -1, -1, dtype=np.float64)
+        weights /= weights.sum()
+        
+        mean = weights @ values
+        centered = values - mean
+        covariance = (centered * weights[:, None]).T @ centered
+        
+        return cls(
+            np.array(returns.columns, dtype=str),
+            pd.Timestamp(returns.index[-1]).date(),
+            decay,
+            mean,
+            covariance,
+            counts.astype(np.int64),
+            len(values)
+        )
+    
+    def copy(self) -> "EWMACovariance":
+        return EWMACovariance(
+            self.tickers.copy(), self.as_of, self.decay, np.array(self.mean),
+            np.array(self.covariance), np.array(self.counts), self.observations
+        )
+    
+    def update(self, returns: np.ndarray, as_of: date):
+        observed = ~np.isnan(returns)
+        diff = np.where(observed, returns, 0.0) - self.mean
+        scaled = self.decay * (1 - self.decay) * diff
+        
+        self.mean += (1 - self.decay) * diff
+        self.covariance *= self.decay
+        for start in range(0, len(diff), UPDATE_BLOCK_ROWS):
+            stop = start + UPDATE_BLOCK_ROWS
+            self.covariance[start:stop] += scaled[start:stop, None] * diff[None, :]
+        
+        self.counts += observed
+        self.observations += 1
+        self.as_of = as_of
+    
+    def update_frame(self, returns: pd.DataFrame, settle_before: Optional[date] = None):
+        returns = returns.reindex(columns=self.tickers)
+        returns = settled_returns(returns[pd.to_datetime(returns.index) > pd.Timestamp(self.as_of)], settle_before, self.counts > 0)
+        values = returns.to_numpy(dtype=np.float64)
+        
+        for day, row in zip(returns.index, values):
+            if pd.Timestamp(day).date() > self.as_of:
+                self.update(row, pd.Timestamp(day).date())
+    
+    def select(self, tickers: List[str], min_observations: int = 0) -> Optional["EWMACovariance"]:
+        index = pd.Index(self.tickers).get_indexer(tickers)
+        
+        if (index < 0).any() or (self.counts[index] < min_observations).any():
+            return None
+        
+        return EWMACovariance(
+            np.array(tickers, dtype=str),
+            self.as_of,
+            self.decay,
+            np.array(self.mean[index]),
+            np.array(self.covariance[np.ix_(index, index)]),
+            np.array(self.counts[index]),
+            self.observations
+        )
+    
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.covariance, index=self.tickers, columns=self.tickers)
+
+class CovarianceStore:
+    def __init__(self, root: str, retain_versions: int):
+        self.root = Path(root)
+        self.retain_versions = retain_versions
+    
+    def versions(self, universe: str) -> List[date]:
+        universe_dir = self.root / universe
+        if not universe_dir.exists():
+            return []
+        
+        versions = []
+        for version_dir in universe_dir.iterdir():
+            try:
+                versions.append(date.fromisoformat(version_dir.name))
+            except ValueError:
+                continue
+        
+        return sorted(versions)
+    
+    def load(self, universe: str, as_of: Optional[date] = None) -> Optional[EWMACovariance]:
+        for version in reversed(self.versions(universe)):
+            if as_of is not None and version > as_of:
+                continue
+            
+            version_dir = self.root / universe / version.isoformat()
+            try:
+                meta = json.loads((version_dir / "meta.json").read_text())
+                return EWMACovariance(
+                    np.load(version_dir / "tickers.npy"),
+                    version,
+                    meta["decay"],
+                    np.load(version_dir / "mean.npy"),
+                    np.load(version_dir / "covariance.npy", mmap_mode='r'),
+                    np.load(version_dir / "counts.npy"),
+                    meta["observations"]
+                )
+            except FileNotFoundError:
+                continue
+        
+        return None
+    
+    def save(self, universe: str, state: EWMACovariance):
+        universe_dir = self.root / universe
+        universe_dir.mkdir(parents=True, exist_ok=True)
+        
+        staging = universe_dir / f".{state.as_of.isoformat()}.{uuid.uuid4().hex}"
+        staging.mkdir()
+        
+        np.save(staging / "tickers.npy", state.tickers)
+        np.save(staging / "mean.npy", state.mean)
+        np.save(staging / "covariance.npy", state.covariance)
+        np.save(staging / "counts.npy", state.counts)
+        (staging / "meta.json").write_text(json.dumps({"decay": state.decay, "observations": state.observations}))
+        
+        target = universe_dir / state.as_of.isoformat()
+        if target.exists():
+            retired = universe_dir / f".retired.{uuid.uuid4().hex}"
+            os.replace(target, retired)
+            os.replace(staging, target)
+            shutil.rmtree(retired, ignore_errors=True)
+        else:
+            os.replace(staging, target)
+        
+        if self.retain_versions > 0:
+            for version in self.versions(universe)[:-self.retain_versions]:
+                shutil.rmtree(universe_dir / version.isoformat(), ignore_errors=True)
+
+@dataclass
+class CovarianceEstimate:
+    tickers: np.ndarray
+    mean: np.ndarray
+    covariance: np.ndarray
+    observations: int
+    estimator: str
+    
+    @property
+    def nbytes(self) -> int:
+        return self.covariance.nbytes + self.mean.nbytes
+    
+    def select(self, tickers: List[str]) -> Optional["CovarianceEstimate"]:
+        index = pd.Index(self.tickers).get_indexer(tickers)
+        
+        if (index < 0).any():
+            return None
+        
+        return CovarianceEstimate(
+            np.array(tickers, dtype=str),
+            self.mean[index],
+            self.covariance[np.ix_(index, index)],
+            self.observations,
+            self.estimator
+        )
+    
+    def mean_series(self) -> pd.Series:
+        return pd.Series(self.mean, index=self.tickers)
+    
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.covariance, index=self.tickers, columns=self.tickers)
+
+@dataclass
+class FactorCovariance:
+    tickers: np.ndarray
+    mean: np.ndarray
+    loadings: np.ndarray
+    specific_variance: np.ndarray
+    observations: int
+    estimator: str = "pca"
+    
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame, factors: int) -> "FactorCovariance":
+        values = returns.to_numpy(dtype=np.float64)
+        observed = ~np.isnan(values)
+        mean = np.nanmean(values, axis=0)
+        centered = np.where(observed, values - mean, 0.0)
+        
+        days, assets = centered.shape
+        factors = max(min(factors, days - 1, assets), 1)
+        scale = np.sqrt(max(days - 1, 1))
+        
+        if days < assets:
+            eigenvalues, eigenvectors = np.linalg.eigh(centered @ centered.T)
+            top = eigenvectors[:, np.argsort(eigenvalues)[::-1][:factors]]
+            loadings = centered.T @ top / scale
+        else:
+            eigenvalues, eigenvectors = np.linalg.eigh(centered.T @ centered / scale ** 2)
+            order = np.argsort(eigenvalues)[::-1][:factors]
+            loadings = eigenvectors[:, order] * np.sqrt(np.clip(eigenvalues[order], 0, None))
+        
+        variance = np.einsum('ij,ij->j', centered, centered) / scale ** 2
+        specific = np.maximum(variance - np.einsum('ij,ij->i', loadings, loadings), SPECIFIC_VARIANCE_FLOOR * variance)
+        
+        return cls(
+            np.array(returns.columns, dtype=str),
+            mean,
+            loadings,
+            np.maximum(specific, 1e-12),
+            days
+        )
+    
+    @property
+    def nbytes(self) -> int:
+        return self.loadings.nbytes + self.specific_variance.nbytes + self.mean.nbytes
+    
+    @property
+    def factors(self) -> int:
+        return self.loadings.shape[1]
+    
+    def select(self, tickers: List[str]) -> Optional["FactorCovariance"]:
+        index = pd.Index(self.tickers).get_indexer(tickers)
+        
+        if (index < 0).any():
+            return None
+        
+        return FactorCovariance(
+            np.array(tickers, dtype=str),
+            self.mean[index],
+            self.loadings[index],
+            self.specific_variance[index],
+            self.observations,
+            self.estimator
+        )
+    
+    def scale(self, factor: float) -> "FactorCovariance":
+        return FactorCovariance(
+            self.tickers,
+            self.mean * factor,
+            self.loadings * np.sqrt(factor),
+            self.specific_variance * factor,
+            self.observations,
+            self.estimator
+        )
+    
+    def variance(self) -> np.ndarray:
+        return np.einsum('ij,ij->i', self.loadings, self.loadings) + self.specific_variance
+    
+    def dot(self, weights: np.ndarray) -> np.ndarray:
+        weights = np.asarray(weights, dtype=np.float64)
+        specific = self.specific_variance if weights.ndim == 1 else self.specific_variance[:, None]
+        return self.loadings @ (self.loadings.T @ weights) + specific * weights
+    
+    def columns(self, index: np.ndarray) -> np.ndarray:
+        columns = self.loadings @ self.loadings[index].T
+        columns[index, np.arange(len(index))] += self.specific_variance[index]
+        return columns
+    
+    def portfolio_variance(self, weights: np.ndarray) -> np.ndarray:
+        weights = np.asarray(weights, dtype=np.float64)
+        exposures = weights @ self.loadings
+        return np.einsum('...k,...k->...', exposures, exposures) + (weights * weights) @ self.specific_variance
+    
+    def portfolio_exposures(self, weights: np.ndarray) -> np.ndarray:
+        weights = np.asarray(weights, dtype=np.float64)
+        return np.concatenate([self.loadings.T @ weights, np.sqrt(self.specific_variance) * weights])
+    
+    def average_correlation(self) -> float:
+        assets = len(self.tickers)
+        if assets < 2:
+            return 0.0
+        
+        inverse_std = 1 / np.sqrt(self.variance())
+        total = self.portfolio_variance(inverse_std)
+        return float((total - assets) / (assets * (assets - 1)))
+    
+    def explained_variance(self) -> float:
+        variance = self.variance()
+        return float(1 - self.specific_variance.sum() / variance.sum())
+    
+    def mean_series(self) -> pd.Series:
+        return pd.Series(self.mean, index=self.tickers)
+    
+    def to_frame(self) -> pd.DataFrame:
+        covariance = self.loadings @ self.loadings.T
+        covariance[np.diag_indices_from(covariance)] += self.specific_variance
+        return pd.DataFrame(covariance, index=self.tickers, columns=self.tickers)
+
+CovarianceModel = Union[CovarianceEstimate, FactorCovariance]
+
+def portfolio_variance(covariance: Any, weights: np.ndarray) -> np.ndarray:
+    if isinstance(covariance, FactorCovariance):
+        return covariance.portfolio_variance(weights)
+    
+    weights = np.asarray(weights, dtype=np.float64)
+    return np.einsum('...i,ij,...j->...', weights, np.asarray(covariance, dtype=np.float64), weights)
+
+def estimate_covariance(
+    returns: pd.DataFrame,
+    estimator: str,
+    decay: float = 0.94,
+    factors: int = 20
+) -> CovarianceModel:
+    if estimator not in COVARIANCE_ESTIMATORS:
+        raise ValueError(f"Unsupported covariance estimator: {estimator}")
+    
+    if estimator == "pca":
+        return FactorCovariance.from_returns(returns, factors)
+    
+    tickers = np.array(returns.columns, dtype=str)
+    
+    if estimator == "ewma":
+        state = EWMACovariance.from_returns(returns, decay)
+        return CovarianceEstimate(tickers, state.mean, state.covariance, len(returns), estimator)
+    
+    values = returns.to_numpy(dtype=np.float64)
+    
+    if estimator == "ledoit_wolf":
+        from sklearn.covariance import ledoit_wolf
+        
+        complete = values[~np.isnan(values).any(axis=1)]
+        covariance = ledoit_wolf(complete)[0]
+    else:
+        covariance = returns.cov().to_numpy()
+    
+    return CovarianceEstimate(tickers, np.nanmean(values, axis=0), covariance, len(returns), estimator)
+
+class CovarianceCache:
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, CovarianceModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._subset_hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def ticker_key(tickers: List[str]) -> str:
+        canonical = sorted(set(tickers))
+        return hashlib.sha1("\x1f".join(canonical).encode()).hexdigest()
+    
+    @staticmethod
+    def returns_window(returns: pd.DataFrame) -> Optional[Tuple]:
+        if returns.empty:
+            return None
+        return (returns.index[0], returns.index[-1], len(returns))
+    
+    def _key(self, tickers: List[str], lookback_days: int, as_of: date, estimator: str, window: Optional[Tuple]) -> Tuple:
+        return (self.ticker_key(tickers), lookback_days, as_of, estimator, window)
+    
+    def get(
+        self,
+        tickers: List[str],
+        lookback_days: int,
+        as_of: date,
+        estimator: str,
+        window: Optional[Tuple] = None
+    ) -> Optional[CovarianceModel]:
+        key = self._key(tickers, lookback_days, as_of, estimator, window)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.select(tickers)
+            
+            if estimator not in SLICEABLE_ESTIMATORS:
+                self._misses += 1
+                return None
+            
+            for other_key, entry in reversed(self._entries.items()):
+                if other_key[1:] != key[1:] or len(entry.tickers) < len(tickers):
+                    continue
+                
+                subset = entry.select(tickers)
+                if subset is not None:
+                    self._entries.move_to_end(other_key)
+                    self._subset_hits += 1
+                    return subset
+            
+            self._misses += 1
+            return None
+    
+    def put(
+        self,
+        tickers: List[str],
+        lookback_days: int,
+        as_of: date,
+        estimator: str,
+        estimate: CovarianceModel,
+        window: Optional[Tuple] = None
+    ):
+        key = self._key(tickers, lookback_days, as_of, estimator, window)
+        
+        with self._lock:
+            self._entries[key] = estimate
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries
+                or sum(entry.nbytes for entry in self._entries.values()) > self.max_bytes
+            ):
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(entry.nbytes for entry in self._entries.values()),
+                "hits": self._hits,
+                "subset_hits": self._subset_hits,
+                "misses": self._misses
+            }
+
+covariance_store = CovarianceStore(settings.COVARIANCE_STORE_PATH, settings.COVARIANCE_RETAIN_VERSIONS)
+
+covariance_cache = CovarianceCache(settings.COVARIANCE_CACHE_SIZE, settings.COVARIANCE_CACHE_MAX_BYTES)
@@ -0,0 +1,123 @@
+from typing import Dict, List
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_
+
+from backend.core.config import settings
+from backend.core.database import dialect_insert
+from backend.core.models import PriceData, DailyReturn
+from backend.utils.calculations import calculate_return_features
+
+RETURN_FIELDS = ['simple_return', 'log_return', 'volatility_20', 'momentum_20', 'rsi_14']
+RETURN_LOOKBACK_DAYS = 60
+
+async def refresh_daily_returns(first_dates: Dict[str, date], db: AsyncSession) -> int:
+    if not first_dates:
+        return 0
+    
+    cutoff = min(first_dates.values()) - timedelta(days=RETURN_LOOKBACK_DAYS)
+    
+    result = await db.execute(
+        select(PriceData.ticker, PriceData.date, PriceData.close).where(
+            and_(PriceData.ticker.in_(list(first_dates)), PriceData.date >= cutoff)
+        )
+    )
+    prices = pd.DataFrame(result.all(), columns=['ticker', 'date', 'close'])
+    
+    if prices.empty:
+        return 0
+    
+    features = calculate_return_features(prices)
+    features = features[
+        (features['date'] >= features['ticker'].map(first_dates))
+        & features['simple_return'].notna()
+    ]
+    
+    if features.empty:
+        return 0
+    
+    insert = dialect_insert(db)
+    batch_size = settings.PRICE_INSERT_BATCH_SIZE
+    
+    for offset in range(0, len(features), batch_size):
+        batch = features.iloc[offset:offset + batch_size]
+        rows = batch.astype(object).where(batch.notna(), None).to_dict('records')
+        
+        stmt = insert(DailyReturn).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['ticker', 'date'],
+            set_={field: stmt.excluded[field] for field in RETURN_FIELDS}
+        )
+        await db.execute(stmt)
+    
+    return len(features)
+
+async def get_returns_matrix(
+    tickers: List[str],
+    start_date: date,
+    end_date: date,
+    db: AsyncSession,
+    field: str = "simple_return"
+) -> pd.DataFrame:
+    if field not in RETURN_FIELDS:
+        raise ValueError(f"Unsupported return field: {field}")
+    
+    unique_tickers = list(dict.fromkeys(tickers))
+    
+    if not unique_tickers:
+        return pd.DataFrame(dtype=np.float64)
+    
+    result = await db.execute(
+        select(DailyReturn.ticker, DailyReturn.date, getattr(DailyReturn, field)).where(
+            and_(
+                DailyReturn.ticker.in_(unique_tickers),
+                DailyReturn.date >= start_date,
+                DailyReturn.date <= end_date
+            )
+        )
+    )
+    rows = pd.DataFrame(result.all(), columns=['ticker', 'date', field])
+    
+    if rows.empty:
+        return pd.DataFrame(dtype=np.float64)
+    
+    rows['date'] = pd.to_datetime(rows['date'])
+    matrix = rows.pivot(index='date', columns='ticker', values=field).sort_index()
+    matrix = matrix[[ticker for ticker in unique_tickers if ticker in matrix.columns]]
+    matrix.columns.name = None
+    
+    return matrix.astype(np.float64)
+
+async def get_return_features(
+    tickers: List[str],
+    start_date: date,
+    end_date: date,
+    db: AsyncSession
+) -> Dict[str, pd.DataFrame]:
+    unique_tickers = list(dict.fromkeys(tickers))
+    
+    if not unique_tickers:
+        return {}
+    
+    result = await db.execute(
+        select(DailyReturn.ticker, DailyReturn.date, *[getattr(DailyReturn, field) for field in RETURN_FIELDS]).where(
+            and_(
+                DailyReturn.ticker.in_(unique_tickers),
+                DailyReturn.date >= start_date,
+                DailyReturn.date <= end_date
+            )
+        ).order_by(DailyReturn.ticker, DailyReturn.date)
+    )
+    rows = pd.DataFrame(result.all(), columns=['ticker', 'date'] + RETURN_FIELDS)
+    
+    features = {
+        ticker: group.drop(columns='ticker').reset_index(drop=True)
+        for ticker, group in rows.groupby('ticker', sort=False)
+    }
+    
+    return {
+        ticker: features.get(ticker, pd.DataFrame(columns=['date'] + RETURN_FIELDS))
+        for ticker in unique_tickers
+    }
@@ -1,33 +1,38 @@
 import asyncio
-from typing import Dict, Any, List, Optional
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, date
-from decimal import Decimal
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-import httpx
+from sqlalchemy import select, update, and_, case, cast, func, text, Float
 
 from backend.core.config import settings
-from backend.core.models import PriceData
+from backend.core.executors import get_provider_executor
+from backend.core.database import dialect_insert
+from backend.core.http_client import get_provider_client, get_provider_timeout
+from backend.core.models import PriceData, PriceWatermark, PriceQuarantine, DataQualityReport, Portfolio, Position
+from backend.services.price_cache import PriceSeries, PRICE_SERIES_COLUMNS, price_cache
+from backend.services.columnar_store import columnar_store
+from backend.services.intraday_store import intraday_store
+from backend.services.daily_returns import refresh_daily_returns
+from backend.services.data_quality import validate_price_records, last_completed_session
+from backend.services.latest_prices import record_bar_closes
+from backend.services.provider_cache import provider_cache
+from backend.services.quote_service import get_quotes
 
 async def get_current_price(ticker: str) -> float:
-    try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        current_price = info.get('currentPrice') or info.get('regularMarketPrice')
-        
-        if current_price:
-            return float(current_price)
-        
-        hist = stock.history(period="1d")
-        if not hist.empty:
-            return float(hist['Close'].iloc[-1])
-        
-        return 0.0
-    except Exception as e:
-        print(f"Error fetching price for {ticker}: {e}")
-        return 0.0
+    quotes = await get_quotes([ticker])
+    return quotes.get(ticker, 0.0)
+
+def resolve_provider(source: str) -> str:
+    if source == "polygon" and settings.POLYGON_API_KEY:
+        return "polygon"
+    elif source == "alpha_vantage" and settings.ALPHA_VANTAGE_API_KEY:
+        return "alpha_vantage"
+    else:
+        return "yfinance"
 
 async def fetch_historical_prices(
     ticker: str,
@@ -35,174 +40,738 @@ async def fetch_historical_prices(
     end_date: date,
     source: str = "yfinance"
 ) -> pd.DataFrame:
-    if source == "yfinance":
-        return await fetch_yfinance_data(ticker, start_date, end_date)
-    elif source == "polygon" and settings.POLYGON_API_KEY:
-        return await fetch_polygon_data(ticker, start_date, end_date)
-    elif source == "alpha_vantage" and settings.ALPHA_VANTAGE_API_KEY:
-        return await fetch_alpha_vantage_data(ticker, start_date, end_date)
+    provider = resolve_provider(source)
+    
+    try:
+        return await request_provider_data(ticker, start_date, end_date, provider)
+    except Exception as e:
+        print(f"Error fetching {provider} data for {ticker}: {e}")
+        return pd.DataFrame()
+
+async def request_provider_data(
+    ticker: str,
+    start_date: date,
+    end_date: date,
+    provider: str
+) -> pd.DataFrame:
+    if provider == "polygon":
+        return await request_polygon_data(ticker, start_date, end_date)
+    elif provider == "alpha_vantage":
+        return await request_alpha_vantage_data(ticker, start_date, end_date)
     else:
-        return await fetch_yfinance_data(ticker, start_date, end_date)
+        return await request_yfinance_data(ticker, start_date, end_date)
 
 async def fetch_yfinance_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(start=start_date, end=end_date)
-        
-        if hist.empty:
-            return pd.DataFrame()
-        
-        hist.reset_index(inplace=True)
-        hist['ticker'] = ticker
-        hist.columns = [col.lower() for col in hist.columns]
-        
-        return hist[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']]
+        return await request_yfinance_data(ticker, start_date, end_date)
     except Exception as e:
         print(f"Error fetching yfinance data for {ticker}: {e}")
         return pd.DataFrame()
 
+async def request_yfinance_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_provider_executor(), download_yfinance_data, ticker, start_date, end_date
+    )
+
+def download_yfinance_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+    stock = yf.Ticker(ticker)
+    hist = stock.history(start=start_date, end=end_date + timedelta(days=1), raise_errors=True)
+    
+    if hist.empty:
+        return pd.DataFrame()
+    
+    hist.reset_index(inplace=True)
+    hist['ticker'] = ticker
+    hist.columns = [col.lower() for col in hist.columns]
+    
+    return hist[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']]
+
+def download_yfinance_intraday(ticker: str, day: date) -> pd.DataFrame:
+    stock = yf.Ticker(ticker)
+    hist = stock.history(start=day, end=day + timedelta(days=1), interval="1m", raise_errors=True)
+    
+    if hist.empty:
+        return pd.DataFrame()
+    
+    hist.index = hist.index.tz_convert("UTC").tz_localize(None)
+    hist.index.name = "timestamp"
+    hist.reset_index(inplace=True)
+    hist['ticker'] = ticker
+    hist.columns = [col.lower() for col in hist.columns]
+    
+    return hist[['ticker', 'timestamp', 'open', 'high', 'low', 'close', 'volume']]
+
+async def fetch_intraday_bars(tickers: List[str], day: date) -> pd.DataFrame:
+    loop = asyncio.get_running_loop()
+    executor = get_provider_executor()
+    
+    results = await asyncio.gather(
+        *[loop.run_in_executor(executor, download_yfinance_intraday, ticker, day) for ticker in tickers],
+        return_exceptions=True
+    )
+    
+    frames = []
+    for ticker, result in zip(tickers, results):
+        if isinstance(result, Exception):
+            print(f"Error fetching intraday bars for {ticker}: {result}")
+        elif not result.empty:
+            frames.append(result)
+    
+    if not frames:
+        return pd.DataFrame()
+    
+    return pd.concat(frames, ignore_index=True)
+
+async def ingest_intraday_bars(tickers: List[str], day: date) -> int:
+    bars = await fetch_intraday_bars(tickers, day)
+    
+    return await asyncio.to_thread(intraday_store.write, bars)
+
+async def rollup_intraday_to_daily(tickers: List[str], day: date, db: AsyncSession) -> Dict[str, int]:
+    daily = await asyncio.to_thread(intraday_store.daily_bars, tickers, day)
+    
+    return await store_price_data(daily, db, source="intraday")
+
 async def fetch_polygon_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
     try:
-        url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/day/{start_date}/{end_date}"
-        params = {"apiKey": settings.POLYGON_API_KEY, "adjusted": "true"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        if not data.get('results'):
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(data['results'])
-        df['date'] = pd.to_datetime(df['t'], unit='ms')
-        df['ticker'] = ticker
-        
-        df.rename(columns={
-            'o': 'open',
-            'h': 'high',
-            'l': 'low',
-            'c': 'close',
-            'v': 'volume'
-        }, inplace=True)
-        
-        return df[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']]
+        return await request_polygon_data(ticker, start_date, end_date)
     except Exception as e:
         print(f"Error fetching Polygon data for {ticker}: {e}")
         return pd.DataFrame()
 
+async def request_polygon_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+    url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/day/{start_date}/{end_date}"
+    params = {"apiKey": settings.POLYGON_API_KEY, "adjusted": "true"}
+    
+    response = await get_provider_client().get(
+        url, params=params, timeout=get_provider_timeout("polygon")
+    )
+    response.raise_for_status()
+    data = response.json()
+    
+    if not data.get('results'):
+        return pd.DataFrame()
+    
+    df = pd.DataFrame(data['results'])
+    df['date'] = pd.to_datetime(df['t'], unit='ms')
+    df['ticker'] = ticker
+    
+    df.rename(columns={
+        'o': 'open',
+        'h': 'high',
+        'l': 'low',
+        'c': 'close',
+        'v': 'volume'
+    }, inplace=True)
+    
+    return df[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']]
+
 async def fetch_alpha_vantage_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
     try:
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "TIME_SERIES_DAILY_ADJUSTED",
-            "symbol": ticker,
-            "apikey": settings.ALPHA_VANTAGE_API_KEY,
-            "outputsize": "full"
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        time_series = data.get('Time Series (Daily)', {})
-        
-        if not time_series:
-            return pd.DataFrame()
-        
-        df = pd.DataFrame.from_dict(time_series, orient='index')
-        df.index = pd.to_datetime(df.index)
-        df = df.sort_index()
-        
-        df = df.loc[start_date:end_date]
-        
-        df.reset_index(inplace=True)
-        df.columns = ['date', 'open', 'high', 'low', 'close', 'adjusted_close', 'volume', 'dividend', 'split']
-        df['ticker'] = ticker
-        
-        for col in ['open', 'high', 'low', 'close', 'adjusted_close', 'volume']:
-            df[col] = pd.to_numeric(df[col])
-        
-        return df[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume', 'adjusted_close']]
+        return await request_alpha_vantage_data(ticker, start_date, end_date)
     except Exception as e:
         print(f"Error fetching Alpha Vantage data for {ticker}: {e}")
         return pd.DataFrame()
 
-async def store_price_data(df: pd.DataFrame, db: AsyncSession):
+ALPHA_VANTAGE_FUNCTION = "TIME_SERIES_DAILY_ADJUSTED"
+ALPHA_VANTAGE_FIELDS = ['open', 'high', 'low', 'close', 'adjusted_close', 'volume', 'dividend', 'split']
+ALPHA_VANTAGE_COMPACT_POINTS = 100
+
+def parse_alpha_vantage_series(ticker: str, time_series: Dict[str, Dict[str, str]]) -> PriceSeries:
+    dates = np.array(list(time_series.keys()), dtype='datetime64[D]')
+    values = np.array([list(bar.values()) for bar in time_series.values()], dtype=np.float64)
+    order = np.argsort(dates, kind='stable')
+    
+    return PriceSeries(
+        ticker=ticker,
+        start_date=dates[order][0].astype(object),
+        end_date=dates[order][-1].astype(object),
+        dates=dates[order],
+        columns={field: values[order, i] for i, field in enumerate(ALPHA_VANTAGE_FIELDS)}
+    )
+
+async def download_alpha_vantage_series(ticker: str, outputsize: str) -> Optional[PriceSeries]:
+    url = "https://www.alphavantage.co/query"
+    params = {
+        "function": ALPHA_VANTAGE_FUNCTION,
+        "symbol": ticker,
+        "apikey": settings.ALPHA_VANTAGE_API_KEY,
+        "outputsize": outputsize
+    }
+    
+    response = await get_provider_client().get(
+        url, params=params, timeout=get_provider_timeout("alpha_vantage")
+    )
+    response.raise_for_status()
+    data = response.json()
+    
+    time_series = data.get('Time Series (Daily)', {})
+    
+    if not time_series:
+        return None
+    
+    return parse_alpha_vantage_series(ticker, time_series)
+
+def _has_corporate_action(series: PriceSeries, after: date) -> bool:
+    new_bars = series.dates > np.datetime64(after, 'D')
+    
+    return bool(
+        np.any(series.columns['dividend'][new_bars] != 0)
+        or np.any(series.columns['split'][new_bars] != 1)
+    )
+
+async def load_alpha_vantage_series(ticker: str, end_date: date) -> Optional[PriceSeries]:
+    if not settings.PROVIDER_CACHE_ENABLED:
+        return await download_alpha_vantage_series(ticker, "full")
+    
+    cached = await asyncio.to_thread(provider_cache.load, "alpha_vantage", ticker, ALPHA_VANTAGE_FUNCTION)
+    
+    if cached is not None:
+        series, fetched_at = cached
+        
+        if provider_cache.is_fresh(fetched_at) or series.end_date >= end_date:
+            return series
+        
+        if np.busday_count(series.end_date, date.today()) < ALPHA_VANTAGE_COMPACT_POINTS:
+            delta = await download_alpha_vantage_series(ticker, "compact")
+            
+            if delta is None:
+                return series
+            
+            if not _has_corporate_action(delta, series.end_date):
+                merged = provider_cache.merge(series, delta)
+                await asyncio.to_thread(provider_cache.store, "alpha_vantage", ticker, ALPHA_VANTAGE_FUNCTION, merged)
+                return merged
+    
+    series = await download_alpha_vantage_series(ticker, "full")
+    
+    if series is not None:
+        await asyncio.to_thread(provider_cache.store, "alpha_vantage", ticker, ALPHA_VANTAGE_FUNCTION, series)
+    
+    return series
+
+async def request_alpha_vantage_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+    series = await load_alpha_vantage_series(ticker, end_date)
+    
+    if series is None:
+        return pd.DataFrame()
+    
+    df = series.slice(start_date, end_date).to_frame()
+    
     if df.empty:
-        return
+        return df
+    
+    return df[['date', 'ticker', 'open', 'high', 'low', 'close', 'volume', 'adjusted_close']]
+
+PRICE_COLUMNS = ['ticker', 'date', 'open', 'high', 'low', 'close', 'volume', 'adjusted_close']
+
+def build_price_records(df: pd.DataFrame) -> pd.DataFrame:
+    close = pd.to_numeric(df['close'], errors='coerce')
+    
+    records = pd.DataFrame({
+        'ticker': df['ticker'].astype(str),
+        'date': pd.to_datetime(df['date']).dt.date,
+        'open': pd.to_numeric(df['open'], errors='coerce').round(4),
+        'high': pd.to_numeric(df['high'], errors='coerce').round(4),
+        'low': pd.to_numeric(df['low'], errors='coerce').round(4),
+        'close': close.round(4),
+        'volume': pd.to_numeric(df['volume'], errors='coerce').round().astype('Int64'),
+        'adjusted_close': (
+            pd.to_numeric(df['adjusted_close'], errors='coerce').fillna(close).round(4)
+            if 'adjusted_close' in df.columns else close.round(4)
+        )
+    })
+    
+    records = records.dropna(subset=['ticker', 'date', 'close'])
+    
+    return records.drop_duplicates(subset=['ticker', 'date'], keep='last')
+
+def _records_to_rows(records: pd.DataFrame) -> List[Dict[str, Any]]:
+    return records.astype(object).where(records.notna(), None).to_dict('records')
+
+async def _insert_price_batches(records: pd.DataFrame, db: AsyncSession) -> int:
+    insert = dialect_insert(db)
+    inserted = 0
+    batch_size = settings.PRICE_INSERT_BATCH_SIZE
+    
+    for offset in range(0, len(records), batch_size):
+        rows = _records_to_rows(records.iloc[offset:offset + batch_size])
+        stmt = insert(PriceData).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['ticker', 'date'],
+            set_={"adjusted_close": stmt.excluded.adjusted_close},
+            where=and_(
+                stmt.excluded.adjusted_close.isnot(None),
+                PriceData.adjusted_close.is_distinct_from(stmt.excluded.adjusted_close)
+            )
+        )
+        result = await db.execute(stmt)
+        inserted += max(result.rowcount, 0)
+    
+    return inserted
+
+async def _copy_price_records(records: pd.DataFrame, db: AsyncSession) -> int:
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
     
-    for _, row in df.iterrows():
-        existing = await db.execute(
-            select(PriceData).where(
+    await db.execute(text(
+        "CREATE TEMP TABLE IF NOT EXISTS price_data_staging ON COMMIT DROP AS "
+        f"SELECT {', '.join(PRICE_COLUMNS)} FROM price_data WITH NO DATA"
+    ))
+    
+    rows = [tuple(row.values()) for row in _records_to_rows(records)]
+    await raw_connection.driver_connection.copy_records_to_table(
+        "price_data_staging",
+        records=rows,
+        columns=PRICE_COLUMNS
+    )
+    
+    result = await db.execute(text(
+        f"INSERT INTO price_data ({', '.join(PRICE_COLUMNS)}) "
+        f"SELECT {', '.join(PRICE_COLUMNS)} FROM price_data_staging "
+        "ON CONFLICT (ticker, date) DO UPDATE SET adjusted_close = EXCLUDED.adjusted_close "
+        "WHERE EXCLUDED.adjusted_close IS NOT NULL "
+        "AND price_data.adjusted_close IS DISTINCT FROM EXCLUDED.adjusted_close"
+    ))
+    
+    return max(result.rowcount, 0)
+
+async def _advance_watermarks(records: pd.DataFrame, db: AsyncSession):
+    last_dates = records.groupby('ticker')['date'].max()
+    
+    stmt = dialect_insert(db)(PriceWatermark).values([
+        {"ticker": ticker, "last_date": last_date}
+        for ticker, last_date in last_dates.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['ticker'],
+        set_={
+            "last_date": case(
+                (stmt.excluded.last_date > PriceWatermark.last_date, stmt.excluded.last_date),
+                else_=PriceWatermark.last_date
+            ),
+            "updated_at": func.now()
+        }
+    )
+    
+    await db.execute(stmt)
+
+async def _load_quality_history(records: pd.DataFrame, db: AsyncSession) -> pd.DataFrame:
+    first_dates = records.groupby('ticker')['date'].min()
+    cutoff = first_dates.min() - timedelta(days=settings.DATA_QUALITY_LOOKBACK_DAYS)
+    
+    result = await db.execute(
+        select(
+            PriceData.ticker,
+            PriceData.date,
+            cast(func.coalesce(PriceData.adjusted_close, PriceData.close), Float)
+        ).where(
+            and_(
+                PriceData.ticker.in_(first_dates.index.tolist()),
+                PriceData.date >= cutoff,
+                PriceData.date < first_dates.max()
+            )
+        )
+    )
+    history = pd.DataFrame(result.all(), columns=['ticker', 'date', 'adjusted_close'])
+    
+    return history[history['date'] < history['ticker'].map(first_dates)]
+
+async def _load_market_closes(records: pd.DataFrame, db: AsyncSession) -> pd.Series:
+    market_ticker = settings.DATA_QUALITY_MARKET_TICKER
+    cutoff = records['date'].min() - timedelta(days=settings.DATA_QUALITY_LOOKBACK_DAYS)
+    
+    result = await db.execute(
+        select(
+            PriceData.date,
+            cast(func.coalesce(PriceData.adjusted_close, PriceData.close), Float)
+        ).where(
+            and_(
+                PriceData.ticker == market_ticker,
+                PriceData.date >= cutoff,
+                PriceData.date <= records['date'].max()
+            )
+        )
+    )
+    closes = pd.Series(dict(result.all()), dtype=np.float64)
+    batch = records[records['ticker'] == market_ticker]
+    
+    return pd.Series(batch['adjusted_close'].to_numpy(dtype=np.float64), index=batch['date']).combine_first(closes)
+
+async def _load_pending_splits(records: pd.DataFrame, db: AsyncSession) -> Dict[str, date]:
+    result = await db.execute(
+        select(PriceQuarantine.ticker, func.min(PriceQuarantine.date)).where(
+            and_(
+                PriceQuarantine.ticker.in_(records['ticker'].unique().tolist()),
+                PriceQuarantine.resolved == False,
+                PriceQuarantine.reasons.contains("split_suspect")
+            )
+        ).group_by(PriceQuarantine.ticker)
+    )
+    
+    return {ticker: split_date for ticker, split_date in result.all()}
+
+async def _quarantine_price_records(
+    records: pd.DataFrame,
+    db: AsyncSession,
+    source: Optional[str]
+) -> Tuple[pd.DataFrame, int]:
+    history = await _load_quality_history(records, db)
+    pending_splits = await _load_pending_splits(records, db)
+    market = await _load_market_closes(records, db)
+    clean, quarantined, report = validate_price_records(records, history, pending_splits, market)
+    run_id = uuid.uuid4().hex
+    
+    if report["splits_cleared"]:
+        await db.execute(
+            update(PriceQuarantine).where(
                 and_(
-                    PriceData.ticker == row['ticker'],
-                    PriceData.date == row['date'].date()
+                    PriceQuarantine.ticker.in_(report["splits_cleared"]),
+                    PriceQuarantine.resolved == False,
+                    PriceQuarantine.reasons.contains("split_")
                 )
-            )
+            ).values(resolved=True)
         )
+    
+    db.add(DataQualityReport(
+        run_id=run_id,
+        source=source,
+        tickers=report["tickers"],
+        rows=report["rows"],
+        clean=report["clean"],
+        quarantined=report["quarantined"],
+        checks={**report["checks"], "market_move": report["market_moves"]},
+        gaps=report["gaps"]
+    ))
+    
+    if not quarantined.empty:
+        rows = _records_to_rows(quarantined[PRICE_COLUMNS + ['reasons']])
+        batch_size = settings.PRICE_INSERT_BATCH_SIZE
         
-        if existing.scalar_one_or_none():
-            continue
+        for offset in range(0, len(rows), batch_size):
+            await db.execute(
+                dialect_insert(db)(PriceQuarantine).values([
+                    {**row, "run_id": run_id, "source": source}
+                    for row in rows[offset:offset + batch_size]
+                ])
+            )
         
-        price_record = PriceData(
-            ticker=row['ticker'],
-            date=row['date'].date(),
-            open=Decimal(str(row['open'])),
-            high=Decimal(str(row['high'])),
-            low=Decimal(str(row['low'])),
-            close=Decimal(str(row['close'])),
-            volume=int(row['volume']) if pd.notna(row['volume']) else None,
-            adjusted_close=Decimal(str(row.get('adjusted_close', row['close'])))
-        )
+        flagged = ", ".join(f"{check}={count}" for check, count in report["checks"].items() if count)
+        print(f"Quarantined {report['quarantined']} of {report['rows']} price rows from {source} ({flagged}), run {run_id}")
+    
+    return clean, report["quarantined"]
+
+async def store_price_data(df: pd.DataFrame, db: AsyncSession, source: Optional[str] = None) -> Dict[str, int]:
+    if df.empty:
+        return {"inserted": 0, "skipped": 0, "quarantined": 0}
+    
+    records = build_price_records(df)
+    
+    if records.empty:
+        return {"inserted": 0, "skipped": len(df), "quarantined": 0}
+    
+    quarantined = 0
+    if settings.DATA_QUALITY_ENABLED:
+        records, quarantined = await _quarantine_price_records(records, db, source)
         
-        db.add(price_record)
+        if records.empty:
+            await db.commit()
+            return {"inserted": 0, "skipped": len(df) - quarantined, "quarantined": quarantined}
+    
+    if db.bind.dialect.name == "postgresql" and len(records) >= settings.PRICE_COPY_MIN_ROWS:
+        inserted = await _copy_price_records(records, db)
+    else:
+        inserted = await _insert_price_batches(records, db)
+    
+    if inserted:
+        await refresh_daily_returns(records.groupby('ticker')['date'].min().to_dict(), db)
+        await record_bar_closes(records, db)
     
+    await _advance_watermarks(records, db)
     await db.commit()
+    
+    if settings.PRICE_STORE_BACKEND == "columnar":
+        await asyncio.to_thread(columnar_store.write, records)
+    
+    if inserted and settings.PRICE_CACHE_ENABLED:
+        await price_cache.invalidate(records['ticker'].unique().tolist())
+    
+    return {"inserted": inserted, "skipped": len(df) - inserted - quarantined, "quarantined": quarantined}
 
 async def bulk_ingest_prices(
     tickers: List[str],
     start_date: date,
     end_date: date,
-    db: AsyncSession
-):
-    for ticker in tickers:
-        df = await fetch_historical_prices(ticker, start_date, end_date)
+    db: AsyncSession,
+    source: str = "yfinance"
+) -> Dict[str, int]:
+    from backend.services.ingestion_scheduler import IngestionScheduler
+    
+    scheduler = IngestionScheduler()
+    totals = {"inserted": 0, "skipped": 0, "quarantined": 0}
+    
+    async for ticker, df in scheduler.fetch_many(tickers, start_date, end_date, source):
         if not df.empty:
-            await store_price_data(df, db)
-        await asyncio.sleep(0.2)
+            stored = await store_price_data(df, db, source=source)
+            totals["inserted"] += stored["inserted"]
+            totals["skipped"] += stored["skipped"]
+            totals["quarantined"] += stored["quarantined"]
+    
+    return totals
+
+async def get_ingestion_universe(db: AsyncSession) -> List[str]:
+    result = await db.execute(select(Position.ticker).distinct())
+    tickers = [row[0] for row in result.all()]
+    
+    result = await db.execute(
+        select(Portfolio.benchmark).where(
+            and_(Portfolio.is_active == True, Portfolio.benchmark.isnot(None))
+        ).distinct()
+    )
+    tickers.extend(row[0] for row in result.all())
+    
+    return sorted(set(tickers))
+
+async def get_price_watermarks(tickers: List[str], db: AsyncSession) -> Dict[str, date]:
+    if not tickers:
+        return {}
+    
+    result = await db.execute(
+        select(PriceWatermark.ticker, PriceWatermark.last_date).where(PriceWatermark.ticker.in_(tickers))
+    )
+    watermarks = {ticker: last_date for ticker, last_date in result.all()}
+    
+    untracked = [ticker for ticker in tickers if ticker not in watermarks]
+    
+    if untracked:
+        result = await db.execute(
+            select(PriceData.ticker, func.max(PriceData.date)).where(
+                PriceData.ticker.in_(untracked)
+            ).group_by(PriceData.ticker)
+        )
+        watermarks.update({ticker: last_date for ticker, last_date in result.all()})
+    
+    return watermarks
+
+def plan_ingest_ranges(
+    tickers: List[str],
+    watermarks: Dict[str, date],
+    end_date: date,
+    default_start: date
+) -> Dict[str, Tuple[date, date]]:
+    ranges = {}
+    for ticker in dict.fromkeys(tickers):
+        watermark = watermarks.get(ticker)
+        start_date = watermark + timedelta(days=1) if watermark else default_start
+        
+        if start_date <= end_date and np.busday_count(start_date, end_date + timedelta(days=1)) > 0:
+            ranges[ticker] = (start_date, end_date)
+    
+    return ranges
+
+async def incremental_ingest_prices(
+    db: AsyncSession,
+    tickers: Optional[List[str]] = None,
+    end_date: Optional[date] = None,
+    initial_lookback_days: int = 756,
+    source: str = "yfinance"
+) -> Dict[str, int]:
+    from backend.services.ingestion_scheduler import IngestionScheduler
+    
+    if tickers is None:
+        tickers = await get_ingestion_universe(db)
+    
+    end_date = min(end_date or date.today(), last_completed_session())
+    default_start = end_date - timedelta(days=initial_lookback_days)
+    watermarks = await get_price_watermarks(tickers, db)
+    ranges = plan_ingest_ranges(tickers, watermarks, end_date, default_start)
+    
+    totals = {
+        "tickers": len(tickers),
+        "up_to_date": len(tickers) - len(ranges),
+        "inserted": 0,
+        "skipped": 0,
+        "quarantined": 0
+    }
+    
+    scheduler = IngestionScheduler()
+    market_ticker = settings.DATA_QUALITY_MARKET_TICKER
+    batches = [{market_ticker: ranges.pop(market_ticker)}] if market_ticker in ranges else []
+    batches.append(ranges)
+    
+    for batch in batches:
+        async for ticker, df in scheduler.fetch_ranges(batch, source):
+            if not df.empty:
+                stored = await store_price_data(df, db, source=source)
+                totals["inserted"] += stored["inserted"]
+                totals["skipped"] += stored["skipped"]
+                totals["quarantined"] += stored["quarantined"]
+    
+    return totals
+
+PRICE_FIELDS = {
+    "open": PriceData.open,
+    "high": PriceData.high,
+    "low": PriceData.low,
+    "close": PriceData.close,
+    "volume": PriceData.volume,
+    "adjusted_close": func.coalesce(PriceData.adjusted_close, PriceData.close),
+}
+
+def _validate_price_columns(columns: List[str]):
+    unknown = [column for column in columns if column not in PRICE_FIELDS]
+    
+    if unknown:
+        raise ValueError(f"Unsupported price fields: {', '.join(unknown)}")
+
+def _empty_price_series(ticker: str, start_date: date, end_date: date, columns: List[str]) -> PriceSeries:
+    return PriceSeries(
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        dates=np.array([], dtype='datetime64[D]'),
+        columns={column: np.array([], dtype=np.float64) for column in columns}
+    )
+
+async def query_price_series(
+    tickers: List[str],
+    start_date: date,
+    end_date: date,
+    db: AsyncSession,
+    columns: List[str] = PRICE_SERIES_COLUMNS
+) -> Dict[str, PriceSeries]:
+    _validate_price_columns(columns)
+    
+    series = {ticker: _empty_price_series(ticker, start_date, end_date, columns) for ticker in tickers}
+    
+    condition = and_(
+        PriceData.ticker.in_(tickers),
+        PriceData.date >= start_date,
+        PriceData.date <= end_date
+    )
+    capacity = await db.scalar(select(func.count()).select_from(PriceData).where(condition))
+    
+    if not capacity:
+        return series
+    
+    chunk_rows = settings.PRICE_READ_CHUNK_ROWS
+    result = await db.stream(
+        select(
+            PriceData.ticker,
+            PriceData.date,
+            *[cast(PRICE_FIELDS[column], Float).label(column) for column in columns]
+        ).where(condition).order_by(PriceData.ticker, PriceData.date).execution_options(yield_per=chunk_rows)
+    )
+    
+    row_tickers = np.empty(capacity, dtype=object)
+    dates = np.empty(capacity, dtype='datetime64[D]')
+    values = [np.empty(capacity, dtype=np.float64) for _ in columns]
+    filled = 0
+    
+    async for chunk in result.partitions(chunk_rows):
+        end = filled + len(chunk)
+        
+        if end > capacity:
+            capacity = max(end, capacity * 2)
+            row_tickers = np.resize(row_tickers, capacity)
+            dates = np.resize(dates, capacity)
+            values = [np.resize(array, capacity) for array in values]
+        
+        chunk_columns = list(zip(*chunk))
+        row_tickers[filled:end] = chunk_columns[0]
+        dates[filled:end] = chunk_columns[1]
+        for array, chunk_values in zip(values, chunk_columns[2:]):
+            array[filled:end] = np.array(chunk_values, dtype=np.float64)
+        
+        filled = end
+    
+    row_tickers = row_tickers[:filled]
+    boundaries = np.concatenate([[0], np.flatnonzero(row_tickers[1:] != row_tickers[:-1]) + 1, [filled]])
+    
+    for lo, hi in zip(boundaries[:-1], boundaries[1:]):
+        if lo == hi:
+            continue
+        
+        series[row_tickers[lo]] = PriceSeries(
+            ticker=row_tickers[lo],
+            start_date=start_date,
+            end_date=end_date,
+            dates=dates[lo:hi],
+            columns={column: array[lo:hi] for column, array in zip(columns, values)}
+        )
+    
+    return series
+
+async def load_price_series(
+    tickers: List[str],
+    start_date: date,
+    end_date: date,
+    db: AsyncSession,
+    columns: List[str] = PRICE_SERIES_COLUMNS
+) -> Dict[str, PriceSeries]:
+    _validate_price_columns(columns)
+    
+    tickers = list(dict.fromkeys(tickers))
+    series = {}
+    
+    if settings.PRICE_CACHE_ENABLED:
+        series = await price_cache.get_many(tickers, start_date, end_date, columns)
+    
+    missing = [ticker for ticker in tickers if ticker not in series]
+    
+    if missing:
+        if settings.PRICE_STORE_BACKEND == "columnar":
+            loaded = columnar_store.read_many(missing, start_date, end_date, columns)
+        else:
+            loaded = await query_price_series(missing, start_date, end_date, db, columns)
+        if settings.PRICE_CACHE_ENABLED:
+            await price_cache.set_many(loaded.values())
+        series.update(loaded)
+    
+    return series
 
 async def get_prices_from_db(
     ticker: str,
     start_date: date,
     end_date: date,
-    db: AsyncSession
+    db: AsyncSession,
+    columns: List[str] = PRICE_SERIES_COLUMNS
 ) -> pd.DataFrame:
-    result = await db.execute(
-        select(PriceData).where(
-            and_(
-                PriceData.ticker == ticker,
-                PriceData.date >= start_date,
-                PriceData.date <= end_date
-            )
-        ).order_by(PriceData.date)
-    )
+    series = await load_price_series([ticker], start_date, end_date, db, columns)
+    
+    return series[ticker].to_frame()
+
+async def get_price_matrix(
+    tickers: List[str],
+    start_date: date,
+    end_date: date,
+    db: AsyncSession,
+    field: str = "close"
+) -> pd.DataFrame:
+    if field not in PRICE_FIELDS:
+        raise ValueError(f"Unsupported price field: {field}")
     
-    prices = result.scalars().all()
+    unique_tickers = list(dict.fromkeys(tickers))
     
-    if not prices:
-        return pd.DataFrame()
+    if not unique_tickers:
+        return pd.DataFrame(dtype=np.float64)
+    
+    series = await load_price_series(unique_tickers, start_date, end_date, db, [field])
+    
+    columns = {
+        ticker: pd.Series(
+            series[ticker].columns[field],
+            index=pd.DatetimeIndex(series[ticker].dates.astype('datetime64[ns]'))
+        )
+        for ticker in unique_tickers
+        if len(series[ticker].dates) > 0
+    }
+    
+    if not columns:
+        return pd.DataFrame(dtype=np.float64)
+    
+    matrix = pd.DataFrame(columns).sort_index()
+    matrix.index.name = "date"
     
-    data = [{
-        'date': p.date,
-        'ticker': p.ticker,
-        'open': float(p.open),
-        'high': float(p.high),
-        'low': float(p.low),
-        'close': float(p.close),
-        'volume': p.volume,
-        'adjusted_close': float(p.adjusted_close) if p.adjusted_close else float(p.close)
-    } for p in prices]
-    
-    return pd.DataFrame(data)
+    return matrix.astype(np.float64)
@@ -0,0 +1,198 @@
+from functools import lru_cache
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar, Holiday, GoodFriday, USMartinLutherKingJr, USPresidentsDay,
+    USMemorialDay, USLaborDay, USThanksgivingDay, nearest_workday, sunday_to_monday
+)
+
+from backend.core.config import settings
+
+QUALITY_CHECKS = ['non_positive', 'ohlc_inconsistent', 'extreme_return', 'split_suspect', 'split_pending']
+
+MAD_SCALE = 1.4826
+MIN_RETURN_SCALE = 0.005
+MIN_RETURN_OBSERVATIONS = 20
+SPLIT_RATIOS = np.array([2, 3, 4, 5, 8, 10, 20, 1 / 2, 1 / 3, 1 / 4, 1 / 5, 1 / 8, 1 / 10, 1 / 20, 3 / 2, 2 / 3])
+SPLIT_TOLERANCE = 0.03
+MIN_MARKET_TICKERS = 5
+MARKET_MOVE_SHARE = 0.25
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    rules = [
+        Holiday("NewYearsDay", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("IndependenceDay", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+    ]
+
+@lru_cache(maxsize=1)
+def trading_calendar() -> np.busdaycalendar:
+    holidays = NYSEHolidayCalendar().holidays(start="1990-01-01", end="2050-12-31")
+    return np.busdaycalendar(holidays=holidays.values.astype('datetime64[D]'))
+
+def last_completed_session(now: Optional[datetime] = None) -> date:
+    local = (now or datetime.now(timezone.utc)).astimezone(ZoneInfo(settings.MARKET_TIMEZONE))
+    day = np.datetime64(local.date(), 'D')
+    
+    if local.hour < settings.MARKET_CLOSE_HOUR:
+        day -= np.timedelta64(1, 'D')
+    
+    return np.busday_offset(day, 0, roll='backward', busdaycal=trading_calendar()).astype(date)
+
+def count_missing_sessions(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    return np.busday_count(previous + np.timedelta64(1, 'D'), current, busdaycal=trading_calendar())
+
+def _flag_price_levels(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    open_, high, low, close, adjusted = (
+        frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        for column in ['open', 'high', 'low', 'close', 'adjusted_close']
+    )
+    volume = frame['volume'].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    with np.errstate(invalid='ignore'):
+        non_positive = (
+            (open_ <= 0) | (high <= 0) | (low <= 0) | (close <= 0) | (adjusted <= 0) | (volume < 0)
+        )
+        ohlc_inconsistent = (
+            (high < low)
+            | (high < np.fmax(open_, close))
+            | (low > np.fmin(open_, close))
+        )
+    
+    return {'non_positive': non_positive, 'ohlc_inconsistent': ohlc_inconsistent}
+
+def _market_returns(rows: pd.DataFrame, log_return: pd.Series, market: Optional[pd.Series]) -> np.ndarray:
+    cross_section = log_return.groupby(rows['date']).agg(['median', 'count'])
+    by_date = cross_section['median'].where(cross_section['count'] >= MIN_MARKET_TICKERS)
+    
+    if market is not None and not market.empty:
+        market_return = np.log(market.sort_index().astype(np.float64)).diff()
+        by_date = market_return.combine_first(by_date)
+    
+    return rows['date'].map(by_date).to_numpy(dtype=np.float64)
+
+def _flag_returns(
+    frame: pd.DataFrame,
+    history: Optional[pd.DataFrame],
+    usable: np.ndarray,
+    pending_splits: Dict[str, date],
+    market: Optional[pd.Series]
+) -> Tuple[Dict[str, np.ndarray], Dict[str, int], List[str]]:
+    rows = frame.loc[usable, ['ticker', 'date', 'adjusted_close']].assign(row=np.flatnonzero(usable))
+    
+    if history is not None and not history.empty:
+        rows = pd.concat([history[['ticker', 'date', 'adjusted_close']].assign(row=-1), rows], ignore_index=True)
+    
+    flags = {
+        'extreme_return': np.zeros(len(frame), dtype=bool),
+        'split_suspect': np.zeros(len(frame), dtype=bool),
+        'split_pending': np.zeros(len(frame), dtype=bool),
+        'market_move': np.zeros(len(frame), dtype=bool)
+    }
+    
+    if rows.empty:
+        return flags, {}, []
+    
+    rows = rows.sort_values(['ticker', 'date'], kind='stable').reset_index(drop=True)
+    tickers = rows['ticker']
+    
+    log_price = np.log(rows['adjusted_close'].astype(np.float64))
+    log_return = log_price.groupby(tickers).diff()
+    
+    median = log_return.groupby(tickers).transform('median')
+    deviation = (log_return - median).abs()
+    scale = (deviation.groupby(tickers).transform('median') * MAD_SCALE).clip(lower=MIN_RETURN_SCALE)
+    observations = log_return.notna().groupby(tickers).transform('sum')
+    
+    zscore = (deviation / scale).where(observations >= MIN_RETURN_OBSERVATIONS)
+    extreme = (zscore > settings.DATA_QUALITY_ZSCORE_THRESHOLD).to_numpy()
+    
+    previous_return = log_return.groupby(tickers).shift(1)
+    previous_extreme = pd.Series(extreme).groupby(tickers).shift(1, fill_value=False).to_numpy(dtype=bool)
+    reverting = previous_extreme & ((log_return + previous_return).abs() <= log_return.abs() / 2).to_numpy()
+    extreme = extreme & ~reverting
+    
+    split_distance = np.abs(log_return.to_numpy()[:, None] + np.log(SPLIT_RATIOS)[None, :]).min(axis=1)
+    near_split = split_distance <= np.log1p(SPLIT_TOLERANCE)
+    
+    market_return = _market_returns(rows, log_return, market)
+    with np.errstate(invalid='ignore'):
+        market_move = (
+            (np.sign(market_return) == np.sign(log_return.to_numpy()))
+            & (np.abs(market_return) >= log_return.abs().to_numpy() * MARKET_MOVE_SHARE)
+        )
+    
+    row_index = rows['row'].to_numpy()
+    new_rows = row_index >= 0
+    split = new_rows & extreme & near_split
+    flags['extreme_return'][row_index[new_rows & extreme & ~near_split & ~market_move]] = True
+    flags['market_move'][row_index[new_rows & extreme & ~near_split & market_move]] = True
+    flags['split_suspect'][row_index[split]] = True
+    
+    split_dates = rows[split].groupby('ticker')['date'].min().to_dict()
+    batch_dates = rows[new_rows].groupby('ticker')['date'].agg(['min', 'max'])
+    cleared = []
+    
+    for ticker, pending in pending_splits.items():
+        if ticker not in batch_dates.index:
+            continue
+        if ticker not in split_dates and batch_dates.at[ticker, 'min'] < pending <= batch_dates.at[ticker, 'max']:
+            cleared.append(ticker)
+        else:
+            split_dates[ticker] = min(split_dates.get(ticker, pending), pending)
+    
+    dates = pd.to_datetime(rows['date']).to_numpy(dtype='datetime64[D]')
+    held_from = pd.to_datetime(tickers.map(split_dates)).to_numpy(dtype='datetime64[D]')
+    flags['split_pending'][row_index[new_rows & ~split & (dates >= held_from)]] = True
+    
+    continues = (tickers == tickers.shift(1)).to_numpy() & new_rows
+    continues[0] = False
+    
+    missing = np.zeros(len(rows), dtype=np.int64)
+    missing[continues] = count_missing_sessions(dates[np.flatnonzero(continues) - 1], dates[continues])
+    gaps = pd.Series(missing).groupby(tickers).sum()
+    
+    return flags, {ticker: int(count) for ticker, count in gaps[gaps > 0].items()}, cleared
+
+def validate_price_records(
+    records: pd.DataFrame,
+    history: Optional[pd.DataFrame] = None,
+    pending_splits: Optional[Dict[str, date]] = None,
+    market: Optional[pd.Series] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
+    frame = records.reset_index(drop=True)
+    
+    flags = _flag_price_levels(frame)
+    usable = ~(flags['non_positive'] | flags['ohlc_inconsistent'])
+    
+    return_flags, gaps, cleared = _flag_returns(frame, history, usable, pending_splits or {}, market)
+    flags.update(return_flags)
+    
+    reasons = pd.Series("", index=frame.index)
+    for check in QUALITY_CHECKS:
+        reasons = reasons.where(~flags[check], reasons + "," + check)
+    
+    bad = (reasons != "").to_numpy()
+    
+    report = {
+        "tickers": int(frame['ticker'].nunique()),
+        "rows": len(frame),
+        "clean": int((~bad).sum()),
+        "quarantined": int(bad.sum()),
+        "checks": {check: int(flags[check].sum()) for check in QUALITY_CHECKS},
+        "market_moves": int(flags['market_move'].sum()),
+        "splits_cleared": cleared,
+        "gaps": gaps
+    }
+    
+    return frame[~bad], frame[bad].assign(reasons=reasons[bad].str.lstrip(",")), report
@@ -0,0 +1,125 @@
+import asyncio
+import random
+import time
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+from datetime import date
+import pandas as pd
+import httpx
+
+from backend.core.config import get_app_config
+from backend.services.data_ingestion import request_provider_data, resolve_provider
+
+class TokenBucket:
+    def __init__(self, rate_limit: float, period: float = 60.0, capacity: Optional[float] = None):
+        self.refill_rate = rate_limit / period
+        self.capacity = capacity or rate_limit
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+
+def is_retryable_error(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    
+    return isinstance(error, (httpx.TransportError, httpx.TimeoutException))
+
+class IngestionScheduler:
+    def __init__(
+        self,
+        providers_config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None
+    ):
+        app_config = get_app_config()
+        ingestion_config = app_config.get("ingestion", {})
+        
+        if providers_config is None:
+            providers_config = app_config.get("data_providers", {})
+        
+        self.buckets = {
+            provider: TokenBucket(config["rate_limit"], config.get("rate_limit_period", 60))
+            for provider, config in providers_config.items()
+            if config.get("rate_limit")
+        }
+        self.semaphore = asyncio.Semaphore(max_concurrency or ingestion_config.get("max_concurrency", 8))
+        self.max_retries = max_retries if max_retries is not None else ingestion_config.get("max_retries", 3)
+        self.retry_backoff = retry_backoff if retry_backoff is not None else ingestion_config.get("retry_backoff", 1.0)
+    
+    async def fetch(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        source: str = "yfinance"
+    ) -> pd.DataFrame:
+        provider = resolve_provider(source)
+        bucket = self.buckets.get(provider)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.semaphore:
+                    if bucket:
+                        await bucket.acquire()
+                    return await request_provider_data(ticker, start_date, end_date, provider)
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable_error(e):
+                    print(f"Error fetching {provider} data for {ticker} after {attempt + 1} attempts: {e}")
+                    return pd.DataFrame()
+                
+                delay = self.retry_backoff * (2 ** attempt) + random.uniform(0, self.retry_backoff)
+                await asyncio.sleep(delay)
+        
+        return pd.DataFrame()
+    
+    async def _fetch_tagged(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        source: str
+    ) -> Tuple[str, pd.DataFrame]:
+        return ticker, await self.fetch(ticker, start_date, end_date, source)
+    
+    async def fetch_many(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        source: str = "yfinance"
+    ) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+        ranges = {ticker: (start_date, end_date) for ticker in tickers}
+        
+        async for ticker, df in self.fetch_ranges(ranges, source):
+            yield ticker, df
+    
+    async def fetch_ranges(
+        self,
+        ranges: Dict[str, Tuple[date, date]],
+        source: str = "yfinance"
+    ) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+        tasks = [
+            asyncio.create_task(self._fetch_tagged(ticker, start_date, end_date, source))
+            for ticker, (start_date, end_date) in ranges.items()
+        ]
+        
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
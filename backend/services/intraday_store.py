@@ -0,0 +1,262 @@
+import fcntl
+import os
+import shutil
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from backend.core.config import settings
+
+INTRADAY_BAR_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[s]'),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+])
+
+INTRADAY_RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600}
+INTRADAY_BAR_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+def rollup_bars(bars: np.ndarray, seconds: int, offsets: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    if offsets is None:
+        offsets = np.array([0, len(bars)])
+    
+    if len(bars) == 0:
+        return np.empty(0, dtype=INTRADAY_BAR_DTYPE), np.zeros_like(offsets)
+    
+    epoch = bars['timestamp'].astype(np.int64)
+    buckets = epoch - epoch % seconds
+    
+    boundary = np.zeros(len(bars), dtype=bool)
+    boundary[0] = True
+    boundary[1:] = buckets[1:] != buckets[:-1]
+    boundary[offsets[1:-1][offsets[1:-1] < len(bars)]] = True
+    
+    starts = np.flatnonzero(boundary)
+    ends = np.r_[starts[1:], len(bars)] - 1
+    
+    rolled = np.empty(len(starts), dtype=INTRADAY_BAR_DTYPE)
+    rolled['timestamp'] = buckets[starts].astype('datetime64[s]')
+    rolled['open'] = bars['open'][starts]
+    rolled['high'] = np.maximum.reduceat(bars['high'], starts)
+    rolled['low'] = np.minimum.reduceat(bars['low'], starts)
+    rolled['close'] = bars['close'][ends]
+    rolled['volume'] = np.add.reduceat(bars['volume'], starts)
+    
+    return rolled, np.searchsorted(starts, offsets)
+
+def bars_from_frame(frame: pd.DataFrame) -> np.ndarray:
+    bars = np.empty(len(frame), dtype=INTRADAY_BAR_DTYPE)
+    bars['timestamp'] = frame['timestamp'].to_numpy(dtype='datetime64[s]')
+    
+    for field in INTRADAY_BAR_FIELDS:
+        bars[field] = frame[field].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    return bars
+
+class IntradayPartition:
+    def __init__(self, tickers: np.ndarray, offsets: np.ndarray, bars: np.ndarray):
+        self.tickers = tickers
+        self.offsets = offsets
+        self.bars = bars
+    
+    @classmethod
+    def empty(cls) -> "IntradayPartition":
+        return cls(np.array([], dtype=str), np.zeros(1, dtype=np.int64), np.empty(0, dtype=INTRADAY_BAR_DTYPE))
+    
+    @classmethod
+    def from_ticker_bars(cls, ticker_bars: Dict[str, np.ndarray]) -> "IntradayPartition":
+        tickers = sorted(ticker for ticker, bars in ticker_bars.items() if len(bars) > 0)
+        lengths = [len(ticker_bars[ticker]) for ticker in tickers]
+        
+        return cls(
+            np.array(tickers, dtype=str),
+            np.r_[0, np.cumsum(lengths, dtype=np.int64)],
+            np.concatenate([ticker_bars[ticker] for ticker in tickers]) if tickers else np.empty(0, dtype=INTRADAY_BAR_DTYPE)
+        )
+    
+    def get(self, ticker: str) -> np.ndarray:
+        i = np.searchsorted(self.tickers, ticker)
+        
+        if i < len(self.tickers) and self.tickers[i] == ticker:
+            return self.bars[self.offsets[i]:self.offsets[i + 1]]
+        
+        return np.empty(0, dtype=INTRADAY_BAR_DTYPE)
+    
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        return {ticker: self.bars[self.offsets[i]:self.offsets[i + 1]] for i, ticker in enumerate(self.tickers)}
+    
+    def rollup(self, seconds: int) -> "IntradayPartition":
+        bars, offsets = rollup_bars(self.bars, seconds, self.offsets)
+        return IntradayPartition(self.tickers, offsets, bars)
+
+class IntradayBarStore:
+    def __init__(self, root: str, retention_days: Dict[str, int]):
+        self.root = Path(root)
+        self.retention_days = retention_days
+    
+    def _day_dir(self, resolution: str, day: date) -> Path:
+        return self.root / resolution / day.isoformat()
+    
+    def load(self, day: date, resolution: str = "1m") -> IntradayPartition:
+        day_dir = self._day_dir(resolution, day)
+        
+        for _ in range(3):
+            try:
+                version_dir = day_dir / (day_dir / "CURRENT").read_text().strip()
+                return IntradayPartition(
+                    np.load(version_dir / "tickers.npy"),
+                    np.load(version_dir / "offsets.npy"),
+                    np.load(version_dir / "bars.npy", mmap_mode='r')
+                )
+            except FileNotFoundError:
+                continue
+        
+        return IntradayPartition.empty()
+    
+    def _save(self, day_dir: Path, partition: IntradayPartition):
+        day_dir.mkdir(parents=True, exist_ok=True)
+        previous = day_dir / (day_dir / "CURRENT").read_text().strip() if (day_dir / "CURRENT").exists() else None
+        
+        version = uuid.uuid4().hex
+        version_dir = day_dir / version
+        version_dir.mkdir()
+        
+        np.save(version_dir / "tickers.npy", partition.tickers)
+        np.save(version_dir / "offsets.npy", partition.offsets)
+        np.save(version_dir / "bars.npy", partition.bars)
+        
+        pointer = day_dir / f"CURRENT.{version}"
+        pointer.write_text(version)
+        os.replace(pointer, day_dir / "CURRENT")
+        
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+    
+    def read(self, ticker: str, day: date, resolution: str = "1m") -> np.ndarray:
+        return self.load(day, resolution).get(ticker)
+    
+    def read_day(self, tickers: List[str], day: date, resolution: str = "1m") -> Dict[str, np.ndarray]:
+        partition = self.load(day, resolution)
+        return {ticker: partition.get(ticker) for ticker in tickers}
+    
+    def read_frame(self, tickers: List[str], day: date, resolution: str = "1m") -> pd.DataFrame:
+        frames = [
+            pd.DataFrame(bars).assign(ticker=ticker)
+            for ticker, bars in self.read_day(tickers, day, resolution).items()
+            if len(bars) > 0
+        ]
+        
+        if not frames:
+            return pd.DataFrame(columns=['ticker', 'timestamp', *INTRADAY_BAR_FIELDS])
+        
+        return pd.concat(frames, ignore_index=True)[['ticker', 'timestamp', *INTRADAY_BAR_FIELDS]]
+    
+    def write(self, frame: pd.DataFrame) -> int:
+        if frame.empty:
+            return 0
+        
+        frame = frame.assign(timestamp=pd.to_datetime(frame['timestamp']))
+        written = 0
+        
+        for day, day_frame in frame.groupby(frame['timestamp'].dt.date, sort=False):
+            written += self._write_day(day, day_frame)
+        
+        return written
+    
+    def _write_day(self, day: date, frame: pd.DataFrame) -> int:
+        day_dir = self._day_dir("1m", day)
+        day_dir.mkdir(parents=True, exist_ok=True)
+        written = 0
+        
+        with open(day_dir / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            
+            ticker_bars = {ticker: np.array(bars) for ticker, bars in self.load(day, "1m").to_dict().items()}
+            
+            for ticker, group in frame.groupby('ticker', sort=False):
+                bars = bars_from_frame(group)
+                bars = bars[np.argsort(bars['timestamp'], kind='stable')]
+                bars = bars[np.r_[bars['timestamp'][1:] != bars['timestamp'][:-1], True]]
+                
+                existing = ticker_bars.get(ticker, np.empty(0, dtype=INTRADAY_BAR_DTYPE))
+                merged = np.concatenate([existing[~np.isin(existing['timestamp'], bars['timestamp'])], bars])
+                ticker_bars[ticker] = merged[np.argsort(merged['timestamp'], kind='stable')]
+                written += len(bars)
+            
+            partition = IntradayPartition.from_ticker_bars(ticker_bars)
+            self._save(day_dir, partition)
+            
+            for resolution, seconds in INTRADAY_RESOLUTIONS.items():
+                if resolution != "1m":
+                    self._save(self._day_dir(resolution, day), partition.rollup(seconds))
+        
+        return written
+    
+    def daily_bars(self, tickers: List[str], day: date) -> pd.DataFrame:
+        for resolution in INTRADAY_RESOLUTIONS:
+            partition = self.load(day, resolution)
+            if len(partition.tickers) > 0:
+                break
+        else:
+            return pd.DataFrame()
+        
+        daily = partition.rollup(86400)
+        wanted = np.isin(daily.tickers, tickers)
+        
+        return pd.DataFrame({
+            'date': day,
+            'ticker': daily.tickers[wanted],
+            'open': daily.bars['open'][wanted],
+            'high': daily.bars['high'][wanted],
+            'low': daily.bars['low'][wanted],
+            'close': daily.bars['close'][wanted],
+            'volume': daily.bars['volume'][wanted]
+        })
+    
+    def compact(self, today: date) -> Dict[str, int]:
+        removed = {}
+        resolutions = list(INTRADAY_RESOLUTIONS)
+        
+        for i, resolution in enumerate(resolutions[:-1]):
+            retention = self.retention_days.get(resolution, 0)
+            resolution_dir = self.root / resolution
+            
+            if retention <= 0 or not resolution_dir.exists():
+                continue
+            
+            cutoff = today - timedelta(days=retention)
+            removed[resolution] = 0
+            
+            for day_dir in sorted(resolution_dir.iterdir()):
+                try:
+                    day = date.fromisoformat(day_dir.name)
+                except ValueError:
+                    continue
+                
+                if day >= cutoff:
+                    continue
+                
+                partition = self.load(day, resolution)
+                for coarser in resolutions[i + 1:]:
+                    if not (self._day_dir(coarser, day) / "CURRENT").exists():
+                        self._save(self._day_dir(coarser, day), partition.rollup(INTRADAY_RESOLUTIONS[coarser]))
+                
+                shutil.rmtree(day_dir, ignore_errors=True)
+                removed[resolution] += 1
+        
+        return removed
+
+intraday_store = IntradayBarStore(
+    settings.INTRADAY_STORE_PATH,
+    retention_days={
+        "1m": settings.INTRADAY_MINUTE_RETENTION_DAYS,
+        "5m": settings.INTRADAY_FIVE_MINUTE_RETENTION_DAYS,
+        "1h": 0
+    }
+)
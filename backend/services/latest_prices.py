@@ -0,0 +1,107 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+
+from backend.core.config import settings
+from backend.core.database import AsyncSessionLocal, dialect_insert
+from backend.core.models import LatestPrice
+
+_latest_marks: Dict[str, Tuple[float, datetime, float]] = {}
+
+def bar_close_time(bar_date: date) -> datetime:
+    return datetime(bar_date.year, bar_date.month, bar_date.day, tzinfo=timezone.utc) + timedelta(days=1)
+
+def is_fresh(as_of: datetime, now: datetime) -> bool:
+    if as_of.tzinfo is None:
+        as_of = as_of.replace(tzinfo=timezone.utc)
+    return (now - as_of).total_seconds() <= settings.LATEST_PRICE_MAX_AGE
+
+def _remember(ticker: str, price: float, as_of: datetime):
+    cached = _latest_marks.get(ticker)
+    
+    if cached is None or as_of >= cached[1]:
+        _latest_marks[ticker] = (price, as_of, time.monotonic())
+
+async def upsert_latest_prices(marks: Dict[str, Tuple[float, datetime]], source: str, db: AsyncSession):
+    if not marks:
+        return
+    
+    stmt = dialect_insert(db)(LatestPrice).values([
+        {"ticker": ticker, "price": price, "as_of": as_of, "source": source}
+        for ticker, (price, as_of) in marks.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['ticker'],
+        set_={
+            "price": stmt.excluded.price,
+            "as_of": stmt.excluded.as_of,
+            "source": stmt.excluded.source,
+            "updated_at": func.now()
+        },
+        where=stmt.excluded.as_of >= LatestPrice.as_of
+    )
+    
+    await db.execute(stmt)
+    
+    for ticker, (price, as_of) in marks.items():
+        _remember(ticker, price, as_of)
+
+async def record_bar_closes(records: pd.DataFrame, db: AsyncSession):
+    last_bars = records.sort_values('date').groupby('ticker').tail(1)
+    
+    await upsert_latest_prices(
+        {
+            ticker: (float(close), bar_close_time(bar_date))
+            for ticker, bar_date, close in zip(last_bars['ticker'], last_bars['date'], last_bars['close'])
+        },
+        "close",
+        db
+    )
+
+async def record_quotes(quotes: Dict[str, float]):
+    as_of = datetime.now(timezone.utc)
+    
+    async with AsyncSessionLocal() as db:
+        await upsert_latest_prices({ticker: (price, as_of) for ticker, price in quotes.items()}, "quote", db)
+        await db.commit()
+
+async def get_latest_prices(tickers: List[str], db: AsyncSession) -> Dict[str, float]:
+    now = time.monotonic()
+    wall_clock = datetime.now(timezone.utc)
+    prices = {}
+    missing = []
+    
+    for ticker in dict.fromkeys(tickers):
+        cached = _latest_marks.get(ticker)
+        
+        if cached is not None and now - cached[2] < settings.LATEST_PRICE_CACHE_TTL:
+            if is_fresh(cached[1], wall_clock):
+                prices[ticker] = cached[0]
+        else:
+            missing.append(ticker)
+    
+    if missing:
+        result = await db.execute(
+            select(LatestPrice.ticker, LatestPrice.price, LatestPrice.as_of).where(LatestPrice.ticker.in_(missing))
+        )
+        
+        for ticker, price, as_of in result.all():
+            _latest_marks[ticker] = (float(price), as_of, now)
+            if is_fresh(as_of, wall_clock):
+                prices[ticker] = float(price)
+    
+    return prices
+
+async def get_mark_prices(tickers: List[str], db: AsyncSession) -> Dict[str, float]:
+    from backend.services.quote_service import get_quotes
+    
+    prices = await get_latest_prices(tickers, db)
+    unmarked = [ticker for ticker in dict.fromkeys(tickers) if ticker not in prices]
+    
+    if unmarked:
+        prices.update(await get_quotes(unmarked))
+    
+    return prices
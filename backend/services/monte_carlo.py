@@ -0,0 +1,183 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from backend.core.config import settings
+from backend.services.covariance_store import FactorCovariance
+
+MONTE_CARLO_SAMPLERS = ["pseudo", "antithetic", "sobol"]
+MIN_CONVERGENCE_BATCHES = 8
+SOBOL_MAX_DIMENSIONS = 21201
+
+_factor_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_factor_lock = threading.Lock()
+
+def _covariance_key(cov: np.ndarray) -> str:
+    digest = hashlib.sha1(np.ascontiguousarray(cov, dtype=np.float64).tobytes()).hexdigest()
+    return f"{cov.shape[0]}:{digest}"
+
+def get_covariance_factor(cov: np.ndarray) -> np.ndarray:
+    key = _covariance_key(cov)
+    
+    with _factor_lock:
+        factor = _factor_cache.get(key)
+        if factor is not None:
+            _factor_cache.move_to_end(key)
+            return factor
+    
+    try:
+        factor = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+        factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+    
+    factor = factor.astype(np.float32)
+    factor.setflags(write=False)
+    
+    with _factor_lock:
+        _factor_cache[key] = factor
+        while len(_factor_cache) > settings.MONTE_CARLO_FACTOR_CACHE_SIZE:
+            _factor_cache.popitem(last=False)
+    
+    return factor
+
+def tail_statistics(ordered_tail: np.ndarray, total: int, confidence_levels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    position = (1 - confidence_levels) * (total - 1)
+    lower = np.floor(position).astype(int)
+    upper = np.minimum(lower + 1, total - 1)
+    thresholds = ordered_tail[lower] + (ordered_tail[upper] - ordered_tail[lower]) * (position - lower)
+    
+    counts = np.searchsorted(ordered_tail, thresholds, side='right')
+    tail_means = np.cumsum(ordered_tail)[counts - 1] / counts
+    
+    return thresholds, tail_means
+
+def _to_list(values: np.ndarray) -> List[Optional[float]]:
+    return [float(value) if np.isfinite(value) else None for value in values]
+
+def _chunk_size(assets: int, simulations: int, sampler: str) -> int:
+    budget = max(settings.MONTE_CARLO_CHUNK_BYTES // (2 * 4 * max(assets, 1)), 256)
+    size = min(budget, max(simulations // MIN_CONVERGENCE_BATCHES, 256))
+    
+    if sampler == "sobol":
+        size = 1 << int(np.log2(size))
+    elif sampler == "antithetic":
+        size += size % 2
+    
+    return size
+
+class _NormalSampler:
+    def __init__(self, sampler: str, assets: int, seed: Optional[int]):
+        if sampler not in MONTE_CARLO_SAMPLERS:
+            raise ValueError(f"Unsupported Monte Carlo sampler: {sampler}")
+        
+        if sampler == "sobol" and assets > SOBOL_MAX_DIMENSIONS:
+            raise ValueError(f"Sobol sampling supports at most {SOBOL_MAX_DIMENSIONS} assets")
+        
+        self.sampler = sampler
+        self.assets = assets
+        self.rng = np.random.default_rng(seed)
+        self.sobol = qmc.Sobol(d=assets, scramble=True, seed=self.rng) if sampler == "sobol" else None
+    
+    def draw(self, size: int) -> np.ndarray:
+        if self.sampler == "sobol":
+            points = self.sobol.random(size).astype(np.float32)
+            eps = np.finfo(np.float32).eps
+            np.clip(points, eps, 1 - eps, out=points)
+            return ndtri(points, out=points)
+        
+        if self.sampler == "antithetic":
+            half = self.rng.standard_normal((size // 2, self.assets), dtype=np.float32)
+            return np.concatenate([half, -half])
+        
+        return self.rng.standard_normal((size, self.assets), dtype=np.float32)
+
+def simulate_portfolio_var(
+    mean_returns: np.ndarray,
+    cov: Any,
+    weights: np.ndarray,
+    confidence_levels: List[float],
+    horizon: int = 1,
+    simulations: Optional[int] = None,
+    sampler: Optional[str] = None,
+    seed: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> Dict[str, Any]:
+    simulations = simulations or settings.MONTE_CARLO_SIMULATIONS
+    sampler = sampler or settings.MONTE_CARLO_SAMPLER
+    seed = settings.MONTE_CARLO_SEED if seed is None else seed
+    
+    levels = np.asarray(confidence_levels, dtype=np.float64)
+    
+    if isinstance(cov, FactorCovariance):
+        factor = None
+        exposures32 = cov.portfolio_exposures(weights).astype(np.float32)
+        mean_return = float(np.dot(weights, mean_returns))
+        assets = len(exposures32)
+    else:
+        factor = get_covariance_factor(np.asarray(cov, dtype=np.float64))
+        weights32 = np.asarray(weights, dtype=np.float32)
+        mean32 = np.asarray(mean_returns, dtype=np.float32)
+        assets = len(weights)
+    
+    chunk_size = chunk_size or _chunk_size(assets, simulations, sampler)
+    chunks = -(-simulations // chunk_size)
+    paths = chunks * chunk_size
+    tail_size = int(np.floor((1 - levels.min()) * (paths - 1))) + 2
+    
+    normals = _NormalSampler(sampler, assets, seed)
+    tail = np.empty(0, dtype=np.float64)
+    batch_thresholds = np.empty((chunks, len(levels)))
+    running = []
+    
+    for i in range(chunks):
+        shocks = normals.draw(chunk_size)
+        if factor is None:
+            portfolio_returns = (shocks @ exposures32).astype(np.float64) + mean_return
+        else:
+            asset_returns = shocks @ factor.T
+            asset_returns += mean32
+            portfolio_returns = (asset_returns @ weights32).astype(np.float64)
+        
+        batch_thresholds[i] = np.quantile(portfolio_returns, 1 - levels)
+        
+        merged = np.concatenate([tail, portfolio_returns])
+        keep = min(tail_size, len(merged))
+        tail = np.partition(merged, keep - 1)[:keep]
+        
+        running.append(tail_statistics(np.sort(tail), (i + 1) * chunk_size, levels)[0])
+    
+    ordered_tail = np.sort(tail)
+    thresholds, tail_means = tail_statistics(ordered_tail, paths, levels)
+    scale = np.sqrt(horizon)
+    
+    var_values = np.abs(thresholds * scale)
+    standard_error = (
+        batch_thresholds.std(axis=0, ddof=1) / np.sqrt(chunks) * scale
+        if chunks > 1 else np.full(len(levels), np.nan)
+    )
+    relative_error = np.divide(
+        standard_error, var_values, out=np.full(len(levels), np.nan), where=var_values > 0
+    )
+    
+    return {
+        "confidence_levels": levels.tolist(),
+        "horizon": horizon,
+        "var": var_values.tolist(),
+        "cvar": np.abs(tail_means * scale).tolist(),
+        "paths": paths,
+        "sampler": sampler,
+        "seed": seed,
+        "convergence": {
+            "chunks": chunks,
+            "chunk_size": chunk_size,
+            "standard_error": _to_list(standard_error),
+            "relative_error": _to_list(relative_error),
+            "converged": bool(np.all(relative_error <= settings.MONTE_CARLO_TOLERANCE)),
+            "running_var": (np.abs(np.array(running)) * scale).tolist()
+        }
+    }
@@ -142,9 +142,10 @@ async def execute_ibkr_order(order: Order, db: AsyncSession) -> Dict[str, Any]:
         return await simulate_order_execution(order, db)
 
 async def simulate_order_execution(order: Order, db: AsyncSession) -> Dict[str, Any]:
-    from backend.services.data_ingestion import get_current_price
+    from backend.services.latest_prices import get_mark_prices
     
-    current_price = await get_current_price(order.ticker)
+    marks = await get_mark_prices([order.ticker], db)
+    current_price = marks.get(order.ticker, 0.0)
     
     if order.order_type == "market" or (order.order_type == "limit" and order.price and float(order.price) >= current_price):
         order.status = OrderStatus.FILLED
@@ -1,16 +1,19 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import date, timedelta
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from pypfopt import EfficientFrontier, BlackLittermanModel, risk_models, expected_returns
 from pypfopt.hierarchical_portfolio import HRPOpt
-from pypfopt.risk_models import CovarianceShrinkage
 
+from backend.core.executors import compute_pool
 from backend.core.models import Portfolio, Position
-from backend.services.data_ingestion import get_prices_from_db
+from backend.core.config import settings
+from backend.services.covariance import get_covariance
+from backend.services.covariance_store import FactorCovariance, portfolio_variance
+from backend.services.daily_returns import get_returns_matrix
 
 async def optimize_portfolio(
     portfolio_id: int,
@@ -46,41 +49,173 @@ async def optimize_portfolio(
     end_date = date.today()
     start_date = end_date - timedelta(days=756)
     
-    prices_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df.set_index('date', inplace=True)
-            prices_data[position.ticker] = prices_df['close']
+    returns = await get_returns_matrix([p.ticker for p in positions], start_date, end_date, db)
     
-    if not prices_data:
+    if returns.empty:
         raise ValueError("No price data available")
     
-    prices = pd.DataFrame(prices_data)
-    prices = prices.dropna()
+    returns = returns.dropna()
+    
+    estimate = await get_covariance(
+        list(returns.columns), db, 756, end_date, settings.COVARIANCE_OPTIMIZATION_ESTIMATOR, returns=returns
+    )
+    covariance = estimate if estimate is None or isinstance(estimate, FactorCovariance) else estimate.to_frame()
     
     if method == "mean_variance":
-        return await mean_variance_optimization(prices, objective, constraints)
+        return await mean_variance_optimization(returns, objective, constraints, covariance)
     elif method == "black_litterman":
-        return await black_litterman_optimization(prices, views, risk_aversion, constraints, portfolio_id)
+        return await black_litterman_optimization(returns, views, risk_aversion, constraints, portfolio_id, covariance)
     elif method == "risk_parity":
-        return await risk_parity_optimization(prices, constraints, portfolio_id)
+        return await risk_parity_optimization(returns, constraints, portfolio_id, covariance)
     elif method == "hrp":
-        return await hrp_optimization(prices, portfolio_id)
+        return await hrp_optimization(returns, portfolio_id, covariance)
     elif method == "max_sharpe":
-        return await mean_variance_optimization(prices, "max_sharpe", constraints)
+        return await mean_variance_optimization(returns, "max_sharpe", constraints, covariance)
     elif method == "min_volatility":
-        return await mean_variance_optimization(prices, "min_volatility", constraints)
+        return await mean_variance_optimization(returns, "min_volatility", constraints, covariance)
     else:
-        return await mean_variance_optimization(prices, objective, constraints)
+        return await mean_variance_optimization(returns, objective, constraints, covariance)
 
 async def mean_variance_optimization(
-    prices: pd.DataFrame,
+    returns: pd.DataFrame,
     objective: Optional[str],
-    constraints: Optional[Dict[str, Any]]
+    constraints: Optional[Dict[str, Any]],
+    covariance: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
-    mu = expected_returns.mean_historical_return(prices)
-    S = risk_models.sample_cov(prices)
+    return await compute_pool.run(solve_mean_variance, returns, objective, constraints, covariance)
+
+def annualized_covariance(
+    returns: pd.DataFrame,
+    covariance: Optional[Union[pd.DataFrame, FactorCovariance]]
+) -> Union[pd.DataFrame, FactorCovariance]:
+    if covariance is None:
+        return returns.cov() * 252
+    
+    if isinstance(covariance, FactorCovariance):
+        return covariance.select(list(returns.columns)).scale(252)
+    
+    return covariance.reindex(index=returns.columns, columns=returns.columns) * 252
+
+def _factor_risk(model: FactorCovariance, weights: Any) -> Any:
+    import cvxpy as cp
+    
+    return cp.sum_squares(model.loadings.T @ weights) + cp.sum_squares(cp.multiply(np.sqrt(model.specific_variance), weights))
+
+def solve_factor_frontier(
+    mu: np.ndarray,
+    model: FactorCovariance,
+    objective: Optional[str],
+    constraints: Optional[Dict[str, Any]],
+    risk_free_rate: float = 0.02
+) -> Tuple[np.ndarray, float, float, float]:
+    import cvxpy as cp
+    
+    constraints = constraints or {}
+    lower = constraints.get("min_position", 0.0)
+    upper = constraints.get("max_position", 1.0)
+    weights = cp.Variable(len(mu))
+    max_sharpe = objective not in ["min_volatility", "efficient_risk", "efficient_return"]
+    
+    if max_sharpe:
+        scale = cp.Variable()
+        problem = cp.Problem(cp.Minimize(_factor_risk(model, weights)), [
+            (mu - risk_free_rate) @ weights == 1,
+            cp.sum(weights) == scale,
+            scale >= 0,
+            weights >= lower * scale,
+            weights <= upper * scale
+        ])
+    else:
+        bounds = [cp.sum(weights) == 1, weights >= lower, weights <= upper]
+        
+        if objective == "min_volatility":
+            problem = cp.Problem(cp.Minimize(_factor_risk(model, weights)), bounds)
+        elif objective == "efficient_risk":
+            target_volatility = constraints.get("target_volatility", 0.15)
+            problem = cp.Problem(cp.Maximize(mu @ weights), bounds + [_factor_risk(model, weights) <= target_volatility ** 2])
+        else:
+            target_return = constraints.get("target_return", 0.15)
+            problem = cp.Problem(cp.Minimize(_factor_risk(model, weights)), bounds + [mu @ weights >= target_return])
+    
+    problem.solve()
+    
+    if problem.status not in ["optimal", "optimal_inaccurate"]:
+        raise ValueError(f"Factor model optimization failed: {problem.status}")
+    
+    solution = np.asarray(weights.value)
+    if max_sharpe:
+        solution = solution / solution.sum()
+    
+    expected_return = float(mu @ solution)
+    volatility = float(np.sqrt(model.portfolio_variance(solution)))
+    sharpe_ratio = (expected_return - risk_free_rate) / volatility if volatility > 0 else 0.0
+    
+    return solution, expected_return, volatility, sharpe_ratio
+
+def clean_factor_weights(tickers: np.ndarray, weights: np.ndarray) -> Dict[str, float]:
+    cleaned = np.where(np.abs(weights) < 1e-4, 0.0, weights).round(5)
+    return {str(ticker): float(w) for ticker, w in zip(tickers, cleaned)}
+
+def factor_black_litterman_returns(
+    model: FactorCovariance,
+    views: Dict[str, float],
+    risk_aversion: float,
+    tau: float = 0.05
+) -> np.ndarray:
+    market_weights = np.full(len(model.tickers), 1 / len(model.tickers))
+    prior = risk_aversion * model.dot(market_weights)
+    
+    index = pd.Index(model.tickers).get_indexer(list(views))
+    if (index < 0).any():
+        raise ValueError("Views reference tickers outside the portfolio")
+    
+    columns = model.columns(index)
+    view_covariance = tau * columns[index]
+    omega = np.diag(np.diag(view_covariance))
+    
+    surprise = np.array(list(views.values()), dtype=np.float64) - prior[index]
+    return prior + tau * columns @ np.linalg.solve(view_covariance + omega, surprise)
+
+def factor_risk_parity_weights(model: FactorCovariance) -> np.ndarray:
+    from scipy.optimize import minimize
+    
+    n_assets = len(model.tickers)
+    
+    def objective(y):
+        marginal = model.dot(y)
+        return 0.5 * y @ marginal - np.log(y).sum() / n_assets, marginal - 1 / (n_assets * y)
+    
+    start = 1 / np.sqrt(model.variance())
+    start /= np.sqrt(model.portfolio_variance(start))
+    
+    result = minimize(
+        objective, start, jac=True, method='L-BFGS-B',
+        bounds=[(1e-12, None)] * n_assets, options={'ftol': 1e-15, 'gtol': 1e-10, 'maxiter': 1000}
+    )
+    return result.x / result.x.sum()
+
+def solve_mean_variance(
+    returns: pd.DataFrame,
+    objective: Optional[str],
+    constraints: Optional[Dict[str, Any]],
+    covariance: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    mu = expected_returns.mean_historical_return(returns, returns_data=True)
+    S = risk_models.sample_cov(returns, returns_data=True) if covariance is None else annualized_covariance(returns, covariance)
+    
+    if isinstance(S, FactorCovariance):
+        weights, expected_return, volatility, sharpe_ratio = solve_factor_frontier(
+            mu.to_numpy(), S, objective, constraints
+        )
+        return {
+            "portfolio_id": 0,
+            "method": "mean_variance",
+            "weights": clean_factor_weights(S.tickers, weights),
+            "expected_return": expected_return,
+            "volatility": volatility,
+            "sharpe_ratio": float(sharpe_ratio),
+            "turnover": None
+        }
     
     ef = EfficientFrontier(mu, S)
     
@@ -119,17 +254,45 @@ async def mean_variance_optimization(
     }
 
 async def black_litterman_optimization(
-    prices: pd.DataFrame,
+    returns: pd.DataFrame,
+    views: Optional[Dict[str, float]],
+    risk_aversion: Optional[float],
+    constraints: Optional[Dict[str, Any]],
+    portfolio_id: int,
+    covariance: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    return await compute_pool.run(solve_black_litterman, returns, views, risk_aversion, constraints, portfolio_id, covariance)
+
+def solve_black_litterman(
+    returns: pd.DataFrame,
     views: Optional[Dict[str, float]],
     risk_aversion: Optional[float],
     constraints: Optional[Dict[str, Any]],
-    portfolio_id: int
+    portfolio_id: int,
+    covariance: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
-    S = risk_models.sample_cov(prices)
+    S = risk_models.sample_cov(returns, returns_data=True) if covariance is None else annualized_covariance(returns, covariance)
     
     delta = risk_aversion or 2.5
     
-    market_caps = {ticker: 1e9 for ticker in prices.columns}
+    if isinstance(S, FactorCovariance):
+        if views:
+            mu = factor_black_litterman_returns(S, views, delta)
+        else:
+            mu = expected_returns.mean_historical_return(returns, returns_data=True).to_numpy()
+        
+        weights, expected_return, volatility, sharpe_ratio = solve_factor_frontier(mu, S, "max_sharpe", constraints)
+        return {
+            "portfolio_id": portfolio_id,
+            "method": "black_litterman",
+            "weights": clean_factor_weights(S.tickers, weights),
+            "expected_return": expected_return,
+            "volatility": volatility,
+            "sharpe_ratio": float(sharpe_ratio),
+            "turnover": None
+        }
+    
+    market_caps = {ticker: 1e9 for ticker in returns.columns}
     
     if views:
         viewdict = views
@@ -141,7 +304,7 @@ async def black_litterman_optimization(
         
         ef = EfficientFrontier(ret_bl, S_bl)
     else:
-        mu = expected_returns.mean_historical_return(prices)
+        mu = expected_returns.mean_historical_return(returns, returns_data=True)
         ef = EfficientFrontier(mu, S)
     
     if constraints:
@@ -167,14 +330,39 @@ async def black_litterman_optimization(
     }
 
 async def risk_parity_optimization(
-    prices: pd.DataFrame,
+    returns: pd.DataFrame,
     constraints: Optional[Dict[str, Any]],
-    portfolio_id: int
+    portfolio_id: int,
+    covariance: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
-    returns = prices.pct_change().dropna()
-    cov_matrix = returns.cov()
-    
-    n_assets = len(prices.columns)
+    return await compute_pool.run(solve_risk_parity, returns, constraints, portfolio_id, covariance)
+
+def solve_risk_parity(
+    returns: pd.DataFrame,
+    constraints: Optional[Dict[str, Any]],
+    portfolio_id: int,
+    covariance: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    if isinstance(covariance, FactorCovariance):
+        model = covariance.select(list(returns.columns))
+        weights = factor_risk_parity_weights(model)
+        
+        expected_return = float(weights @ (returns.mean() * 252))
+        volatility = float(np.sqrt(model.portfolio_variance(weights) * 252))
+        
+        return {
+            "portfolio_id": portfolio_id,
+            "method": "risk_parity",
+            "weights": {ticker: float(w) for ticker, w in zip(returns.columns, weights)},
+            "expected_return": expected_return,
+            "volatility": volatility,
+            "sharpe_ratio": float((expected_return - 0.04) / volatility if volatility > 0 else 0),
+            "turnover": None
+        }
+    
+    cov_matrix = annualized_covariance(returns, covariance) / 252
+    
+    n_assets = len(returns.columns)
     equal_risk_weights = np.ones(n_assets) / n_assets
     
     from scipy.optimize import minimize
@@ -202,7 +390,7 @@ async def risk_parity_optimization(
         constraints=constraints_opt
     )
     
-    weights_dict = {ticker: float(w) for ticker, w in zip(prices.columns, result.x)}
+    weights_dict = {ticker: float(w) for ticker, w in zip(returns.columns, result.x)}
     
     returns_mean = returns.mean() * 252
     expected_return = np.dot(result.x, returns_mean)
@@ -223,12 +411,22 @@ async def risk_parity_optimization(
     }
 
 async def hrp_optimization(
-    prices: pd.DataFrame,
-    portfolio_id: int
+    returns: pd.DataFrame,
+    portfolio_id: int,
+    covariance: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    return await compute_pool.run(solve_hrp, returns, portfolio_id, covariance)
+
+def solve_hrp(
+    returns: pd.DataFrame,
+    portfolio_id: int,
+    covariance: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
-    returns = prices.pct_change().dropna()
+    cov_matrix = annualized_covariance(returns, covariance)
+    if isinstance(cov_matrix, FactorCovariance):
+        cov_matrix = cov_matrix.to_frame()
     
-    hrp = HRPOpt(returns)
+    hrp = HRPOpt(returns, cov_matrix=cov_matrix / 252)
     weights = hrp.optimize()
     
     cleaned_weights = {k: float(v) for k, v in weights.items() if v > 0.001}
@@ -236,8 +434,7 @@ async def hrp_optimization(
     returns_mean = returns.mean() * 252
     expected_return = sum(cleaned_weights[ticker] * returns_mean[ticker] for ticker in cleaned_weights)
     
-    cov_matrix = returns.cov() * 252
-    weights_array = np.array([cleaned_weights.get(ticker, 0) for ticker in prices.columns])
+    weights_array = np.array([cleaned_weights.get(ticker, 0) for ticker in returns.columns])
     portfolio_variance = np.dot(weights_array, np.dot(cov_matrix, weights_array))
     volatility = np.sqrt(portfolio_variance)
     
@@ -270,47 +467,42 @@ async def calculate_efficient_frontier(
     end_date = date.today()
     start_date = end_date - timedelta(days=756)
     
-    prices_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df.set_index('date', inplace=True)
-            prices_data[position.ticker] = prices_df['close']
+    returns = await get_returns_matrix([p.ticker for p in positions], start_date, end_date, db)
     
-    if not prices_data:
+    if returns.empty:
         raise ValueError("No price data available")
     
-    prices = pd.DataFrame(prices_data)
-    prices = prices.dropna()
+    returns = returns.dropna()
+    
+    estimate = await get_covariance(
+        list(returns.columns), db, 756, end_date, settings.COVARIANCE_OPTIMIZATION_ESTIMATOR, returns=returns
+    )
     
-    returns = prices.pct_change().dropna()
     mean_returns = returns.mean() * 252
-    cov_matrix = returns.cov() * 252
+    if estimate is not None and not isinstance(estimate, FactorCovariance):
+        estimate = estimate.to_frame()
+    cov_matrix = annualized_covariance(returns, estimate)
     
-    n_assets = len(prices.columns)
+    weights, port_returns, port_volatilities, port_sharpes = await compute_pool.run(
+        sample_frontier_portfolios, mean_returns.to_numpy(), cov_matrix, num_portfolios
+    )
     
-    portfolios = []
-    for _ in range(num_portfolios):
-        weights = np.random.random(n_assets)
-        weights /= np.sum(weights)
-        
-        port_return = np.dot(weights, mean_returns)
-        port_volatility = np.sqrt(np.dot(weights, np.dot(cov_matrix, weights)))
-        port_sharpe = (port_return - 0.04) / port_volatility if port_volatility > 0 else 0
-        
-        portfolios.append({
-            "return": float(port_return),
-            "volatility": float(port_volatility),
-            "sharpe_ratio": float(port_sharpe),
-            "weights": {ticker: float(w) for ticker, w in zip(prices.columns, weights)}
-        })
+    portfolios = [
+        {
+            "return": float(port_returns[i]),
+            "volatility": float(port_volatilities[i]),
+            "sharpe_ratio": float(port_sharpes[i]),
+            "weights": dict(zip(returns.columns, weights[i].tolist()))
+        }
+        for i in range(num_portfolios)
+    ]
     
     portfolio_value = sum(float(p.market_value or 0) for p in positions)
     current_weights = {p.ticker: float(p.market_value or 0) / portfolio_value for p in positions}
     
     current_return = sum(current_weights[ticker] * mean_returns[ticker] for ticker in current_weights)
-    weights_array = np.array([current_weights.get(ticker, 0) for ticker in prices.columns])
-    current_volatility = np.sqrt(np.dot(weights_array, np.dot(cov_matrix, weights_array)))
+    weights_array = np.array([current_weights.get(ticker, 0) for ticker in returns.columns])
+    current_volatility = np.sqrt(portfolio_variance(cov_matrix, weights_array))
     current_sharpe = (current_return - 0.04) / current_volatility if current_volatility > 0 else 0
     
     current_portfolio = {
@@ -325,6 +517,24 @@ async def calculate_efficient_frontier(
         "current_portfolio": current_portfolio
     }
 
+def sample_frontier_portfolios(
+    mean_returns: np.ndarray,
+    cov_matrix: Union[np.ndarray, FactorCovariance],
+    num_portfolios: int,
+    seed: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    weights = np.random.default_rng(seed).random((num_portfolios, len(mean_returns)))
+    weights /= weights.sum(axis=1, keepdims=True)
+    
+    port_returns = weights @ mean_returns
+    port_volatilities = np.sqrt(portfolio_variance(cov_matrix, weights))
+    port_sharpes = np.divide(
+        port_returns - 0.04, port_volatilities,
+        out=np.zeros(num_portfolios), where=port_volatilities > 0
+    )
+    
+    return weights, port_returns, port_volatilities, port_sharpes
+
 async def generate_rebalancing_trades(
     portfolio_id: int,
     target_weights: Dict[str, float],
@@ -0,0 +1,268 @@
+import asyncio
+import io
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Iterable, Tuple
+from datetime import date
+import numpy as np
+import pandas as pd
+import redis.asyncio as redis
+
+from backend.core.config import settings
+
+PRICE_SERIES_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'adjusted_close']
+
+@dataclass
+class PriceSeries:
+    ticker: str
+    start_date: date
+    end_date: date
+    dates: np.ndarray
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + sum(values.nbytes for values in self.columns.values())
+    
+    def covers(self, start_date: date, end_date: date, columns: Iterable[str]) -> bool:
+        return (
+            self.start_date <= start_date
+            and end_date <= self.end_date
+            and all(column in self.columns for column in columns)
+        )
+    
+    def slice(self, start_date: date, end_date: date) -> "PriceSeries":
+        lo = np.searchsorted(self.dates, np.datetime64(start_date, 'D'), side='left')
+        hi = np.searchsorted(self.dates, np.datetime64(end_date, 'D'), side='right')
+        
+        return PriceSeries(
+            ticker=self.ticker,
+            start_date=start_date,
+            end_date=end_date,
+            dates=self.dates[lo:hi],
+            columns={name: values[lo:hi] for name, values in self.columns.items()}
+        )
+    
+    def to_frame(self) -> pd.DataFrame:
+        if len(self.dates) == 0:
+            return pd.DataFrame()
+        
+        frame = pd.DataFrame({'date': self.dates.astype(object), 'ticker': self.ticker})
+        for name, values in self.columns.items():
+            frame[name] = values
+        
+        return frame
+    
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            dates=self.dates.astype('datetime64[D]').astype(np.int64),
+            **{f"col_{name}": values for name, values in self.columns.items()}
+        )
+        return buffer.getvalue()
+    
+    @classmethod
+    def from_bytes(cls, ticker: str, start_date: date, end_date: date, payload: bytes) -> "PriceSeries":
+        with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+            return cls(
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                dates=archive['dates'].astype('datetime64[D]'),
+                columns={
+                    name[len("col_"):]: archive[name].astype(np.float64)
+                    for name in archive.files if name.startswith("col_")
+                }
+            )
+
+class PriceCache:
+    def __init__(self, max_bytes: int, local_ttl: float, redis_url: Optional[str], redis_ttl: int):
+        self.max_bytes = max_bytes
+        self.local_ttl = local_ttl
+        self.redis_url = redis_url
+        self.redis_ttl = redis_ttl
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, date, date], Tuple[PriceSeries, float]]" = OrderedDict()
+        self._ticker_keys: Dict[str, set] = {}
+        self._redis: Optional[redis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _redis_client(self) -> Optional[redis.Redis]:
+        if not self.redis_url:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            self._redis = redis.from_url(self.redis_url, max_connections=settings.REDIS_MAX_CONNECTIONS)
+            self._redis_loop = loop
+        
+        return self._redis
+    
+    @staticmethod
+    def _ranges_key(ticker: str) -> str:
+        return f"prices:{ticker}:ranges"
+    
+    @staticmethod
+    def _series_key(ticker: str, start_date: date, end_date: date) -> str:
+        return f"prices:{ticker}:{start_date.isoformat()}:{end_date.isoformat()}"
+    
+    def _get_local(self, ticker: str, start_date: date, end_date: date, columns: List[str]) -> Optional[PriceSeries]:
+        now = time.monotonic()
+        
+        for key in list(self._ticker_keys.get(ticker, ())):
+            series, expires_at = self._entries[key]
+            
+            if expires_at < now:
+                self._evict(key)
+                continue
+            
+            if series.covers(start_date, end_date, columns):
+                self._entries.move_to_end(key)
+                return series.slice(start_date, end_date)
+        
+        return None
+    
+    def _put_local(self, series: PriceSeries):
+        key = (series.ticker, series.start_date, series.end_date)
+        
+        if key in self._entries:
+            self._evict(key)
+        
+        if series.nbytes > self.max_bytes:
+            return
+        
+        self._entries[key] = (series, time.monotonic() + self.local_ttl)
+        self._ticker_keys.setdefault(series.ticker, set()).add(key)
+        self.current_bytes += series.nbytes
+        
+        while self.current_bytes > self.max_bytes and self._entries:
+            self._evict(next(iter(self._entries)))
+    
+    def _evict(self, key: Tuple[str, date, date]):
+        series, _ = self._entries.pop(key)
+        self.current_bytes -= series.nbytes
+        
+        ticker_keys = self._ticker_keys.get(key[0])
+        if ticker_keys is not None:
+            ticker_keys.discard(key)
+            if not ticker_keys:
+                del self._ticker_keys[key[0]]
+    
+    async def get_many(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+        columns: List[str] = PRICE_SERIES_COLUMNS
+    ) -> Dict[str, PriceSeries]:
+        found = {}
+        for ticker in tickers:
+            series = self._get_local(ticker, start_date, end_date, columns)
+            if series is not None:
+                found[ticker] = series
+        
+        missing = [ticker for ticker in tickers if ticker not in found]
+        client = self._redis_client()
+        
+        if not missing or client is None:
+            return found
+        
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for ticker in missing:
+                    pipe.smembers(self._ranges_key(ticker))
+                cached_ranges = await pipe.execute()
+            
+            candidates = []
+            for ticker, ranges in zip(missing, cached_ranges):
+                covering = []
+                for raw_range in ranges:
+                    range_start, range_end = (date.fromisoformat(part) for part in raw_range.decode().split(":"))
+                    if range_start <= start_date and end_date <= range_end:
+                        covering.append((ticker, range_start, range_end))
+                candidates.extend(sorted(covering, key=lambda candidate: candidate[2] - candidate[1]))
+            
+            if not candidates:
+                return found
+            
+            payloads = await client.mget([self._series_key(*candidate) for candidate in candidates])
+        except redis.RedisError as e:
+            print(f"Price cache unavailable: {e}")
+            return found
+        
+        for (ticker, range_start, range_end), payload in zip(candidates, payloads):
+            if payload is None or ticker in found:
+                continue
+            
+            series = PriceSeries.from_bytes(ticker, range_start, range_end, payload)
+            if not series.covers(start_date, end_date, columns):
+                continue
+            
+            self._put_local(series)
+            found[ticker] = series.slice(start_date, end_date)
+        
+        return found
+    
+    async def set_many(self, series_list: Iterable[PriceSeries]):
+        series_list = list(series_list)
+        
+        for series in series_list:
+            self._put_local(series)
+        
+        client = self._redis_client()
+        if client is None or not series_list:
+            return
+        
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for series in series_list:
+                    range_member = f"{series.start_date.isoformat()}:{series.end_date.isoformat()}"
+                    pipe.set(
+                        self._series_key(series.ticker, series.start_date, series.end_date),
+                        series.to_bytes(),
+                        ex=self.redis_ttl
+                    )
+                    pipe.sadd(self._ranges_key(series.ticker), range_member)
+                    pipe.expire(self._ranges_key(series.ticker), self.redis_ttl)
+                await pipe.execute()
+        except redis.RedisError as e:
+            print(f"Price cache unavailable: {e}")
+    
+    async def invalidate(self, tickers: Iterable[str]):
+        tickers = list(dict.fromkeys(tickers))
+        
+        for ticker in tickers:
+            for key in list(self._ticker_keys.get(ticker, ())):
+                self._evict(key)
+        
+        client = self._redis_client()
+        if client is None or not tickers:
+            return
+        
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for ticker in tickers:
+                    pipe.smembers(self._ranges_key(ticker))
+                cached_ranges = await pipe.execute()
+            
+            keys = [self._ranges_key(ticker) for ticker in tickers]
+            for ticker, ranges in zip(tickers, cached_ranges):
+                keys.extend(f"prices:{ticker}:{raw_range.decode()}" for raw_range in ranges)
+            
+            await client.delete(*keys)
+        except redis.RedisError as e:
+            print(f"Price cache unavailable: {e}")
+    
+    def clear_local(self):
+        self._entries.clear()
+        self._ticker_keys.clear()
+        self.current_bytes = 0
+
+price_cache = PriceCache(
+    max_bytes=settings.PRICE_CACHE_MAX_BYTES,
+    local_ttl=settings.PRICE_CACHE_LOCAL_TTL,
+    redis_url=settings.REDIS_URL if settings.PRICE_CACHE_REDIS_ENABLED else None,
+    redis_ttl=settings.PRICE_CACHE_REDIS_TTL
+)
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Callable
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.services.data_ingestion import store_price_data, PRICE_COLUMNS
+
+PRICE_IMPORT_SUFFIXES = {".csv", ".parquet", ".pq"}
+
+PRICE_COLUMN_ALIASES = {
+    "symbol": "ticker",
+    "timestamp": "date",
+    "datetime": "date",
+    "adj_close": "adjusted_close",
+    "adjclose": "adjusted_close",
+    "adj._close": "adjusted_close",
+    "o": "open",
+    "h": "high",
+    "l": "low",
+    "c": "close",
+    "v": "volume",
+}
+
+def discover_price_files(paths: List[str]) -> List[Path]:
+    files = []
+    
+    for raw_path in paths:
+        path = Path(raw_path)
+        
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.suffix.lower() in PRICE_IMPORT_SUFFIXES))
+        elif path.suffix.lower() in PRICE_IMPORT_SUFFIXES:
+            files.append(path)
+        else:
+            raise ValueError(f"Unsupported price file: {path}")
+    
+    return files
+
+def normalize_price_chunk(chunk: pd.DataFrame, default_ticker: Optional[str] = None) -> pd.DataFrame:
+    renamed = {}
+    for column in chunk.columns:
+        name = str(column).strip().lower().replace(" ", "_")
+        renamed[column] = PRICE_COLUMN_ALIASES.get(name, name)
+    
+    chunk = chunk.rename(columns=renamed)
+    chunk = chunk.loc[:, ~chunk.columns.duplicated()].copy()
+    
+    if "ticker" not in chunk.columns:
+        if default_ticker is None:
+            raise ValueError("Price file has no ticker column and no ticker was given")
+        chunk["ticker"] = default_ticker
+    
+    missing = [column for column in ("date", "close") if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"Price file is missing required columns: {', '.join(missing)}")
+    
+    for column in PRICE_COLUMNS:
+        if column not in chunk.columns:
+            chunk[column] = None
+    
+    chunk["ticker"] = chunk["ticker"].astype(str).str.strip().str.upper()
+    chunk["date"] = pd.to_datetime(chunk["date"], errors="coerce", utc=True).dt.tz_localize(None)
+    
+    return chunk[PRICE_COLUMNS]
+
+def iter_price_file(path: Path, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    if path.suffix.lower() == ".csv":
+        with pd.read_csv(path, chunksize=chunk_rows) as reader:
+            yield from reader
+        return
+    
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("pyarrow is required to import Parquet price files")
+    
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+        yield batch.to_pandas()
+
+async def import_price_files(
+    paths: List[Path],
+    db: AsyncSession,
+    chunk_rows: int = 100000,
+    default_ticker: Optional[str] = None,
+    ticker_from_filename: bool = False,
+    on_progress: Optional[Callable[[Dict[str, float]], None]] = None
+) -> Dict[str, float]:
+    totals = {"files": 0, "rows": 0, "inserted": 0, "skipped": 0, "quarantined": 0, "elapsed": 0.0}
+    started = time.perf_counter()
+    
+    for path in paths:
+        chunks = iter_price_file(path, chunk_rows)
+        ticker = default_ticker or (path.stem.upper() if ticker_from_filename else None)
+        
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            
+            records = normalize_price_chunk(chunk, ticker)
+            stored = await store_price_data(records, db, source="import")
+            
+            totals["rows"] += len(chunk)
+            totals["inserted"] += stored["inserted"]
+            totals["skipped"] += stored["skipped"]
+            totals["quarantined"] += stored["quarantined"]
+            totals["elapsed"] = time.perf_counter() - started
+            
+            if on_progress is not None:
+                on_progress({**totals, "file": str(path)})
+        
+        totals["files"] += 1
+    
+    totals["elapsed"] = time.perf_counter() - started
+    
+    return totals
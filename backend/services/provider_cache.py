@@ -0,0 +1,77 @@
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+
+from backend.core.config import settings
+from backend.services.price_cache import PriceSeries
+
+class ProviderResponseCache:
+    def __init__(self, root: str, ttl: float):
+        self.root = Path(root)
+        self.ttl = ttl
+    
+    def _path(self, provider: str, symbol: str, function: str) -> Path:
+        digest = hashlib.sha256(f"{provider}\0{symbol}\0{function}".encode()).hexdigest()
+        return self.root / provider / digest[:2] / f"{digest}.npz"
+    
+    def load(self, provider: str, symbol: str, function: str) -> Optional[Tuple[PriceSeries, float]]:
+        path = self._path(provider, symbol, function)
+        
+        try:
+            fetched_at = path.stat().st_mtime
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        
+        try:
+            series = PriceSeries.from_bytes(symbol, None, None, payload)
+        except (ValueError, OSError) as e:
+            print(f"Discarding unreadable {provider} cache entry for {symbol}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        
+        if len(series.dates) == 0:
+            return None
+        
+        series.start_date = series.dates[0].astype(object)
+        series.end_date = series.dates[-1].astype(object)
+        
+        return series, fetched_at
+    
+    def is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl
+    
+    def store(self, provider: str, symbol: str, function: str, series: PriceSeries):
+        path = self._path(provider, symbol, function)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        staging.write_bytes(series.to_bytes())
+        os.replace(staging, path)
+    
+    def merge(self, cached: PriceSeries, delta: PriceSeries) -> PriceSeries:
+        keep = ~np.isin(cached.dates, delta.dates)
+        dates = np.concatenate([cached.dates[keep], delta.dates])
+        order = np.argsort(dates, kind='stable')
+        
+        columns = {
+            name: np.concatenate([
+                cached.columns.get(name, np.full(len(cached.dates), np.nan))[keep],
+                values
+            ])[order]
+            for name, values in delta.columns.items()
+        }
+        
+        return PriceSeries(
+            ticker=cached.ticker,
+            start_date=dates[order][0].astype(object),
+            end_date=dates[order][-1].astype(object),
+            dates=dates[order],
+            columns=columns
+        )
+
+provider_cache = ProviderResponseCache(settings.PROVIDER_CACHE_PATH, settings.PROVIDER_CACHE_TTL)
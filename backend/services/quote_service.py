@@ -0,0 +1,162 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Callable, Awaitable
+import pandas as pd
+import yfinance as yf
+
+from backend.core.config import settings
+from backend.core.executors import get_provider_executor
+
+def download_quotes(tickers: List[str]) -> Dict[str, float]:
+    history = yf.download(
+        tickers,
+        period="5d",
+        interval="1d",
+        group_by="column",
+        auto_adjust=False,
+        progress=False,
+        threads=True
+    )
+    
+    if history.empty:
+        return {}
+    
+    closes = history['Close']
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(name=tickers[0])
+    
+    last_closes = closes.ffill().iloc[-1]
+    
+    return {
+        ticker: float(price)
+        for ticker, price in last_closes.items()
+        if pd.notna(price) and price > 0
+    }
+
+class QuoteService:
+    def __init__(
+        self,
+        ttl: float,
+        batch_window: float,
+        max_batch_size: int,
+        fetch_quotes: Callable[[List[str]], Dict[str, float]] = download_quotes,
+        on_quotes: Optional[Callable[[Dict[str, float]], Awaitable[None]]] = None
+    ):
+        self.ttl = ttl
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.fetch_quotes = fetch_quotes
+        self.on_quotes = on_quotes
+        self._quotes: Dict[str, tuple] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pending: List[str] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._fetch_tasks: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        
+        if self._loop is not loop:
+            self._inflight = {}
+            self._pending = []
+            self._flush_handle = None
+            self._loop = loop
+        
+        return loop
+    
+    def get_cached(self, ticker: str) -> Optional[float]:
+        cached = self._quotes.get(ticker)
+        
+        if cached and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+        
+        return None
+    
+    async def get_quotes(self, tickers: List[str]) -> Dict[str, float]:
+        loop = self._bind_loop()
+        quotes = {}
+        waiting = {}
+        
+        for ticker in dict.fromkeys(tickers):
+            cached = self.get_cached(ticker)
+            
+            if cached is not None:
+                quotes[ticker] = cached
+            elif ticker in self._inflight:
+                waiting[ticker] = self._inflight[ticker]
+            else:
+                waiting[ticker] = self._enqueue(ticker, loop)
+        
+        for ticker, future in waiting.items():
+            quotes[ticker] = await asyncio.shield(future)
+        
+        return quotes
+    
+    def _enqueue(self, ticker: str, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        future = loop.create_future()
+        self._inflight[ticker] = future
+        self._pending.append(ticker)
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        
+        return future
+    
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        
+        if batch:
+            task = asyncio.ensure_future(self._fetch_batch(batch))
+            self._fetch_tasks.add(task)
+            task.add_done_callback(self._fetch_tasks.discard)
+    
+    async def _fetch_batch(self, batch: List[str]):
+        loop = asyncio.get_running_loop()
+        
+        try:
+            prices = await loop.run_in_executor(get_provider_executor(), self.fetch_quotes, batch)
+        except Exception as e:
+            print(f"Error fetching quotes for {len(batch)} tickers: {e}")
+            prices = {}
+        
+        fetched_at = time.monotonic()
+        
+        for ticker in batch:
+            price = prices.get(ticker, 0.0)
+            
+            if price > 0:
+                self._quotes[ticker] = (price, fetched_at)
+            
+            future = self._inflight.pop(ticker, None)
+            if future is not None and not future.done():
+                future.set_result(price)
+        
+        fetched = {ticker: price for ticker, price in prices.items() if price > 0}
+        
+        if self.on_quotes is not None and fetched:
+            try:
+                await self.on_quotes(fetched)
+            except Exception as e:
+                print(f"Error recording quotes for {len(fetched)} tickers: {e}")
+
+async def record_latest_quotes(quotes: Dict[str, float]):
+    from backend.services.latest_prices import record_quotes
+    
+    await record_quotes(quotes)
+
+quote_service = QuoteService(
+    ttl=settings.QUOTE_CACHE_TTL,
+    batch_window=settings.QUOTE_BATCH_WINDOW,
+    max_batch_size=settings.QUOTE_MAX_BATCH_SIZE,
+    on_quotes=record_latest_quotes
+)
+
+async def get_quotes(tickers: List[str]) -> Dict[str, float]:
+    return await quote_service.get_quotes(tickers)
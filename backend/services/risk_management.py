@@ -1,24 +1,71 @@
 import numpy as np
 import pandas as pd
 from scipy import stats
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta, date
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
-from backend.core.models import Portfolio, Position
-from backend.services.data_ingestion import get_prices_from_db
+from backend.core.config import settings, get_app_config
+from backend.core.executors import compute_pool
+from backend.core.models import Portfolio, Position, RiskMetric
+from backend.services.covariance import get_covariance
+from backend.services.covariance_store import FactorCovariance, portfolio_variance
+from backend.services.daily_returns import get_returns_matrix
+from backend.services.monte_carlo import simulate_portfolio_var, tail_statistics
+from backend.services.stress_testing import custom_scenario, get_stress_scenarios, run_stress_scenarios
+from backend.utils.calculations import calculate_position_weights
 
-async def calculate_var(
+VAR_METHODS = ["historical", "parametric", "monte_carlo"]
+
+@dataclass
+class RiskContext:
+    portfolio: Portfolio
+    positions: List[Position]
+    portfolio_value: float
+    as_of: date
+    lookback_days: int
+    returns: pd.DataFrame
+    weights: np.ndarray
+    benchmark_ticker: str
+    benchmark_returns: pd.Series = field(default_factory=lambda: pd.Series(dtype=np.float64))
+    mean_returns: Optional[pd.Series] = None
+    covariance: Optional[Union[pd.DataFrame, FactorCovariance]] = None
+    
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.returns.columns)
+    
+    @cached_property
+    def portfolio_returns(self) -> pd.Series:
+        return self.returns.dot(self.weights)
+    
+    def moments(self) -> Tuple[np.ndarray, Union[np.ndarray, FactorCovariance]]:
+        if isinstance(self.covariance, FactorCovariance):
+            return self.mean_returns.to_numpy(), self.covariance
+        
+        if self.covariance is not None:
+            return self.mean_returns.to_numpy(), self.covariance.to_numpy()
+        
+        return self.returns.mean().to_numpy(), self.returns.cov().to_numpy()
+    
+    def window(self, days: int) -> pd.DataFrame:
+        if days >= self.lookback_days:
+            return self.returns
+        
+        cutoff = pd.Timestamp(self.as_of - timedelta(days=days))
+        return self.returns[self.returns.index >= cutoff]
+
+async def build_risk_context(
     portfolio_id: int,
-    confidence: float,
-    horizon: int,
-    method: str,
-    simulations: int,
     db: AsyncSession,
-    user_id: int
-) -> Dict[str, Any]:
+    user_id: int,
+    lookback_days: int = 252,
+    as_of: Optional[date] = None
+) -> RiskContext:
     result = await db.execute(
         select(Portfolio).where(
             and_(
@@ -37,35 +84,81 @@ async def calculate_var(
     )
     positions = result.scalars().all()
     
+    portfolio_value = sum(float(p.market_value or 0) for p in positions)
+    
+    end_date = as_of or date.today()
+    start_date = end_date - timedelta(days=lookback_days)
+    
+    benchmark_ticker = portfolio.benchmark or "SPY"
+    tickers = [p.ticker for p in positions]
+    
+    context = RiskContext(
+        portfolio=portfolio,
+        positions=positions,
+        portfolio_value=portfolio_value,
+        as_of=end_date,
+        lookback_days=lookback_days,
+        returns=pd.DataFrame(dtype=np.float64),
+        weights=np.zeros(0),
+        benchmark_ticker=benchmark_ticker
+    )
+    
     if not positions:
-        return {"var": 0, "var_percentage": 0, "portfolio_value": 0}
+        return context
     
-    portfolio_value = sum(float(p.market_value or 0) for p in positions)
+    all_returns = await get_returns_matrix(tickers + [benchmark_ticker], start_date, end_date, db)
+    held_tickers = [t for t in all_returns.columns if t in tickers]
     
-    end_date = date.today()
-    start_date = end_date - timedelta(days=252)
+    context.returns = all_returns[held_tickers].dropna()
+    context.weights = calculate_position_weights(positions, held_tickers, portfolio_value)
     
-    returns_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            returns_data[position.ticker] = prices_df['returns'].dropna()
+    if benchmark_ticker in all_returns.columns:
+        context.benchmark_returns = all_returns[benchmark_ticker].dropna()
     
-    if not returns_data:
-        return {"var": 0, "var_percentage": 0, "portfolio_value": portfolio_value}
+    estimate = await get_covariance(held_tickers, db, lookback_days, end_date, returns=context.returns)
+    if estimate is not None:
+        context.mean_returns = estimate.mean_series()
+        context.covariance = estimate if isinstance(estimate, FactorCovariance) else estimate.to_frame()
     
-    returns_df = pd.DataFrame(returns_data)
-    returns_df = returns_df.dropna()
+    return context
+
+async def calculate_var(
+    portfolio_id: int,
+    confidence: float,
+    horizon: int,
+    method: str,
+    simulations: int,
+    db: AsyncSession,
+    user_id: int,
+    context: Optional[RiskContext] = None
+) -> Dict[str, Any]:
+    context = context or await build_risk_context(portfolio_id, db, user_id)
+    
+    if not context.positions:
+        return {"var": 0, "var_percentage": 0, "portfolio_value": 0}
     
-    weights = np.array([float(p.market_value or 0) / portfolio_value for p in positions])
+    portfolio_value = context.portfolio_value
+    
+    if context.returns.empty:
+        return {"var": 0, "var_percentage": 0, "portfolio_value": portfolio_value}
+    
+    returns_df = context.returns
+    weights = context.weights
+    convergence = None
     
     if method == "historical":
         var_value = calculate_historical_var(returns_df, weights, confidence, horizon)
     elif method == "parametric":
-        var_value = calculate_parametric_var(returns_df, weights, confidence, horizon)
+        var_value = calculate_parametric_var(
+            returns_df, weights, confidence, horizon, context.mean_returns, context.covariance
+        )
     elif method == "monte_carlo":
-        var_value = calculate_monte_carlo_var(returns_df, weights, confidence, horizon, simulations)
+        simulation = await compute_pool.run(
+            simulate_portfolio_var,
+            *context.moments(), weights, [confidence], horizon, simulations
+        )
+        var_value = simulation["var"][0]
+        convergence = {"paths": simulation["paths"], "sampler": simulation["sampler"], **simulation["convergence"]}
     else:
         var_value = calculate_historical_var(returns_df, weights, confidence, horizon)
     
@@ -74,7 +167,8 @@ async def calculate_var(
     return {
         "var": var_dollar,
         "var_percentage": var_value * 100,
-        "portfolio_value": portfolio_value
+        "portfolio_value": portfolio_value,
+        "convergence": convergence
     }
 
 def calculate_historical_var(returns_df: pd.DataFrame, weights: np.ndarray, confidence: float, horizon: int) -> float:
@@ -86,11 +180,21 @@ def calculate_historical_var(returns_df: pd.DataFrame, weights: np.ndarray, conf
     
     return abs(var)
 
-def calculate_parametric_var(returns_df: pd.DataFrame, weights: np.ndarray, confidence: float, horizon: int) -> float:
-    portfolio_returns = returns_df.dot(weights)
-    
-    mean_return = portfolio_returns.mean()
-    std_return = portfolio_returns.std()
+def calculate_parametric_var(
+    returns_df: pd.DataFrame,
+    weights: np.ndarray,
+    confidence: float,
+    horizon: int,
+    mean_returns: Optional[np.ndarray] = None,
+    covariance: Optional[Union[np.ndarray, FactorCovariance]] = None
+) -> float:
+    if covariance is not None:
+        mean_return = float(np.dot(weights, np.asarray(mean_returns)))
+        std_return = float(np.sqrt(portfolio_variance(covariance, weights)))
+    else:
+        portfolio_returns = returns_df.dot(weights)
+        mean_return = portfolio_returns.mean()
+        std_return = portfolio_returns.std()
     
     z_score = stats.norm.ppf(1 - confidence)
     
@@ -98,19 +202,25 @@ def calculate_parametric_var(returns_df: pd.DataFrame, weights: np.ndarray, conf
     
     return abs(var)
 
-def calculate_monte_carlo_var(returns_df: pd.DataFrame, weights: np.ndarray, confidence: float, horizon: int, simulations: int) -> float:
-    mean_returns = returns_df.mean().values
-    cov_matrix = returns_df.cov().values
-    
-    simulated_returns = np.random.multivariate_normal(mean_returns, cov_matrix, simulations)
-    
-    portfolio_sim_returns = simulated_returns.dot(weights)
-    
-    horizon_returns = portfolio_sim_returns * np.sqrt(horizon)
-    
-    var = np.percentile(horizon_returns, (1 - confidence) * 100)
+def calculate_monte_carlo_var(
+    returns_df: pd.DataFrame,
+    weights: np.ndarray,
+    confidence: float,
+    horizon: int,
+    simulations: int,
+    sampler: Optional[str] = None,
+    seed: Optional[int] = None,
+    mean_returns: Optional[np.ndarray] = None,
+    covariance: Optional[Union[np.ndarray, FactorCovariance]] = None
+) -> float:
+    if covariance is None:
+        mean_returns, covariance = returns_df.mean().values, returns_df.cov().values
+    
+    simulation = simulate_portfolio_var(
+        mean_returns, covariance, weights, [confidence], horizon, simulations, sampler, seed
+    )
     
-    return abs(var)
+    return simulation["var"][0]
 
 async def calculate_cvar(
     portfolio_id: int,
@@ -119,72 +229,178 @@ async def calculate_cvar(
     method: str,
     simulations: int,
     db: AsyncSession,
-    user_id: int
+    user_id: int,
+    context: Optional[RiskContext] = None
 ) -> Dict[str, Any]:
-    result = await db.execute(
-        select(Portfolio).where(
-            and_(
-                Portfolio.id == portfolio_id,
-                Portfolio.owner_id == user_id
-            )
-        )
-    )
-    portfolio = result.scalar_one_or_none()
+    context = context or await build_risk_context(portfolio_id, db, user_id)
     
-    if not portfolio:
-        raise ValueError("Portfolio not found")
+    if not context.positions or context.returns.empty:
+        return {"cvar": 0}
     
-    result = await db.execute(
-        select(Position).where(Position.portfolio_id == portfolio_id)
-    )
-    positions = result.scalars().all()
+    portfolio_value = context.portfolio_value
     
-    if not positions:
-        return {"cvar": 0}
+    horizon_returns = context.portfolio_returns * np.sqrt(horizon)
     
-    portfolio_value = sum(float(p.market_value or 0) for p in positions)
+    var_threshold = np.percentile(horizon_returns, (1 - confidence) * 100)
     
-    end_date = date.today()
-    start_date = end_date - timedelta(days=252)
+    tail_losses = horizon_returns[horizon_returns <= var_threshold]
+    cvar = abs(tail_losses.mean())
     
-    returns_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            returns_data[position.ticker] = prices_df['returns'].dropna()
+    cvar_dollar = cvar * portfolio_value
     
-    if not returns_data:
-        return {"cvar": 0}
+    return {"cvar": cvar_dollar}
+
+def calculate_tail_statistics(returns: np.ndarray, confidence_levels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return tail_statistics(np.sort(returns), len(returns), confidence_levels)
+
+def calculate_var_grid_from_returns(
+    returns_df: pd.DataFrame,
+    weights: np.ndarray,
+    confidence_levels: List[float],
+    horizons: List[int],
+    methods: List[str],
+    simulations: int,
+    mean_returns: Optional[np.ndarray] = None,
+    covariance: Optional[Union[np.ndarray, FactorCovariance]] = None
+) -> List[Dict[str, Any]]:
+    levels = np.asarray(confidence_levels, dtype=np.float64)
+    scales = np.sqrt(np.asarray(horizons, dtype=np.float64))
+    portfolio_returns = returns_df.to_numpy().dot(weights)
+    
+    if covariance is None:
+        mean_returns, covariance = returns_df.mean().values, returns_df.cov().values
+    elif isinstance(covariance, FactorCovariance):
+        mean_returns = np.asarray(mean_returns)
+    else:
+        mean_returns, covariance = np.asarray(mean_returns), np.asarray(covariance)
+    
+    grid = []
+    for method in methods:
+        if method == "parametric":
+            mean_return = float(np.dot(weights, mean_returns))
+            std_return = float(np.sqrt(portfolio_variance(covariance, weights)))
+            z_scores = stats.norm.ppf(1 - levels)
+            
+            thresholds = mean_return + z_scores * std_return
+            tail_means = mean_return - std_return * stats.norm.pdf(z_scores) / (1 - levels)
+        elif method == "monte_carlo":
+            simulation = simulate_portfolio_var(
+                mean_returns, covariance, weights, confidence_levels, 1, simulations
+            )
+            thresholds, tail_means = -np.array(simulation["var"]), -np.array(simulation["cvar"])
+        else:
+            thresholds, tail_means = calculate_tail_statistics(portfolio_returns, levels)
+        
+        var_values = np.abs(np.outer(thresholds, scales))
+        cvar_values = np.abs(np.outer(tail_means, scales))
+        
+        for i, confidence in enumerate(confidence_levels):
+            for j, horizon in enumerate(horizons):
+                grid.append({
+                    "method": method,
+                    "confidence": confidence,
+                    "horizon": horizon,
+                    "var_percentage": float(var_values[i, j]) * 100,
+                    "cvar_percentage": float(cvar_values[i, j]) * 100
+                })
+    
+    return grid
+
+async def store_var_grid(portfolio_id: int, calculation_date: date, grid: List[Dict[str, Any]], db: AsyncSession):
+    points = {
+        (point["confidence"], point["horizon"]): point
+        for point in grid if point["method"] == "historical"
+    }
     
-    returns_df = pd.DataFrame(returns_data)
-    returns_df = returns_df.dropna()
+    values = {}
+    for confidence, suffix in [(0.95, "95"), (0.99, "99")]:
+        point = points.get((confidence, 1))
+        if point is not None:
+            values[f"var_{suffix}"] = point["var"]
+            values[f"cvar_{suffix}"] = point["cvar"]
     
-    weights = np.array([float(p.market_value or 0) / portfolio_value for p in positions])
+    if not values:
+        return
     
-    portfolio_returns = returns_df.dot(weights)
-    horizon_returns = portfolio_returns * np.sqrt(horizon)
+    result = await db.execute(
+        select(RiskMetric).where(
+            and_(
+                RiskMetric.portfolio_id == portfolio_id,
+                RiskMetric.calculation_date == calculation_date
+            )
+        )
+    )
+    metric = result.scalars().first()
     
-    var_threshold = np.percentile(horizon_returns, (1 - confidence) * 100)
+    if metric is None:
+        metric = RiskMetric(portfolio_id=portfolio_id, calculation_date=calculation_date)
+        db.add(metric)
     
-    tail_losses = horizon_returns[horizon_returns <= var_threshold]
-    cvar = abs(tail_losses.mean())
+    for name, value in values.items():
+        setattr(metric, name, value)
     
-    cvar_dollar = cvar * portfolio_value
+    await db.commit()
+
+async def calculate_var_grid(
+    portfolio_id: int,
+    db: AsyncSession,
+    user_id: int,
+    confidence_levels: Optional[List[float]] = None,
+    horizons: Optional[List[int]] = None,
+    methods: Optional[List[str]] = None,
+    simulations: Optional[int] = None,
+    persist: bool = True,
+    context: Optional[RiskContext] = None
+) -> Dict[str, Any]:
+    context = context or await build_risk_context(portfolio_id, db, user_id)
+    risk_config = get_app_config().get("risk", {})
+    
+    confidence_levels = confidence_levels or risk_config.get("var_confidence_levels", settings.VAR_CONFIDENCE_LEVELS)
+    horizons = horizons or risk_config.get("var_horizons", settings.VAR_HORIZONS)
+    methods = methods or VAR_METHODS
+    simulations = simulations or risk_config.get("monte_carlo_simulations", settings.MONTE_CARLO_SIMULATIONS)
+    
+    grid = []
+    if context.positions and not context.returns.empty:
+        grid = await compute_pool.run(
+            calculate_var_grid_from_returns,
+            context.returns, context.weights, confidence_levels, horizons, methods, simulations,
+            context.mean_returns, context.covariance
+        )
+        
+        for point in grid:
+            point["var"] = point["var_percentage"] / 100 * context.portfolio_value
+            point["cvar"] = point["cvar_percentage"] / 100 * context.portfolio_value
+        
+        if persist:
+            await store_var_grid(portfolio_id, context.as_of, grid, db)
     
-    return {"cvar": cvar_dollar}
+    return {
+        "portfolio_id": portfolio_id,
+        "as_of": context.as_of,
+        "portfolio_value": context.portfolio_value,
+        "observations": len(context.returns),
+        "confidence_levels": confidence_levels,
+        "horizons": horizons,
+        "methods": methods,
+        "grid": grid
+    }
 
 async def calculate_stress_test(
     portfolio_id: int,
     scenario: str,
     custom_shocks: Optional[Dict[str, float]],
     db: AsyncSession,
-    user_id: int
+    user_id: int,
+    context: Optional[RiskContext] = None
 ) -> Dict[str, Any]:
-    result = await db.execute(
-        select(Position).where(Position.portfolio_id == portfolio_id)
-    )
-    positions = result.scalars().all()
+    if context is not None:
+        positions = context.positions
+    else:
+        result = await db.execute(
+            select(Position).where(Position.portfolio_id == portfolio_id)
+        )
+        positions = result.scalars().all()
     
     if not positions:
         return {
@@ -196,74 +412,126 @@ async def calculate_stress_test(
             "position_impacts": []
         }
     
-    scenarios = {
-        "2008_financial_crisis": -0.40,
-        "2020_covid_crash": -0.35,
-        "1987_black_monday": -0.20,
-        "2000_dotcom_bubble": -0.45
-    }
-    
     if custom_shocks:
-        shock = custom_shocks
+        scenarios = [custom_scenario(scenario, custom_shocks)]
     else:
-        default_shock = scenarios.get(scenario, -0.20)
-        shock = {p.ticker: default_shock for p in positions}
-    
-    portfolio_value_before = sum(float(p.market_value or 0) for p in positions)
+        scenarios = await get_stress_scenarios(db, user_id, [scenario]) or [custom_scenario(scenario, {})]
     
-    position_impacts = []
-    portfolio_value_after = 0
+    run = await run_stress_scenarios(positions, scenarios, db, as_of=context.as_of if context else None)
     
-    for position in positions:
-        current_value = float(position.market_value or 0)
-        ticker_shock = shock.get(position.ticker, shock.get("default", -0.20))
-        shocked_value = current_value * (1 + ticker_shock)
-        impact = shocked_value - current_value
-        
-        portfolio_value_after += shocked_value
-        
-        position_impacts.append({
+    position_shocks = run["shocks"][0, run["position_index"]]
+    position_impacts = [
+        {
             "ticker": position.ticker,
-            "current_value": current_value,
-            "shocked_value": shocked_value,
-            "impact": impact,
-            "impact_percentage": ticker_shock * 100
-        })
+            "current_value": float(value),
+            "shocked_value": float(value + impact),
+            "impact": float(impact),
+            "impact_percentage": float(shock * 100)
+        }
+        for position, value, impact, shock in zip(positions, run["position_values"], run["position_pnl"][0], position_shocks)
+    ]
     
-    pnl = portfolio_value_after - portfolio_value_before
+    portfolio_value_before = run["portfolio_value"]
+    pnl = float(run["scenario_pnl"][0])
     pnl_percentage = (pnl / portfolio_value_before) * 100 if portfolio_value_before > 0 else 0
     
     return {
         "scenario": scenario,
         "portfolio_value_before": portfolio_value_before,
-        "portfolio_value_after": portfolio_value_after,
+        "portfolio_value_after": portfolio_value_before + pnl,
         "pnl": pnl,
         "pnl_percentage": pnl_percentage,
         "position_impacts": position_impacts
     }
 
-async def calculate_greeks(
+async def calculate_stress_scenarios(
     portfolio_id: int,
     db: AsyncSession,
-    user_id: int
+    user_id: int,
+    scenario_names: Optional[List[str]] = None,
+    include_positions: bool = False,
+    top_positions: int = 5,
+    context: Optional[RiskContext] = None
 ) -> Dict[str, Any]:
-    result = await db.execute(
-        select(Position).where(Position.portfolio_id == portfolio_id)
-    )
-    positions = result.scalars().all()
+    if context is None:
+        context = await build_risk_context(portfolio_id, db, user_id)
+    
+    positions = context.positions
+    scenarios = await get_stress_scenarios(db, user_id, scenario_names)
+    
+    if scenario_names:
+        unknown = set(scenario_names) - {s.name for s in scenarios}
+        if unknown:
+            raise ValueError(f"Unknown stress scenarios: {sorted(unknown)}")
+    
+    run = await run_stress_scenarios(positions, scenarios, db, as_of=context.as_of)
+    position_pnl = run["position_pnl"]
+    portfolio_value = run["portfolio_value"]
+    
+    worst = min(top_positions, len(positions))
+    if worst > 0:
+        candidates = np.argpartition(position_pnl, worst - 1, axis=1)[:, :worst]
+        order = np.take_along_axis(position_pnl, candidates, axis=1).argsort(axis=1)
+        worst_index = np.take_along_axis(candidates, order, axis=1)
+    else:
+        worst_index = np.zeros((len(scenarios), 0), dtype=np.int64)
+    
+    results = []
+    for i, scenario in enumerate(scenarios):
+        pnl = float(run["scenario_pnl"][i])
+        results.append({
+            "scenario": scenario.name,
+            "kind": scenario.kind,
+            "pnl": pnl,
+            "pnl_percentage": (pnl / portfolio_value) * 100 if portfolio_value > 0 else 0,
+            "portfolio_value_after": portfolio_value + pnl,
+            "worst_positions": [
+                {
+                    "ticker": positions[j].ticker,
+                    "current_value": float(run["position_values"][j]),
+                    "impact": float(position_pnl[i, j]),
+                    "impact_percentage": float(run["shocks"][i, run["position_index"][j]] * 100)
+                }
+                for j in worst_index[i]
+            ]
+        })
     
-    end_date = date.today()
-    start_date = end_date - timedelta(days=60)
+    response = {
+        "portfolio_id": portfolio_id,
+        "portfolio_value": portfolio_value,
+        "scenarios": results
+    }
+    
+    if include_positions:
+        response["position_pnl"] = [
+            {
+                "ticker": position.ticker,
+                "current_value": float(run["position_values"][j]),
+                "pnl": position_pnl[:, j].tolist()
+            }
+            for j, position in enumerate(positions)
+        ]
+    
+    return response
+
+async def calculate_greeks(
+    portfolio_id: int,
+    db: AsyncSession,
+    user_id: int,
+    context: Optional[RiskContext] = None
+) -> Dict[str, Any]:
+    context = context or await build_risk_context(portfolio_id, db, user_id, lookback_days=60)
+    positions = context.positions
     
     portfolio_delta = 0
     portfolio_duration = 0
     
+    returns_df = context.window(60)
+    volatilities = returns_df.std() * np.sqrt(252)
+    
     for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            volatility = prices_df['returns'].std() * np.sqrt(252)
-            portfolio_delta += float(position.shares or 0) * volatility
+        if position.ticker in volatilities.index:
+            portfolio_delta += float(position.shares or 0) * volatilities[position.ticker]
     
     return {
         "portfolio_id": portfolio_id,
@@ -281,28 +549,22 @@ async def calculate_correlation_matrix(
     portfolio_id: int,
     lookback_days: int,
     db: AsyncSession,
-    user_id: int
+    user_id: int,
+    context: Optional[RiskContext] = None
 ) -> Dict[str, Any]:
-    result = await db.execute(
-        select(Position).where(Position.portfolio_id == portfolio_id)
-    )
-    positions = result.scalars().all()
+    context = context or await build_risk_context(portfolio_id, db, user_id, lookback_days=lookback_days)
+    returns_df = context.window(lookback_days)
     
-    end_date = date.today()
-    start_date = end_date - timedelta(days=lookback_days)
-    
-    returns_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            returns_data[position.ticker] = prices_df['returns'].dropna()
-    
-    if not returns_data:
+    if returns_df.empty:
         return {"correlation_matrix": {}, "average_correlation": 0}
     
-    returns_df = pd.DataFrame(returns_data)
-    returns_df = returns_df.dropna()
+    if isinstance(context.covariance, FactorCovariance) and returns_df is context.returns:
+        return {
+            "correlation_matrix": {},
+            "average_correlation": context.covariance.average_correlation(),
+            "factors": context.covariance.factors,
+            "explained_variance": context.covariance.explained_variance()
+        }
     
     correlation_matrix = returns_df.corr()
     
@@ -320,39 +582,12 @@ async def calculate_risk_metrics(
     portfolio_id: int,
     lookback_days: int,
     db: AsyncSession,
-    user_id: int
+    user_id: int,
+    context: Optional[RiskContext] = None
 ) -> Dict[str, Any]:
-    result = await db.execute(
-        select(Portfolio).where(
-            and_(
-                Portfolio.id == portfolio_id,
-                Portfolio.owner_id == user_id
-            )
-        )
-    )
-    portfolio = result.scalar_one_or_none()
-    
-    if not portfolio:
-        raise ValueError("Portfolio not found")
-    
-    result = await db.execute(
-        select(Position).where(Position.portfolio_id == portfolio_id)
-    )
-    positions = result.scalars().all()
-    
-    portfolio_value = sum(float(p.market_value or 0) for p in positions)
+    context = context or await build_risk_context(portfolio_id, db, user_id, lookback_days=lookback_days)
     
-    end_date = date.today()
-    start_date = end_date - timedelta(days=lookback_days)
-    
-    returns_data = {}
-    for position in positions:
-        prices_df = await get_prices_from_db(position.ticker, start_date, end_date, db)
-        if not prices_df.empty:
-            prices_df['returns'] = prices_df['close'].pct_change()
-            returns_data[position.ticker] = prices_df['returns'].dropna()
-    
-    if not returns_data:
+    if context.returns.empty:
         return {
             "portfolio_id": portfolio_id,
             "volatility": 0,
@@ -367,11 +602,7 @@ async def calculate_risk_metrics(
             "cvar_95": 0
         }
     
-    returns_df = pd.DataFrame(returns_data)
-    returns_df = returns_df.dropna()
-    
-    weights = np.array([float(p.market_value or 0) / portfolio_value for p in positions])
-    portfolio_returns = returns_df.dot(weights)
+    portfolio_returns = context.portfolio_returns
     
     volatility = portfolio_returns.std() * np.sqrt(252)
     mean_return = portfolio_returns.mean() * 252
@@ -388,22 +619,20 @@ async def calculate_risk_metrics(
     drawdown = (cumulative_returns - running_max) / running_max
     max_drawdown = drawdown.min()
     
-    var_result = await calculate_var(portfolio_id, 0.95, 1, "historical", 10000, db, user_id)
-    cvar_result = await calculate_cvar(portfolio_id, 0.95, 1, "historical", 10000, db, user_id)
-    
-    benchmark_ticker = portfolio.benchmark or "SPY"
-    benchmark_df = await get_prices_from_db(benchmark_ticker, start_date, end_date, db)
+    var_result = await calculate_var(portfolio_id, 0.95, 1, "historical", 10000, db, user_id, context)
+    cvar_result = await calculate_cvar(portfolio_id, 0.95, 1, "historical", 10000, db, user_id, context)
     
     beta = 1.0
     alpha = 0.0
     tracking_error = 0.0
     information_ratio = 0.0
     
-    if not benchmark_df.empty:
-        benchmark_df['returns'] = benchmark_df['close'].pct_change()
-        benchmark_returns = benchmark_df['returns'].dropna()
+    if not context.benchmark_returns.empty:
+        benchmark_returns = context.benchmark_returns
+        common_dates = portfolio_returns.index.intersection(benchmark_returns.index)
         
-        aligned_portfolio = portfolio_returns.loc[benchmark_returns.index]
+        aligned_portfolio = portfolio_returns.loc[common_dates]
+        benchmark_returns = benchmark_returns.loc[common_dates]
         
         covariance = np.cov(aligned_portfolio, benchmark_returns)[0][1]
         benchmark_variance = benchmark_returns.var()
@@ -0,0 +1,381 @@
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, delete, and_, or_, func, cast, Float
+
+from backend.core.config import settings, get_app_config
+from backend.core.database import dialect_insert
+from backend.core.models import PriceData, StressScenario, StressReplayShock
+from backend.services.daily_returns import get_returns_matrix
+from backend.utils.calculations import calculate_factor_betas, evaluate_stress_scenarios
+
+STRESS_SCENARIO_KINDS = ["historical", "factor", "custom"]
+REPLAY_WINDOW_TOLERANCE_DAYS = 7
+
+DEFAULT_FACTOR_PROXIES = {
+    "market": "SPY",
+    "growth": "QQQ",
+    "small_cap": "IWM",
+    "rates": "TLT",
+    "credit": "HYG"
+}
+
+BUILTIN_STRESS_SCENARIOS = [
+    {
+        "name": "2008_financial_crisis",
+        "kind": "historical",
+        "description": "Lehman bankruptcy to the March 2009 low",
+        "start_date": date(2008, 9, 12),
+        "end_date": date(2009, 3, 9),
+        "default_shock": -0.40
+    },
+    {
+        "name": "2020_covid_crash",
+        "kind": "historical",
+        "description": "February 2020 peak to the March 2020 low",
+        "start_date": date(2020, 2, 19),
+        "end_date": date(2020, 3, 23),
+        "default_shock": -0.35
+    },
+    {
+        "name": "1987_black_monday",
+        "kind": "historical",
+        "description": "October 1987 crash",
+        "start_date": date(1987, 10, 14),
+        "end_date": date(1987, 10, 19),
+        "default_shock": -0.20
+    },
+    {
+        "name": "2000_dotcom_bubble",
+        "kind": "historical",
+        "description": "Nasdaq peak in March 2000 to the October 2002 low",
+        "start_date": date(2000, 3, 10),
+        "end_date": date(2002, 10, 9),
+        "default_shock": -0.45
+    },
+    {
+        "name": "2022_rate_hikes",
+        "kind": "historical",
+        "description": "2022 tightening cycle to the October 2022 low",
+        "start_date": date(2022, 1, 3),
+        "end_date": date(2022, 10, 12),
+        "default_shock": -0.25
+    },
+    {
+        "name": "equity_selloff_10",
+        "kind": "factor",
+        "description": "Broad equity market down 10%",
+        "factor_shocks": {"market": -0.10},
+        "default_shock": -0.10
+    },
+    {
+        "name": "growth_rotation",
+        "kind": "factor",
+        "description": "Growth stocks sell off relative to the market",
+        "factor_shocks": {"growth": -0.15, "market": -0.05},
+        "default_shock": -0.10
+    },
+    {
+        "name": "rates_up_100bp",
+        "kind": "factor",
+        "description": "Parallel 100bp rise in long rates",
+        "factor_shocks": {"rates": -0.15},
+        "default_shock": -0.05
+    },
+    {
+        "name": "credit_spread_widening",
+        "kind": "factor",
+        "description": "High yield spreads widen with a mild equity drawdown",
+        "factor_shocks": {"credit": -0.08, "market": -0.05},
+        "default_shock": -0.08
+    }
+]
+
+def get_factor_proxies() -> Dict[str, str]:
+    return get_app_config().get("risk", {}).get("stress_factor_proxies") or DEFAULT_FACTOR_PROXIES
+
+def custom_scenario(name: str, shocks: Dict[str, float]) -> StressScenario:
+    return StressScenario(
+        name=name,
+        kind="custom",
+        shocks={ticker: shock for ticker, shock in shocks.items() if ticker != "default"},
+        default_shock=shocks.get("default", settings.STRESS_DEFAULT_SHOCK)
+    )
+
+async def ensure_stress_scenarios(db: AsyncSession):
+    result = await db.execute(select(StressScenario.name))
+    existing = set(result.scalars().all())
+    
+    missing = [
+        StressScenario(**definition)
+        for definition in BUILTIN_STRESS_SCENARIOS
+        if definition["name"] not in existing
+    ]
+    
+    if not missing:
+        return
+    
+    db.add_all(missing)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+
+async def get_stress_scenarios(
+    db: AsyncSession,
+    user_id: Optional[int],
+    names: Optional[List[str]] = None
+) -> List[StressScenario]:
+    await ensure_stress_scenarios(db)
+    
+    query = select(StressScenario).where(
+        or_(StressScenario.owner_id.is_(None), StressScenario.owner_id == user_id)
+    )
+    
+    if names:
+        query = query.where(StressScenario.name.in_(names))
+    
+    result = await db.execute(query.order_by(StressScenario.id))
+    
+    resolved = {}
+    for scenario in result.scalars().all():
+        if scenario.name not in resolved or scenario.owner_id is not None:
+            resolved[scenario.name] = scenario
+    
+    return sorted(resolved.values(), key=lambda scenario: scenario.id)
+
+async def save_stress_scenario(
+    name: str,
+    kind: str,
+    db: AsyncSession,
+    user_id: int,
+    shocks: Optional[Dict[str, float]] = None,
+    factor_shocks: Optional[Dict[str, float]] = None,
+    default_shock: Optional[float] = None,
+    description: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> StressScenario:
+    if kind not in STRESS_SCENARIO_KINDS:
+        raise ValueError(f"Unsupported stress scenario kind: {kind}")
+    
+    if kind == "historical" and (start_date is None or end_date is None or start_date >= end_date):
+        raise ValueError("Historical scenarios need a start_date before their end_date")
+    
+    if kind == "factor":
+        unknown = set(factor_shocks or {}) - set(get_factor_proxies())
+        if not factor_shocks or unknown:
+            raise ValueError(f"Factor scenarios need shocks for known factors: {sorted(get_factor_proxies())}")
+    
+    if kind == "custom" and not shocks:
+        raise ValueError("Custom scenarios need at least one shock")
+    
+    await ensure_stress_scenarios(db)
+    
+    result = await db.execute(
+        select(StressScenario).where(
+            and_(
+                StressScenario.name == name,
+                or_(StressScenario.owner_id.is_(None), StressScenario.owner_id == user_id)
+            )
+        )
+    )
+    existing = {scenario.owner_id: scenario for scenario in result.scalars().all()}
+    
+    if None in existing:
+        raise ValueError(f"Stress scenario {name} is a built-in scenario")
+    
+    scenario = existing.get(user_id)
+    
+    if scenario is None:
+        scenario = StressScenario(name=name, owner_id=user_id)
+        db.add(scenario)
+    
+    scenario.kind = kind
+    scenario.description = description
+    scenario.start_date = start_date if kind == "historical" else None
+    scenario.end_date = end_date if kind == "historical" else None
+    scenario.factor_shocks = factor_shocks if kind == "factor" else None
+    scenario.shocks = {} if kind == "historical" else shocks
+    scenario.default_shock = settings.STRESS_DEFAULT_SHOCK if default_shock is None else default_shock
+    
+    if scenario.id is not None:
+        await db.execute(delete(StressReplayShock).where(StressReplayShock.scenario_id == scenario.id))
+    
+    await db.commit()
+    await db.refresh(scenario)
+    
+    return scenario
+
+async def _load_boundary_prices(
+    tickers: List[str],
+    window_start: date,
+    window_end: date,
+    earliest: bool,
+    db: AsyncSession
+) -> Dict[str, float]:
+    boundary = func.min(PriceData.date) if earliest else func.max(PriceData.date)
+    
+    dates = select(PriceData.ticker, boundary.label("date")).where(
+        and_(
+            PriceData.ticker.in_(tickers),
+            PriceData.date >= window_start,
+            PriceData.date <= window_end
+        )
+    ).group_by(PriceData.ticker).subquery()
+    
+    result = await db.execute(
+        select(PriceData.ticker, cast(func.coalesce(PriceData.adjusted_close, PriceData.close), Float)).join(
+            dates,
+            and_(PriceData.ticker == dates.c.ticker, PriceData.date == dates.c.date)
+        )
+    )
+    
+    return {ticker: price for ticker, price in result.all() if price and price > 0}
+
+async def load_replay_shocks(tickers: List[str], start_date: date, end_date: date, db: AsyncSession) -> Dict[str, float]:
+    tolerance = timedelta(days=REPLAY_WINDOW_TOLERANCE_DAYS)
+    
+    start_prices = await _load_boundary_prices(tickers, start_date, start_date + tolerance, True, db)
+    end_prices = await _load_boundary_prices(tickers, end_date - tolerance, end_date, False, db)
+    
+    return {
+        ticker: end_prices[ticker] / start_prices[ticker] - 1
+        for ticker in start_prices
+        if ticker in end_prices
+    }
+
+async def get_replay_shocks(
+    scenarios: List[StressScenario],
+    tickers: List[str],
+    db: AsyncSession
+) -> Dict[int, Dict[str, float]]:
+    historical = [scenario for scenario in scenarios if scenario.kind == "historical"]
+    replays = {scenario.id: {} for scenario in historical}
+    
+    if not historical:
+        return replays
+    
+    result = await db.execute(
+        select(StressReplayShock.scenario_id, StressReplayShock.ticker, StressReplayShock.shock).where(
+            and_(
+                StressReplayShock.scenario_id.in_(list(replays)),
+                StressReplayShock.ticker.in_(tickers)
+            )
+        )
+    )
+    for scenario_id, ticker, shock in result.all():
+        replays[scenario_id][ticker] = shock
+    
+    resolved = []
+    for scenario in historical:
+        missing = [ticker for ticker in tickers if ticker not in replays[scenario.id]]
+        
+        if not missing:
+            continue
+        
+        replay = await load_replay_shocks(missing, scenario.start_date, scenario.end_date, db)
+        replays[scenario.id].update(replay)
+        resolved.extend(
+            {"scenario_id": scenario.id, "ticker": ticker, "shock": shock}
+            for ticker, shock in replay.items()
+        )
+    
+    if resolved:
+        stmt = dialect_insert(db)(StressReplayShock).values(resolved)
+        await db.execute(stmt.on_conflict_do_nothing(index_elements=['scenario_id', 'ticker']))
+        await db.commit()
+    
+    return replays
+
+async def get_factor_betas(tickers: List[str], db: AsyncSession, as_of: Optional[date] = None) -> pd.DataFrame:
+    proxies = get_factor_proxies()
+    end_date = as_of or date.today()
+    start_date = end_date - timedelta(days=settings.STRESS_BETA_LOOKBACK_DAYS)
+    
+    returns = await get_returns_matrix(tickers + list(proxies.values()), start_date, end_date, db)
+    
+    factor_returns = returns.reindex(columns=list(proxies.values()))
+    factor_returns.columns = list(proxies)
+    
+    return calculate_factor_betas(
+        returns.reindex(columns=tickers),
+        factor_returns,
+        settings.STRESS_MIN_BETA_OBSERVATIONS
+    )
+
+def _default_shock(scenario: StressScenario) -> float:
+    return settings.STRESS_DEFAULT_SHOCK if scenario.default_shock is None else scenario.default_shock
+
+def build_shock_matrix(
+    scenarios: List[StressScenario],
+    tickers: List[str],
+    betas: pd.DataFrame,
+    replays: Optional[Dict[int, Dict[str, float]]] = None
+) -> np.ndarray:
+    proxies = get_factor_proxies()
+    factor_loadings = betas.reindex(index=tickers, columns=list(proxies)).to_numpy(dtype=np.float64)
+    shocks = np.empty((len(scenarios), len(tickers)))
+    
+    for i, scenario in enumerate(scenarios):
+        if scenario.kind == "factor":
+            moves = np.array([(scenario.factor_shocks or {}).get(factor, 0.0) for factor in proxies])
+            row = factor_loadings @ moves
+        else:
+            shock_map = (replays or {}).get(scenario.id, {}) if scenario.kind == "historical" else scenario.shocks or {}
+            row = pd.Series(shock_map, dtype=np.float64).reindex(tickers).to_numpy()
+            
+            if scenario.kind == "historical":
+                moves = pd.Series(shock_map, dtype=np.float64).reindex(list(proxies.values())).to_numpy()
+                if not np.isnan(moves).any():
+                    row = np.where(np.isnan(row), factor_loadings @ moves, row)
+        
+        shocks[i] = np.where(np.isnan(row), _default_shock(scenario), row)
+    
+    return shocks
+
+async def prepare_shock_matrix(
+    scenarios: List[StressScenario],
+    tickers: List[str],
+    db: AsyncSession,
+    as_of: Optional[date] = None
+) -> np.ndarray:
+    replays = await get_replay_shocks(scenarios, list(dict.fromkeys(tickers + list(get_factor_proxies().values()))), db)
+    
+    needs_betas = any(
+        scenario.kind == "factor"
+        or (scenario.kind == "historical" and any(ticker not in replays[scenario.id] for ticker in tickers))
+        for scenario in scenarios
+    )
+    
+    betas = await get_factor_betas(tickers, db, as_of) if needs_betas else pd.DataFrame(dtype=np.float64)
+    return build_shock_matrix(scenarios, tickers, betas, replays)
+
+async def run_stress_scenarios(
+    positions: List[Any],
+    scenarios: List[StressScenario],
+    db: AsyncSession,
+    as_of: Optional[date] = None,
+    include_positions: bool = True
+) -> Dict[str, Any]:
+    position_tickers = [p.ticker for p in positions]
+    tickers = list(dict.fromkeys(position_tickers))
+    position_index = pd.Index(tickers).get_indexer(position_tickers)
+    position_values = np.array([float(p.market_value or 0) for p in positions])
+    
+    shocks = await prepare_shock_matrix(scenarios, tickers, db, as_of)
+    scenario_pnl, position_pnl = evaluate_stress_scenarios(shocks, position_index, position_values, include_positions)
+    
+    return {
+        "scenarios": scenarios,
+        "tickers": tickers,
+        "shocks": shocks,
+        "position_index": position_index,
+        "position_values": position_values,
+        "portfolio_value": float(position_values.sum()),
+        "scenario_pnl": scenario_pnl,
+        "position_pnl": position_pnl
+    }
@@ -1,26 +1,100 @@
 from celery import shared_task
-from datetime import date, timedelta
+from datetime import date
 import asyncio
 
 @shared_task
 def ingest_daily_prices():
-    from backend.services.data_ingestion import bulk_ingest_prices
+    from backend.services.data_ingestion import incremental_ingest_prices, get_ingestion_universe
     from backend.core.database import AsyncSessionLocal
+    from backend.core.partitions import ensure_price_partitions
     
     async def run():
         tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA", "META", "SPY", "QQQ"]
-        end_date = date.today()
-        start_date = end_date - timedelta(days=7)
         
         async with AsyncSessionLocal() as db:
-            await bulk_ingest_prices(tickers, start_date, end_date, db)
+            await ensure_price_partitions(db, date.today().year + 1)
+            tickers = sorted(set(tickers) | set(await get_ingestion_universe(db)))
+            return await incremental_ingest_prices(db, tickers=tickers, end_date=date.today())
     
-    asyncio.run(run())
-    return {"status": "completed", "message": "Daily prices ingested"}
+    totals = asyncio.run(run())
+    return {
+        "status": "completed",
+        "message": "Daily prices ingested",
+        "tickers": totals["tickers"],
+        "up_to_date": totals["up_to_date"],
+        "inserted": totals["inserted"],
+        "skipped": totals["skipped"],
+        "quarantined": totals["quarantined"]
+    }
+
+@shared_task
+def ingest_intraday_bars():
+    from backend.services.data_ingestion import ingest_intraday_bars as ingest_bars, get_ingestion_universe
+    from backend.core.database import AsyncSessionLocal
+    
+    async def run():
+        async with AsyncSessionLocal() as db:
+            tickers = await get_ingestion_universe(db)
+        return await ingest_bars(tickers, date.today())
+    
+    written = asyncio.run(run())
+    return {"status": "completed", "message": "Intraday bars ingested", "bars": written}
+
+@shared_task
+def rollup_intraday_bars():
+    from backend.services.data_ingestion import rollup_intraday_to_daily, get_ingestion_universe
+    from backend.services.intraday_store import intraday_store
+    from backend.core.database import AsyncSessionLocal
+    
+    async def run():
+        async with AsyncSessionLocal() as db:
+            tickers = await get_ingestion_universe(db)
+            return await rollup_intraday_to_daily(tickers, date.today(), db)
+    
+    totals = asyncio.run(run())
+    removed = intraday_store.compact(date.today())
+    return {
+        "status": "completed",
+        "message": "Intraday bars rolled up",
+        "inserted": totals["inserted"],
+        "compacted_days": removed
+    }
+
+@shared_task
+def update_covariance_state():
+    from backend.services.covariance import refresh_covariance_state
+    from backend.services.data_ingestion import get_ingestion_universe
+    from backend.core.database import AsyncSessionLocal
+    
+    async def run():
+        async with AsyncSessionLocal() as db:
+            tickers = await get_ingestion_universe(db)
+            return await refresh_covariance_state(tickers, date.today(), db)
+    
+    state = asyncio.run(run())
+    
+    if state is None:
+        return {"status": "skipped", "message": "No returns available for the covariance state"}
+    
+    return {
+        "status": "completed",
+        "message": "Covariance state updated",
+        "as_of": state.as_of.isoformat(),
+        "tickers": len(state.tickers),
+        "observations": state.observations
+    }
 
 @shared_task
 def calculate_portfolio_metrics():
-    return {"status": "completed", "message": "Portfolio metrics calculated"}
+    from backend.services.batch_risk import run_batch_risk
+    from backend.core.database import AsyncSessionLocal
+    
+    async def run():
+        async with AsyncSessionLocal() as db:
+            return await run_batch_risk(db)
+    
+    summary = asyncio.run(run())
+    return {"status": "completed", "message": "Portfolio metrics calculated", **summary}
 
 @shared_task
 def run_compliance_checks():
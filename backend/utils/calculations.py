@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 
 def calculate_twrr(prices: pd.Series, cash_flows: pd.Series = None) -> float:
@@ -54,3 +54,139 @@ def calculate_information_ratio(portfolio_returns: pd.Series, benchmark_returns:
     tracking_error = active_returns.std() * np.sqrt(252)
     ir = (active_returns.mean() * 252) / tracking_error if tracking_error > 0 else 0
     return float(ir)
+
+def calculate_position_weights(positions: List[Any], tickers: List[str], portfolio_value: float) -> np.ndarray:
+    if portfolio_value <= 0:
+        return np.zeros(len(tickers))
+    
+    values = {}
+    for position in positions:
+        values[position.ticker] = values.get(position.ticker, 0.0) + float(position.market_value or 0)
+    
+    return np.array([values.get(ticker, 0.0) / portfolio_value for ticker in tickers])
+
+def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+    delta = prices.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    
+    rs = gain / loss
+    rsi = 100 - (100 / (1 + rs))
+    
+    return rsi
+
+def calculate_return_features(prices: pd.DataFrame) -> pd.DataFrame:
+    prices = prices.sort_values(['ticker', 'date'], kind='stable').reset_index(drop=True)
+    close = prices['close'].astype(np.float64)
+    by_ticker = close.groupby(prices['ticker'], sort=False)
+    
+    simple_return = by_ticker.pct_change(fill_method=None)
+    previous_close = by_ticker.shift(20)
+    delta = by_ticker.diff()
+    gain = delta.where(delta > 0, 0).groupby(prices['ticker'], sort=False).rolling(14).mean().reset_index(level=0, drop=True)
+    loss = (-delta.where(delta < 0, 0)).groupby(prices['ticker'], sort=False).rolling(14).mean().reset_index(level=0, drop=True)
+    
+    return pd.DataFrame({
+        'ticker': prices['ticker'],
+        'date': prices['date'],
+        'simple_return': simple_return,
+        'log_return': np.log1p(simple_return),
+        'volatility_20': simple_return.groupby(prices['ticker'], sort=False).rolling(20).std().reset_index(level=0, drop=True),
+        'momentum_20': close / previous_close - 1,
+        'rsi_14': 100 - (100 / (1 + gain / loss))
+    })
+
+def calculate_factor_betas(asset_returns: pd.DataFrame, factor_returns: pd.DataFrame, min_observations: int = 60) -> pd.DataFrame:
+    factors = factor_returns.dropna()
+    assets = asset_returns.reindex(factors.index)
+    
+    design = np.column_stack([np.ones(len(factors)), factors.to_numpy(dtype=np.float64)])
+    values = assets.to_numpy(dtype=np.float64)
+    observed = ~np.isnan(values)
+    k = design.shape[1]
+    
+    outer = (design[:, :, None] * design[:, None, :]).reshape(len(design), k * k)
+    gram = (observed.T.astype(np.float64) @ outer).reshape(-1, k, k)
+    moments = (design.T @ np.where(observed, values, 0.0)).T
+    
+    diagonal = np.arange(k)
+    gram[:, diagonal, diagonal] = gram[:, diagonal, diagonal] * (1 + 1e-10) + 1e-12
+    
+    betas = np.full((values.shape[1], k - 1), np.nan)
+    enough = observed.sum(axis=0) >= max(min_observations, k + 1)
+    
+    if enough.any():
+        betas[enough] = np.linalg.solve(gram[enough], moments[enough][..., None])[:, 1:, 0]
+    
+    return pd.DataFrame(betas, index=asset_returns.columns, columns=factor_returns.columns)
+
+def evaluate_stress_scenarios(
+    shocks: np.ndarray,
+    position_index: np.ndarray,
+    position_values: np.ndarray,
+    include_positions: bool = True
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    exposures = np.bincount(position_index, weights=position_values, minlength=shocks.shape[1])
+    scenario_pnl = shocks @ exposures
+    
+    if not include_positions:
+        return scenario_pnl, None
+    
+    if len(position_index) == shocks.shape[1] and np.array_equal(position_index, np.arange(shocks.shape[1])):
+        return scenario_pnl, shocks * position_values
+    
+    return scenario_pnl, np.take(shocks, position_index, axis=1) * position_values
+
+def _historical_tail(book: np.ndarray, levels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    thresholds = np.nanquantile(book, 1 - levels, axis=0)
+    tail_means = np.empty_like(thresholds)
+    for i, threshold in enumerate(thresholds):
+        in_tail = book <= threshold
+        tail_means[i] = np.where(in_tail, book, 0.0).sum(axis=0) / in_tail.sum(axis=0)
+    
+    return np.maximum(-thresholds, 0.0), np.maximum(-tail_means, 0.0)
+
+def calculate_batch_var(
+    pnl: np.ndarray,
+    confidence_levels: List[float],
+    complete: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    from scipy.stats import norm
+    
+    levels = np.asarray(confidence_levels, dtype=np.float64)
+    standalone = pnl if complete is None else np.where(complete, pnl, np.nan)
+    firm_pnl = pnl.sum(axis=1)
+    
+    var, cvar = _historical_tail(standalone, levels)
+    firm_var, firm_cvar = _historical_tail(firm_pnl[:, None], levels)
+    same_rows_var, _ = _historical_tail(pnl, levels)
+    
+    volatility = np.nanstd(standalone, axis=0, ddof=1)
+    firm_volatility = firm_pnl.std(ddof=1)
+    
+    centered = pnl - pnl.mean(axis=0)
+    covariance_with_firm = centered.T @ (firm_pnl - firm_pnl.mean()) / (len(pnl) - 1)
+    marginal = covariance_with_firm / firm_volatility if firm_volatility > 0 else np.zeros(pnl.shape[1])
+    
+    return {
+        "var": var,
+        "cvar": cvar,
+        "volatility": volatility,
+        "firm_var": firm_var[:, 0],
+        "firm_cvar": firm_cvar[:, 0],
+        "firm_volatility": firm_volatility,
+        "component_var": np.outer(norm.ppf(levels), marginal),
+        "diversification": same_rows_var.sum(axis=1) - firm_var[:, 0]
+    }
+
+def calculate_firm_risk(returns: np.ndarray, shocks: np.ndarray, exposures: Any, confidence_levels: List[float]) -> Dict[str, np.ndarray]:
+    missing = np.isnan(returns)
+    pnl = np.asarray((exposures @ np.where(missing, 0.0, returns).T).T)
+    
+    held = (exposures != 0).astype(np.float64)
+    complete = np.asarray((held @ missing.T.astype(np.float64)).T) == 0
+    
+    risk = calculate_batch_var(pnl, confidence_levels, complete)
+    risk["stress_pnl"] = np.asarray((exposures @ shocks.T).T)
+    
+    return risk
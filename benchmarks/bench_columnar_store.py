@@ -0,0 +1,84 @@
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from sqlalchemy import delete
+
+from backend.core.database import AsyncSessionLocal
+from backend.core.models import PriceData
+from backend.services.columnar_store import ColumnarPriceStore
+from backend.services.data_ingestion import build_price_records, query_price_series, store_price_data
+
+TICKER_COUNTS = [10, 100, 1000]
+LOOKBACK_DAYS = 1260
+TICKER_PREFIX = "BENCH"
+REPEATS = 5
+
+def synthetic_prices(tickers, start_date, end_date) -> pd.DataFrame:
+    dates = pd.bdate_range(start_date, end_date)
+    rng = np.random.default_rng(42)
+    frames = []
+    
+    for ticker in tickers:
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+        frames.append(pd.DataFrame({
+            "date": dates,
+            "ticker": ticker,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": 1_000_000
+        }))
+    
+    return pd.concat(frames, ignore_index=True)
+
+def best_of(timings) -> float:
+    return min(timings)
+
+async def main():
+    end_date = date.today()
+    start_date = end_date - timedelta(days=LOOKBACK_DAYS)
+    tickers = [f"{TICKER_PREFIX}{i:04d}" for i in range(max(TICKER_COUNTS))]
+    prices = synthetic_prices(tickers, start_date, end_date)
+    
+    store = ColumnarPriceStore(tempfile.mkdtemp(prefix="price_store_"))
+    store.write(build_price_records(prices))
+    
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(PriceData).where(PriceData.ticker.like(f"{TICKER_PREFIX}%")))
+        await store_price_data(prices, db)
+        
+        print(f"{'tickers':>8} {'sql (s)':>10} {'columnar (s)':>14} {'speedup':>9}")
+        
+        for count in TICKER_COUNTS:
+            subset = tickers[:count]
+            
+            sql_timings = []
+            columnar_timings = []
+            for _ in range(REPEATS):
+                started = time.perf_counter()
+                await query_price_series(subset, start_date, end_date, db)
+                sql_timings.append(time.perf_counter() - started)
+                
+                started = time.perf_counter()
+                series = store.read_many(subset, start_date, end_date)
+                sum(float(s.columns['close'].sum()) for s in series.values())
+                columnar_timings.append(time.perf_counter() - started)
+            
+            sql_seconds = best_of(sql_timings)
+            columnar_seconds = best_of(columnar_timings)
+            print(f"{count:>8} {sql_seconds:>10.4f} {columnar_seconds:>14.4f} {sql_seconds / columnar_seconds:>8.1f}x")
+        
+        await db.execute(delete(PriceData).where(PriceData.ticker.like(f"{TICKER_PREFIX}%")))
+        await db.commit()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from backend.services.covariance_store import CovarianceStore, EWMACovariance
+
+TICKERS = 3000
+HISTORY_DAYS = 756
+PORTFOLIO_TICKERS = 200
+
+def main():
+    rng = np.random.default_rng(42)
+    returns = pd.DataFrame(
+        rng.normal(0, 0.01, (HISTORY_DAYS + 1, TICKERS)),
+        index=pd.bdate_range('2022-01-03', periods=HISTORY_DAYS + 1),
+        columns=[f"BENCH{i:04d}" for i in range(TICKERS)]
+    )
+    
+    started = time.perf_counter()
+    returns.iloc[1:].cov()
+    print(f"Sample covariance over {HISTORY_DAYS} days x {TICKERS} tickers: {time.perf_counter() - started:.2f}s")
+    
+    started = time.perf_counter()
+    state = EWMACovariance.from_returns(returns.iloc[:-1], decay=0.94)
+    print(f"  EWMA warm-up from history: {time.perf_counter() - started:.2f}s")
+    
+    started = time.perf_counter()
+    state.update_frame(returns.iloc[-1:])
+    print(f"  one-day EWMA update: {(time.perf_counter() - started) * 1000:.0f} ms")
+    
+    with tempfile.TemporaryDirectory() as root:
+        store = CovarianceStore(root, retain_versions=5)
+        
+        started = time.perf_counter()
+        store.save("firm", state)
+        print(f"  save state: {(time.perf_counter() - started) * 1000:.0f} ms")
+        
+        tickers = list(rng.choice(state.tickers, PORTFOLIO_TICKERS, replace=False))
+        started = time.perf_counter()
+        store.load("firm").select(tickers)
+        print(f"  load {PORTFOLIO_TICKERS}-ticker covariance from the store: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
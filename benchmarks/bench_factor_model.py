@@ -0,0 +1,95 @@
+import gc
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from backend.services.covariance_store import FactorCovariance
+from backend.services.monte_carlo import simulate_portfolio_var
+
+SIZES = [1000, 5000, 10000]
+HISTORY_DAYS = 252
+FACTORS = 20
+SIMULATIONS = 8192
+FRONTIER_PORTFOLIOS = 200
+
+def make_returns(rng: np.random.Generator, tickers: int) -> pd.DataFrame:
+    factors = rng.normal(0, 0.01, (HISTORY_DAYS, 8))
+    loadings = rng.normal(0.5, 0.5, (tickers, 8))
+    return pd.DataFrame(
+        factors @ loadings.T + rng.normal(0, 0.015, (HISTORY_DAYS, tickers)),
+        columns=[f"BENCH{i:05d}" for i in range(tickers)]
+    )
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+def dense_average_correlation(covariance: np.ndarray) -> float:
+    inverse_std = 1 / np.sqrt(np.diag(covariance))
+    correlation = covariance * np.outer(inverse_std, inverse_std)
+    return float(correlation[np.triu_indices(len(covariance), 1)].mean())
+
+def dense_path(returns: pd.DataFrame, weights: np.ndarray, frontier: np.ndarray) -> dict:
+    timings = {}
+    covariance, timings["estimate"] = timed(lambda: returns.cov().to_numpy())
+    timings["memory_mb"] = covariance.nbytes / 1e6
+    
+    sigma, timings["parametric"] = timed(lambda: np.sqrt(weights @ covariance @ weights))
+    _, timings["correlation"] = timed(dense_average_correlation, covariance)
+    _, timings["frontier"] = timed(lambda: np.einsum('ij,jk,ik->i', frontier, covariance, frontier))
+    simulation, timings["monte_carlo"] = timed(
+        simulate_portfolio_var, returns.mean().to_numpy(), covariance, weights, [0.99],
+        simulations=SIMULATIONS, sampler="pseudo", seed=1
+    )
+    timings["var"] = abs(stats.norm.ppf(0.01) * sigma)
+    timings["mc_var"] = simulation["var"][0]
+    return timings
+
+def factor_path(returns: pd.DataFrame, weights: np.ndarray, frontier: np.ndarray) -> dict:
+    timings = {}
+    model, timings["estimate"] = timed(FactorCovariance.from_returns, returns, FACTORS)
+    timings["memory_mb"] = model.nbytes / 1e6
+    
+    variance, timings["parametric"] = timed(model.portfolio_variance, weights)
+    _, timings["correlation"] = timed(model.average_correlation)
+    _, timings["frontier"] = timed(model.portfolio_variance, frontier)
+    simulation, timings["monte_carlo"] = timed(
+        simulate_portfolio_var, model.mean, model, weights, [0.99],
+        simulations=SIMULATIONS, sampler="pseudo", seed=1
+    )
+    timings["var"] = abs(stats.norm.ppf(0.01) * np.sqrt(variance))
+    timings["mc_var"] = simulation["var"][0]
+    return timings
+
+def main():
+    rng = np.random.default_rng(42)
+    simulate_portfolio_var(np.zeros(2), np.eye(2), np.full(2, 0.5), [0.99], simulations=1024, seed=1)
+    
+    for tickers in SIZES:
+        returns = make_returns(rng, tickers)
+        weights = np.full(tickers, 1 / tickers)
+        frontier = rng.random((FRONTIER_PORTFOLIOS, tickers))
+        frontier /= frontier.sum(axis=1, keepdims=True)
+        
+        print(f"{tickers} tickers x {HISTORY_DAYS} days, {FACTORS} factors, {SIMULATIONS} Monte Carlo paths")
+        for label, path in [("dense", dense_path), ("factor", factor_path)]:
+            timings = path(returns, weights, frontier)
+            print(
+                f"  {label:>6}: covariance {timings['memory_mb']:8.1f} MB in {timings['estimate']:6.2f}s"
+                f" | parametric {timings['parametric'] * 1000:7.1f} ms"
+                f" | avg correlation {timings['correlation'] * 1000:7.1f} ms"
+                f" | {FRONTIER_PORTFOLIOS} frontier vols {timings['frontier'] * 1000:7.1f} ms"
+                f" | Monte Carlo {timings['monte_carlo']:6.2f}s"
+                f" | 99% VaR {timings['var']:.5f} (MC {timings['mc_var']:.5f})"
+            )
+            gc.collect()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from backend.services.intraday_store import IntradayBarStore
+
+TICKERS = 500
+MINUTES = 390
+REPEATS = 10
+
+def synthetic_bars(tickers, day: date) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    timestamps = pd.date_range(f"{day.isoformat()} 14:30", periods=MINUTES, freq="1min")
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.0005, (len(tickers), MINUTES)), axis=1)
+    
+    return pd.DataFrame({
+        'ticker': np.repeat(tickers, MINUTES),
+        'timestamp': np.tile(timestamps, len(tickers)),
+        'open': closes.ravel(),
+        'high': closes.ravel() * 1.001,
+        'low': closes.ravel() * 0.999,
+        'close': closes.ravel(),
+        'volume': rng.integers(100, 10000, closes.size).astype(np.float64)
+    })
+
+def main():
+    day = date(2024, 3, 1)
+    tickers = [f"BENCH{i:04d}" for i in range(TICKERS)]
+    
+    with tempfile.TemporaryDirectory() as root:
+        store = IntradayBarStore(root, retention_days={"1m": 0, "5m": 0, "1h": 0})
+        
+        started = time.perf_counter()
+        written = store.write(synthetic_bars(tickers, day))
+        print(f"Wrote {written:,} minute bars with rollups in {time.perf_counter() - started:.2f}s")
+        
+        for resolution in ["1m", "5m", "1h"]:
+            timings = []
+            for _ in range(REPEATS):
+                started = time.perf_counter()
+                bars = store.read_day(tickers, day, resolution)
+                sum(float(b['close'][-1]) for b in bars.values())
+                timings.append(time.perf_counter() - started)
+            
+            assert len(bars) == TICKERS
+            print(f"  read_day {resolution}: {np.median(timings) * 1000:.1f} ms for {TICKERS} tickers")
+        
+        started = time.perf_counter()
+        store.daily_bars(tickers, day)
+        print(f"  daily rollup: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from sqlalchemy import delete, insert
+
+from backend.core.database import AsyncSessionLocal
+from backend.core.models import PriceData
+from backend.services.data_ingestion import get_prices_from_db, get_price_matrix
+
+TICKER_COUNTS = [10, 100, 1000]
+LOOKBACK_DAYS = 365
+TICKER_PREFIX = "BENCH"
+
+async def seed_prices(db, tickers, start_date, end_date):
+    dates = pd.bdate_range(start_date, end_date).date
+    rng = np.random.default_rng(42)
+    
+    for ticker in tickers:
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+        rows = [{
+            "ticker": ticker,
+            "date": d,
+            "open": float(c),
+            "high": float(c),
+            "low": float(c),
+            "close": float(c),
+            "volume": 1_000_000,
+            "adjusted_close": float(c)
+        } for d, c in zip(dates, closes)]
+        await db.execute(insert(PriceData), rows)
+    
+    await db.commit()
+
+async def time_per_ticker(db, tickers, start_date, end_date) -> float:
+    started = time.perf_counter()
+    series = {}
+    for ticker in tickers:
+        prices_df = await get_prices_from_db(ticker, start_date, end_date, db)
+        if not prices_df.empty:
+            series[ticker] = prices_df.set_index('date')['close']
+    pd.DataFrame(series)
+    return time.perf_counter() - started
+
+async def time_matrix(db, tickers, start_date, end_date) -> float:
+    started = time.perf_counter()
+    await get_price_matrix(tickers, start_date, end_date, db)
+    return time.perf_counter() - started
+
+async def main():
+    end_date = date.today()
+    start_date = end_date - timedelta(days=LOOKBACK_DAYS)
+    tickers = [f"{TICKER_PREFIX}{i:04d}" for i in range(max(TICKER_COUNTS))]
+    
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(PriceData).where(PriceData.ticker.like(f"{TICKER_PREFIX}%")))
+        await seed_prices(db, tickers, start_date, end_date)
+        
+        print(f"{'tickers':>8} {'per-ticker (s)':>16} {'matrix (s)':>12} {'speedup':>9}")
+        
+        for count in TICKER_COUNTS:
+            subset = tickers[:count]
+            loop_seconds = await time_per_ticker(db, subset, start_date, end_date)
+            matrix_seconds = await time_matrix(db, subset, start_date, end_date)
+            print(f"{count:>8} {loop_seconds:>16.3f} {matrix_seconds:>12.3f} {loop_seconds / matrix_seconds:>8.1f}x")
+        
+        await db.execute(delete(PriceData).where(PriceData.ticker.like(f"{TICKER_PREFIX}%")))
+        await db.commit()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datetime import date, timedelta
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
+
+from backend.core.config import settings
+from backend.core.partitions import price_partition_ddl, price_brin_ddl, is_cold_year
+from backend.services.data_ingestion import get_prices_from_db, get_price_matrix
+
+TICKERS = 10000
+YEARS = 20
+LOOKBACK_DAYS = 1260
+MATRIX_TICKER_COUNTS = [10, 100, 500]
+REPEATS = 20
+
+LAYOUTS = ["bench_single_column", "bench_composite", "bench_partitioned"]
+
+PRICE_DATA_COLUMNS = (
+    "id serial, "
+    "ticker varchar(20) NOT NULL, "
+    "date date NOT NULL, "
+    "open numeric(20, 4), "
+    "high numeric(20, 4), "
+    "low numeric(20, 4), "
+    "close numeric(20, 4) NOT NULL, "
+    "volume bigint, "
+    "adjusted_close numeric(20, 4), "
+    "created_at timestamptz DEFAULT now()"
+)
+
+def layout_engine(schema: str):
+    return create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": f"{schema},public"}}
+    )
+
+async def create_layout(db: AsyncSession, schema: str, start_date: date, end_date: date):
+    await db.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    await db.execute(text(f"CREATE SCHEMA {schema}"))
+    
+    if schema == "bench_partitioned":
+        await db.execute(text(
+            f"CREATE TABLE price_data ({PRICE_DATA_COLUMNS}, PRIMARY KEY (id, date)) PARTITION BY RANGE (date)"
+        ))
+        for year in range(start_date.year, end_date.year + 2):
+            for statement in price_partition_ddl(year):
+                await db.execute(text(statement))
+    else:
+        await db.execute(text(f"CREATE TABLE price_data ({PRICE_DATA_COLUMNS}, PRIMARY KEY (id))"))
+    
+    await db.execute(text(
+        "INSERT INTO price_data (ticker, date, open, high, low, close, volume, adjusted_close) "
+        "SELECT ticker, d::date, c, c, c, c, 1000000, c FROM ("
+        "  SELECT 'BENCH' || lpad(t::text, 5, '0') AS ticker, d, "
+        "         round((100 + 20 * sin(t + extract(epoch FROM d) / 2592000))::numeric, 4) AS c "
+        "  FROM generate_series(1, :tickers) AS t "
+        "  CROSS JOIN generate_series(CAST(:start_date AS date), CAST(:end_date AS date), interval '1 day') AS d "
+        "  WHERE extract(isodow FROM d) < 6"
+        ") AS bars"
+    ), {"tickers": TICKERS, "start_date": start_date, "end_date": end_date})
+    
+    if schema == "bench_single_column":
+        await db.execute(text("CREATE INDEX ix_price_data_ticker ON price_data (ticker)"))
+        await db.execute(text("CREATE INDEX ix_price_data_date ON price_data (date)"))
+    else:
+        await db.execute(text(
+            "ALTER TABLE price_data ADD CONSTRAINT uq_price_data_ticker_date UNIQUE (ticker, date)"
+        ))
+        await db.execute(text("CREATE INDEX ix_price_data_date ON price_data (date)"))
+    
+    if schema == "bench_partitioned":
+        for year in range(start_date.year, end_date.year + 1):
+            if is_cold_year(year):
+                for statement in price_brin_ddl(year):
+                    await db.execute(text(statement))
+    
+    await db.execute(text("ANALYZE price_data"))
+    await db.commit()
+
+async def explain_range_query(db: AsyncSession, tickers, start_date: date, end_date: date) -> str:
+    result = await db.execute(text(
+        "EXPLAIN (ANALYZE, BUFFERS) "
+        "SELECT ticker, date, CAST(close AS float8) FROM price_data "
+        "WHERE ticker = ANY(:tickers) AND date >= :start_date AND date <= :end_date "
+        "ORDER BY ticker, date"
+    ), {"tickers": tickers, "start_date": start_date, "end_date": end_date})
+    
+    return "\n".join(row[0] for row in result.all())
+
+async def time_single_ticker(db: AsyncSession, start_date: date, end_date: date) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        ticker = f"BENCH{random.randint(1, TICKERS):05d}"
+        started = time.perf_counter()
+        await get_prices_from_db(ticker, start_date, end_date, db)
+        timings.append(time.perf_counter() - started)
+    
+    return statistics.median(timings)
+
+async def time_matrix(db: AsyncSession, count: int, start_date: date, end_date: date) -> float:
+    timings = []
+    for _ in range(max(REPEATS // 4, 1)):
+        tickers = [f"BENCH{i:05d}" for i in random.sample(range(1, TICKERS + 1), count)]
+        started = time.perf_counter()
+        await get_price_matrix(tickers, start_date, end_date, db)
+        timings.append(time.perf_counter() - started)
+    
+    return statistics.median(timings)
+
+async def main():
+    settings.PRICE_CACHE_ENABLED = False
+    settings.PRICE_STORE_BACKEND = "sql"
+    
+    end_date = date.today()
+    start_date = end_date - timedelta(days=365 * YEARS)
+    query_start = end_date - timedelta(days=LOOKBACK_DAYS)
+    results = {}
+    
+    for schema in LAYOUTS:
+        engine = layout_engine(schema)
+        sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        
+        async with sessions() as db:
+            print(f"Building {schema} with {TICKERS} tickers over {YEARS} years...")
+            started = time.perf_counter()
+            await create_layout(db, schema, start_date, end_date)
+            row_count = (await db.execute(text("SELECT count(*) FROM price_data"))).scalar()
+            print(f"  {row_count:,} rows loaded in {time.perf_counter() - started:.0f}s")
+            
+            sample = [f"BENCH{i:05d}" for i in random.sample(range(1, TICKERS + 1), 100)]
+            print(await explain_range_query(db, sample, query_start, end_date))
+            
+            results[schema] = {"single": await time_single_ticker(db, query_start, end_date)}
+            for count in MATRIX_TICKER_COUNTS:
+                results[schema][count] = await time_matrix(db, count, query_start, end_date)
+            
+            await db.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            await db.commit()
+        
+        await engine.dispose()
+    
+    header = f"{'layout':>20} {'1 ticker (ms)':>14}" + "".join(f" {f'{c} tickers (ms)':>16}" for c in MATRIX_TICKER_COUNTS)
+    print(header)
+    for schema, timings in results.items():
+        row = f"{schema:>20} {timings['single'] * 1000:>14.1f}"
+        row += "".join(f" {timings[count] * 1000:>16.1f}" for count in MATRIX_TICKER_COUNTS)
+        print(row)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.calculations import calculate_factor_betas, evaluate_stress_scenarios
+
+SCENARIOS = 1000
+POSITIONS = 5000
+FACTORS = 5
+OBSERVATIONS = 504
+REPEATS = 20
+
+def legacy_loop(shocks: np.ndarray, position_index: np.ndarray, position_values: np.ndarray) -> np.ndarray:
+    totals = np.empty(len(shocks))
+    for s in range(len(shocks)):
+        total = 0.0
+        for ticker, value in zip(position_index, position_values):
+            total += value * (1 + shocks[s, ticker]) - value
+        totals[s] = total
+    return totals
+
+def main():
+    rng = np.random.default_rng(42)
+    shocks = rng.uniform(-0.6, 0.1, (SCENARIOS, POSITIONS))
+    position_index = np.arange(POSITIONS)
+    position_values = rng.uniform(1e3, 1e6, POSITIONS)
+    
+    for include_positions in [False, True]:
+        timings = []
+        for _ in range(REPEATS):
+            started = time.perf_counter()
+            evaluate_stress_scenarios(shocks, position_index, position_values, include_positions)
+            timings.append(time.perf_counter() - started)
+        
+        label = "with per-position P&L" if include_positions else "scenario totals only"
+        print(f"{SCENARIOS} scenarios x {POSITIONS} positions, {label}: {np.median(timings) * 1000:.1f} ms")
+    
+    lots = rng.integers(0, POSITIONS, POSITIONS)
+    started = time.perf_counter()
+    evaluate_stress_scenarios(shocks, lots, position_values)
+    print(f"  with repeated tickers across lots: {(time.perf_counter() - started) * 1000:.1f} ms")
+    
+    started = time.perf_counter()
+    expected = legacy_loop(shocks[:20], position_index, position_values)
+    legacy = (time.perf_counter() - started) / 20 * SCENARIOS
+    assert np.allclose(expected, evaluate_stress_scenarios(shocks[:20], position_index, position_values, False)[0])
+    print(f"  per-position Python loop (extrapolated): {legacy * 1000:.0f} ms")
+    
+    factors = pd.DataFrame(rng.normal(0, 0.01, (OBSERVATIONS, FACTORS)))
+    assets = pd.DataFrame(factors.to_numpy() @ rng.normal(1, 0.5, (FACTORS, POSITIONS)) + rng.normal(0, 0.01, (OBSERVATIONS, POSITIONS)))
+    assets.iloc[:200, ::7] = np.nan
+    
+    started = time.perf_counter()
+    betas = calculate_factor_betas(assets, factors)
+    print(f"  factor betas for {POSITIONS} tickers on {FACTORS} factors: {(time.perf_counter() - started) * 1000:.0f} ms")
+    
+    moves = rng.uniform(-0.2, 0.05, (SCENARIOS, FACTORS))
+    started = time.perf_counter()
+    moves @ betas.to_numpy().T
+    print(f"  {SCENARIOS} factor scenarios to shock vectors: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
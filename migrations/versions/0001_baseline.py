@@ -0,0 +1,212 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TABLES = ["transactions", "risk_metrics", "positions", "orders", "compliance_violations", "portfolios", "users", "price_data", "compliance_rules"]
+ENUMS = ["userrole", "assetclass", "orderstatus"]
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table("users"):
+        return
+    
+    op.create_table("compliance_rules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("rule_type", sa.String(length=50), nullable=False),
+        sa.Column("parameters", sa.JSON(), nullable=False),
+        sa.Column("severity", sa.String(length=20), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_compliance_rules_id", "compliance_rules", ["id"], unique=False)
+    
+    op.create_table("price_data",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ticker", sa.String(length=20), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("open", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("high", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("low", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("close", sa.Numeric(precision=20, scale=4), nullable=False),
+        sa.Column("volume", sa.BigInteger(), nullable=True),
+        sa.Column("adjusted_close", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_price_data_date", "price_data", ["date"], unique=False)
+    op.create_index("ix_price_data_id", "price_data", ["id"], unique=False)
+    op.create_index("ix_price_data_ticker", "price_data", ["ticker"], unique=False)
+    
+    op.create_table("users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("full_name", sa.String(length=255), nullable=True),
+        sa.Column("role", sa.Enum("ADMIN", "PORTFOLIO_MANAGER", "ANALYST", "CLIENT", "COMPLIANCE", name="userrole"), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"], unique=False)
+    
+    op.create_table("portfolios",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("strategy", sa.String(length=100), nullable=True),
+        sa.Column("benchmark", sa.String(length=50), nullable=True),
+        sa.Column("inception_date", sa.Date(), nullable=False),
+        sa.Column("base_currency", sa.String(length=3), nullable=True),
+        sa.Column("aum", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("owner_id", sa.Integer(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_portfolios_id", "portfolios", ["id"], unique=False)
+    op.create_index("ix_portfolios_name", "portfolios", ["name"], unique=False)
+    
+    op.create_table("compliance_violations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=True),
+        sa.Column("rule_id", sa.Integer(), nullable=True),
+        sa.Column("violation_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("severity", sa.String(length=20), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("resolved", sa.Boolean(), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("resolved_by", sa.Integer(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.ForeignKeyConstraint(["resolved_by"], ["users.id"]),
+        sa.ForeignKeyConstraint(["rule_id"], ["compliance_rules.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_compliance_violations_id", "compliance_violations", ["id"], unique=False)
+    op.create_index("ix_compliance_violations_portfolio_id", "compliance_violations", ["portfolio_id"], unique=False)
+    op.create_index("ix_compliance_violations_rule_id", "compliance_violations", ["rule_id"], unique=False)
+    op.create_index("ix_compliance_violations_violation_date", "compliance_violations", ["violation_date"], unique=False)
+    
+    op.create_table("orders",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=False),
+        sa.Column("ticker", sa.String(length=20), nullable=False),
+        sa.Column("order_type", sa.String(length=20), nullable=False),
+        sa.Column("side", sa.String(length=10), nullable=False),
+        sa.Column("quantity", sa.Numeric(precision=20, scale=6), nullable=False),
+        sa.Column("price", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("stop_price", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("status", sa.Enum("PENDING", "SUBMITTED", "FILLED", "PARTIALLY_FILLED", "CANCELLED", "REJECTED", name="orderstatus"), nullable=True),
+        sa.Column("filled_quantity", sa.Numeric(precision=20, scale=6), nullable=True),
+        sa.Column("average_fill_price", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("broker", sa.String(length=50), nullable=True),
+        sa.Column("broker_order_id", sa.String(length=100), nullable=True),
+        sa.Column("submitted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("filled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("cancelled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_orders_id", "orders", ["id"], unique=False)
+    op.create_index("ix_orders_portfolio_id", "orders", ["portfolio_id"], unique=False)
+    op.create_index("ix_orders_status", "orders", ["status"], unique=False)
+    op.create_index("ix_orders_ticker", "orders", ["ticker"], unique=False)
+    
+    op.create_table("positions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=False),
+        sa.Column("ticker", sa.String(length=20), nullable=False),
+        sa.Column("asset_class", sa.Enum("EQUITY", "FIXED_INCOME", "DERIVATIVE", "ALTERNATIVE", "CASH", "CRYPTO", name="assetclass"), nullable=True),
+        sa.Column("shares", sa.Numeric(precision=20, scale=6), nullable=False),
+        sa.Column("cost_basis", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("current_price", sa.Numeric(precision=20, scale=4), nullable=True),
+        sa.Column("market_value", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("unrealized_pnl", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("weight", sa.Float(), nullable=True),
+        sa.Column("currency", sa.String(length=3), nullable=True),
+        sa.Column("opened_date", sa.Date(), nullable=True),
+        sa.Column("last_updated", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_positions_id", "positions", ["id"], unique=False)
+    op.create_index("ix_positions_portfolio_id", "positions", ["portfolio_id"], unique=False)
+    op.create_index("ix_positions_ticker", "positions", ["ticker"], unique=False)
+    
+    op.create_table("risk_metrics",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=False),
+        sa.Column("calculation_date", sa.Date(), nullable=False),
+        sa.Column("var_95", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("var_99", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("cvar_95", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("cvar_99", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("volatility", sa.Float(), nullable=True),
+        sa.Column("sharpe_ratio", sa.Float(), nullable=True),
+        sa.Column("sortino_ratio", sa.Float(), nullable=True),
+        sa.Column("max_drawdown", sa.Float(), nullable=True),
+        sa.Column("beta", sa.Float(), nullable=True),
+        sa.Column("alpha", sa.Float(), nullable=True),
+        sa.Column("tracking_error", sa.Float(), nullable=True),
+        sa.Column("information_ratio", sa.Float(), nullable=True),
+        sa.Column("correlation_to_benchmark", sa.Float(), nullable=True),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_risk_metrics_calculation_date", "risk_metrics", ["calculation_date"], unique=False)
+    op.create_index("ix_risk_metrics_id", "risk_metrics", ["id"], unique=False)
+    op.create_index("ix_risk_metrics_portfolio_id", "risk_metrics", ["portfolio_id"], unique=False)
+    
+    op.create_table("transactions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=False),
+        sa.Column("ticker", sa.String(length=20), nullable=False),
+        sa.Column("transaction_type", sa.String(length=20), nullable=False),
+        sa.Column("shares", sa.Numeric(precision=20, scale=6), nullable=False),
+        sa.Column("price", sa.Numeric(precision=20, scale=4), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("fees", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column("transaction_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("settlement_date", sa.Date(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("metadata", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_transactions_id", "transactions", ["id"], unique=False)
+    op.create_index("ix_transactions_portfolio_id", "transactions", ["portfolio_id"], unique=False)
+    op.create_index("ix_transactions_ticker", "transactions", ["ticker"], unique=False)
+    op.create_index("ix_transactions_transaction_date", "transactions", ["transaction_date"], unique=False)
+
+def downgrade():
+    for table in TABLES:
+        op.drop_table(table)
+    bind = op.get_bind()
+    for name in ENUMS:
+        sa.Enum(name=name).drop(bind=bind, checkfirst=True)
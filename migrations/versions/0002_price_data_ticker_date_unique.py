@@ -0,0 +1,41 @@
+"""unique composite (ticker, date) index on price_data
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.execute(
+        "DELETE FROM price_data WHERE id NOT IN "
+        "(SELECT MAX(id) FROM price_data GROUP BY ticker, date)"
+    )
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_price_data_ticker_date",
+            "price_data",
+            ["ticker", "date"],
+            unique=True,
+            if_not_exists=True,
+            postgresql_concurrently=True
+        )
+        op.drop_index("ix_price_data_ticker", table_name="price_data", if_exists=True)
+
+def downgrade():
+    op.create_index("ix_price_data_ticker", "price_data", ["ticker"], if_not_exists=True)
+    
+    bind = op.get_bind()
+    constraints = {c["name"] for c in sa.inspect(bind).get_unique_constraints("price_data")}
+    
+    if "uq_price_data_ticker_date" in constraints:
+        op.drop_constraint("uq_price_data_ticker_date", "price_data", type_="unique")
+    else:
+        op.drop_index("uq_price_data_ticker_date", table_name="price_data", if_exists=True)
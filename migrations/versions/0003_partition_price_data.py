@@ -0,0 +1,115 @@
+"""optionally range-partition price_data by year on PostgreSQL
+
+Run with ``alembic -x partition_prices=true upgrade head`` to partition.
+Without the flag the revision only records that partitioning was skipped;
+downgrade to 0002 and upgrade again with the flag to partition later.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from datetime import date
+from alembic import op, context
+
+from backend.core.partitions import price_partition_ddl, price_brin_ddl, is_cold_year
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+PRICE_DATA_COLUMNS = "id, ticker, date, open, high, low, close, volume, adjusted_close, created_at"
+
+def _is_partitioned(bind) -> bool:
+    return bind.exec_driver_sql(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('price_data')"
+    ).scalar() is not None
+
+def upgrade():
+    bind = op.get_bind()
+    enabled = context.get_x_argument(as_dictionary=True).get("partition_prices", "false").lower() == "true"
+    
+    if bind.dialect.name != "postgresql" or not enabled or _is_partitioned(bind):
+        return
+    
+    bounds = bind.exec_driver_sql("SELECT MIN(date), MAX(date) FROM price_data").one()
+    first_year = bounds[0].year if bounds[0] else date.today().year
+    last_year = max(bounds[1].year if bounds[1] else first_year, date.today().year + 1)
+    
+    op.execute("ALTER TABLE price_data RENAME TO price_data_unpartitioned")
+    op.execute("ALTER TABLE price_data_unpartitioned RENAME CONSTRAINT price_data_pkey TO price_data_unpartitioned_pkey")
+    op.execute("ALTER INDEX IF EXISTS uq_price_data_ticker_date RENAME TO uq_price_data_unpartitioned_ticker_date")
+    op.execute("ALTER INDEX IF EXISTS ix_price_data_date RENAME TO ix_price_data_unpartitioned_date")
+    
+    op.execute(
+        "CREATE TABLE price_data ("
+        "id integer NOT NULL DEFAULT nextval('price_data_id_seq'), "
+        "ticker varchar(20) NOT NULL, "
+        "date date NOT NULL, "
+        "open numeric(20, 4), "
+        "high numeric(20, 4), "
+        "low numeric(20, 4), "
+        "close numeric(20, 4) NOT NULL, "
+        "volume bigint, "
+        "adjusted_close numeric(20, 4), "
+        "created_at timestamptz DEFAULT now(), "
+        "PRIMARY KEY (id, date), "
+        "CONSTRAINT uq_price_data_ticker_date UNIQUE (ticker, date)"
+        ") PARTITION BY RANGE (date)"
+    )
+    op.execute("ALTER SEQUENCE price_data_id_seq OWNED BY price_data.id")
+    op.execute("CREATE INDEX ix_price_data_date ON price_data (date)")
+    
+    for year in range(first_year, last_year + 1):
+        for statement in price_partition_ddl(year):
+            op.execute(statement)
+    op.execute("CREATE TABLE price_data_default PARTITION OF price_data DEFAULT")
+    
+    op.execute(
+        f"INSERT INTO price_data ({PRICE_DATA_COLUMNS}) "
+        f"SELECT {PRICE_DATA_COLUMNS} FROM price_data_unpartitioned"
+    )
+    op.execute("DROP TABLE price_data_unpartitioned")
+    
+    for year in range(first_year, last_year + 1):
+        if is_cold_year(year):
+            for statement in price_brin_ddl(year):
+                op.execute(statement)
+    
+    op.execute("ANALYZE price_data")
+
+def downgrade():
+    bind = op.get_bind()
+    
+    if bind.dialect.name != "postgresql" or not _is_partitioned(bind):
+        return
+    
+    op.execute("ALTER TABLE price_data RENAME TO price_data_partitioned")
+    op.execute("ALTER TABLE price_data_partitioned RENAME CONSTRAINT price_data_pkey TO price_data_partitioned_pkey")
+    op.execute("ALTER TABLE price_data_partitioned DROP CONSTRAINT uq_price_data_ticker_date")
+    op.execute("ALTER INDEX IF EXISTS ix_price_data_date RENAME TO ix_price_data_partitioned_date")
+    
+    op.execute(
+        "CREATE TABLE price_data ("
+        "id integer PRIMARY KEY DEFAULT nextval('price_data_id_seq'), "
+        "ticker varchar(20) NOT NULL, "
+        "date date NOT NULL, "
+        "open numeric(20, 4), "
+        "high numeric(20, 4), "
+        "low numeric(20, 4), "
+        "close numeric(20, 4) NOT NULL, "
+        "volume bigint, "
+        "adjusted_close numeric(20, 4), "
+        "created_at timestamptz DEFAULT now(), "
+        "CONSTRAINT uq_price_data_ticker_date UNIQUE (ticker, date)"
+        ")"
+    )
+    op.execute("ALTER SEQUENCE price_data_id_seq OWNED BY price_data.id")
+    
+    op.execute(
+        f"INSERT INTO price_data ({PRICE_DATA_COLUMNS}) "
+        f"SELECT {PRICE_DATA_COLUMNS} FROM price_data_partitioned"
+    )
+    op.execute("DROP TABLE price_data_partitioned")
+    op.execute("CREATE INDEX ix_price_data_date ON price_data (date)")
+    op.execute("ANALYZE price_data")
@@ -0,0 +1,26 @@
+"""price_quarantine and data_quality_reports tables
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+from backend.core import models
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+TABLES = [models.PriceQuarantine.__table__, models.DataQualityReport.__table__]
+
+def upgrade():
+    bind = op.get_bind()
+    for table in TABLES:
+        table.create(bind=bind, checkfirst=True)
+
+def downgrade():
+    bind = op.get_bind()
+    for table in reversed(TABLES):
+        table.drop(bind=bind, checkfirst=True)
@@ -0,0 +1,26 @@
+"""stress_scenarios table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+from backend.core import models
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+TABLES = [models.StressScenario.__table__]
+
+def upgrade():
+    bind = op.get_bind()
+    for table in TABLES:
+        table.create(bind=bind, checkfirst=True)
+
+def downgrade():
+    bind = op.get_bind()
+    for table in reversed(TABLES):
+        table.drop(bind=bind, checkfirst=True)
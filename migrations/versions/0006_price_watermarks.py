@@ -0,0 +1,26 @@
+"""price_watermarks table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+from backend.core import models
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+TABLES = [models.PriceWatermark.__table__]
+
+def upgrade():
+    bind = op.get_bind()
+    for table in TABLES:
+        table.create(bind=bind, checkfirst=True)
+
+def downgrade():
+    bind = op.get_bind()
+    for table in reversed(TABLES):
+        table.drop(bind=bind, checkfirst=True)
@@ -0,0 +1,26 @@
+"""daily_returns table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+from backend.core import models
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+TABLES = [models.DailyReturn.__table__]
+
+def upgrade():
+    bind = op.get_bind()
+    for table in TABLES:
+        table.create(bind=bind, checkfirst=True)
+
+def downgrade():
+    bind = op.get_bind()
+    for table in reversed(TABLES):
+        table.drop(bind=bind, checkfirst=True)
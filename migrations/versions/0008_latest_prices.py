@@ -0,0 +1,26 @@
+"""latest_prices table
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+from backend.core import models
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+TABLES = [models.LatestPrice.__table__]
+
+def upgrade():
+    bind = op.get_bind()
+    for table in TABLES:
+        table.create(bind=bind, checkfirst=True)
+
+def downgrade():
+    bind = op.get_bind()
+    for table in reversed(TABLES):
+        table.drop(bind=bind, checkfirst=True)
@@ -0,0 +1,53 @@
+"""stress scenario names unique per owner
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from backend.core import models
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+def _name_constraints(bind):
+    return [
+        constraint["name"]
+        for constraint in sa.inspect(bind).get_unique_constraints("stress_scenarios")
+        if constraint["column_names"] == ["name"]
+    ]
+
+def upgrade():
+    bind = op.get_bind()
+    constraints = _name_constraints(bind)
+    
+    if not constraints:
+        return
+    
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("stress_scenarios", copy_from=models.StressScenario.__table__, recreate="always"):
+            pass
+        return
+    
+    for name in constraints:
+        op.drop_constraint(name, "stress_scenarios", type_="unique")
+    
+    op.create_unique_constraint("uq_stress_scenarios_owner_name", "stress_scenarios", ["owner_id", "name"])
+    op.create_index(
+        "uq_stress_scenarios_builtin_name",
+        "stress_scenarios",
+        ["name"],
+        unique=True,
+        postgresql_where=sa.text("owner_id IS NULL")
+    )
+
+def downgrade():
+    op.drop_index("uq_stress_scenarios_builtin_name", table_name="stress_scenarios", if_exists=True)
+    
+    with op.batch_alter_table("stress_scenarios") as batch:
+        batch.drop_constraint("uq_stress_scenarios_owner_name", type_="unique")
+        batch.create_unique_constraint("uq_stress_scenarios_name", ["name"])
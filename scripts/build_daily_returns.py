@@ -0,0 +1,37 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, func
+
+from backend.core.database import AsyncSessionLocal
+from backend.core.models import PriceData
+from backend.services.daily_returns import refresh_daily_returns
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(PriceData.ticker, func.min(PriceData.date)).group_by(PriceData.ticker)
+        )
+        first_dates = dict(result.all())
+        
+        if not first_dates:
+            print("No price data to derive returns from")
+            return
+        
+        print(f"Rebuilding daily returns for {len(first_dates)} tickers")
+        
+        written = 0
+        for i, (ticker, first_date) in enumerate(first_dates.items(), 1):
+            written += await refresh_daily_returns({ticker: first_date}, db)
+            await db.commit()
+            
+            if i % 100 == 0 or i == len(first_dates):
+                print(f"  {i}/{len(first_dates)} tickers")
+    
+    print(f"Wrote {written} daily return rows")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,48 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, func
+
+from backend.core.database import AsyncSessionLocal
+from backend.core.models import PriceData
+from backend.services.columnar_store import columnar_store
+from backend.services.data_ingestion import query_price_series
+
+BATCH_SIZE = 100
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(PriceData.ticker, func.min(PriceData.date), func.max(PriceData.date)).group_by(PriceData.ticker)
+        )
+        ranges = result.all()
+        
+        if not ranges:
+            print("No price data to export")
+            return
+        
+        start_date = min(r[1] for r in ranges)
+        end_date = max(r[2] for r in ranges)
+        tickers = [r[0] for r in ranges]
+        
+        print(f"Exporting {len(tickers)} tickers from {start_date} to {end_date} into {columnar_store.root}")
+        
+        written = 0
+        for offset in range(0, len(tickers), BATCH_SIZE):
+            batch = tickers[offset:offset + BATCH_SIZE]
+            series = await query_price_series(batch, start_date, end_date, db)
+            
+            for ticker_series in series.values():
+                records = ticker_series.to_frame()
+                if not records.empty:
+                    written += columnar_store.write(records)
+            
+            print(f"  {min(offset + BATCH_SIZE, len(tickers))}/{len(tickers)} tickers")
+    
+    print(f"Wrote {written} bars to the columnar price store")
+
+if __name__ == "__main__":
+    asyncio.run(main())
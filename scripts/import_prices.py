@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.core.database import AsyncSessionLocal
+from backend.services.price_import import discover_price_files, import_price_files
+
+def report_progress(progress):
+    rate = progress["rows"] / progress["elapsed"] if progress["elapsed"] > 0 else 0
+    print(
+        f"  {progress['file']}: {progress['rows']:,} rows read, "
+        f"{progress['inserted']:,} inserted, {progress['skipped']:,} skipped ({rate:,.0f} rows/s)"
+    )
+
+async def main():
+    parser = argparse.ArgumentParser(description="Import historical prices from local CSV or Parquet files")
+    parser.add_argument("paths", nargs="+", help="Price files or directories to scan")
+    parser.add_argument("--chunk-rows", type=int, default=100000, help="Rows to load per batch")
+    parser.add_argument("--ticker", help="Ticker for files without a ticker column")
+    parser.add_argument(
+        "--ticker-from-filename",
+        action="store_true",
+        help="Use the upper-cased file name as the ticker for files without a ticker column"
+    )
+    args = parser.parse_args()
+    
+    files = discover_price_files(args.paths)
+    
+    if not files:
+        print("No CSV or Parquet files found")
+        return
+    
+    print(f"Importing {len(files)} price files in chunks of {args.chunk_rows:,} rows")
+    
+    async with AsyncSessionLocal() as db:
+        totals = await import_price_files(
+            files,
+            db,
+            chunk_rows=args.chunk_rows,
+            default_ticker=args.ticker,
+            ticker_from_filename=args.ticker_from_filename,
+            on_progress=report_progress
+        )
+    
+    print(f"Imported {totals['files']} files in {totals['elapsed']:.1f}s")
+    print(f"Rows inserted: {totals['inserted']:,}, rows skipped: {totals['skipped']:,}, rows quarantined: {totals['quarantined']:,}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,9 +4,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from datetime import date, timedelta
+from datetime import date
 from backend.core.database import AsyncSessionLocal
-from backend.services.data_ingestion import bulk_ingest_prices
+from backend.services.data_ingestion import incremental_ingest_prices
 
 async def main():
     tickers = [
@@ -16,13 +16,14 @@ async def main():
     ]
     
     end_date = date.today()
-    start_date = end_date - timedelta(days=756)
     
-    print(f"Ingesting price data for {len(tickers)} tickers from {start_date} to {end_date}")
+    print(f"Ingesting price data for {len(tickers)} tickers up to {end_date}")
     
     async with AsyncSessionLocal() as db:
-        await bulk_ingest_prices(tickers, start_date, end_date, db)
+        totals = await incremental_ingest_prices(db, tickers=tickers, end_date=end_date, initial_lookback_days=756)
     
+    print(f"Tickers already up to date: {totals['up_to_date']}")
+    print(f"Rows inserted: {totals['inserted']}, rows skipped: {totals['skipped']}, rows quarantined: {totals['quarantined']}")
     print("Data ingestion completed successfully!")
 
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from backend.core.config import settings
+from backend.core.database import Base
+from backend.core.models import Portfolio, Position, RiskMetric, User
+from backend.services import risk_management
+from backend.services.covariance_store import CovarianceEstimate
+from backend.services.monte_carlo import simulate_portfolio_var
+from backend.services.risk_management import (
+    RiskContext,
+    build_risk_context,
+    calculate_cvar,
+    calculate_historical_var,
+    calculate_parametric_var,
+    calculate_var_grid_from_returns,
+    store_var_grid
+)
+
+from backend.utils.calculations import (
+    calculate_factor_betas,
+    calculate_return_features,
+    calculate_rsi,
+    calculate_firm_risk,
+    evaluate_stress_scenarios
+)
+
+def test_return_features_match_per_ticker_rolling_calculations():
+    rng = np.random.default_rng(7)
+    frames = []
+    for ticker in ["MSFT", "AAPL"]:
+        frames.append(pd.DataFrame({
+            'ticker': ticker,
+            'date': pd.bdate_range('2024-01-01', periods=60).date,
+            'close': 100 * np.cumprod(1 + rng.normal(0, 0.01, 60))
+        }))
+    
+    features = calculate_return_features(pd.concat(frames).sample(frac=1, random_state=3))
+    
+    for frame in frames:
+        expected_returns = frame['close'].pct_change()
+        actual = features[features['ticker'] == frame['ticker'].iloc[0]].reset_index(drop=True)
+        
+        assert list(actual['date']) == list(frame['date'])
+        assert np.allclose(actual['simple_return'], expected_returns, equal_nan=True)
+        assert np.allclose(actual['log_return'], np.log(frame['close']).diff(), equal_nan=True)
+        assert np.allclose(actual['volatility_20'], expected_returns.rolling(20).std(), equal_nan=True)
+        assert np.allclose(actual['momentum_20'], frame['close'].pct_change(20), equal_nan=True)
+        assert np.allclose(actual['rsi_14'], calculate_rsi(frame['close']), equal_nan=True)
+
+def test_factor_betas_match_per_asset_regression_with_missing_history():
+    rng = np.random.default_rng(11)
+    factors = pd.DataFrame(rng.normal(0, 0.01, (300, 2)), columns=['market', 'rates'])
+    loadings = np.array([[1.2, 0.0], [0.5, -0.8], [0.9, 0.3]])
+    assets = pd.DataFrame(
+        factors.to_numpy() @ loadings.T + rng.normal(0, 0.002, (300, 3)),
+        columns=['AAPL', 'TLT', 'NEW']
+    )
+    assets.loc[:199, 'NEW'] = np.nan
+    assets['THIN'] = np.nan
+    assets.loc[:9, 'THIN'] = 0.01
+    
+    betas = calculate_factor_betas(assets, factors, min_observations=60)
+    
+    for ticker in ['AAPL', 'TLT', 'NEW']:
+        observed = assets[ticker].notna()
+        design = np.column_stack([np.ones(observed.sum()), factors[observed].to_numpy()])
+        expected = np.linalg.lstsq(design, assets.loc[observed, ticker].to_numpy(), rcond=None)[0][1:]
+        assert np.allclose(betas.loc[ticker].to_numpy(), expected, atol=1e-6)
+    
+    assert betas.loc['THIN'].isna().all()
+
+def test_stress_scenarios_evaluate_as_one_matrix_product():
+    rng = np.random.default_rng(5)
+    shocks = rng.uniform(-0.5, 0.1, (20, 4))
+    position_index = np.array([0, 2, 2, 3, 1])
+    position_values = np.array([100.0, 50.0, 25.0, 10.0, 0.0])
+    
+    scenario_pnl, position_pnl = evaluate_stress_scenarios(shocks, position_index, position_values)
+    
+    for s in range(len(shocks)):
+        expected = [shocks[s, t] * v for t, v in zip(position_index, position_values)]
+        assert np.allclose(position_pnl[s], expected)
+        assert np.isclose(scenario_pnl[s], sum(expected))
+    
+    assert evaluate_stress_scenarios(shocks, position_index, position_values, include_positions=False)[1] is None
+
+def test_firm_risk_matches_per_portfolio_calculations():
+    from scipy import sparse
+    
+    rng = np.random.default_rng(3)
+    returns = rng.normal(0, 0.01, (250, 30))
+    shocks = rng.uniform(-0.4, 0.0, (4, 30))
+    exposures = sparse.random(12, 30, density=0.2, random_state=4, format='csr') * 1e6
+    levels = [0.95, 0.99]
+    
+    risk = calculate_firm_risk(returns, shocks, exposures, levels)
+    dense = exposures.toarray()
+    
+    for p in range(dense.shape[0]):
+        pnl = returns @ dense[p]
+        for i, level in enumerate(levels):
+            threshold = np.quantile(pnl, 1 - level)
+            assert np.isclose(risk["var"][i, p], max(-threshold, 0))
+            assert np.isclose(risk["cvar"][i, p], max(-pnl[pnl <= threshold].mean(), 0))
+        assert np.allclose(risk["stress_pnl"][:, p], shocks @ dense[p])
+    
+    firm_pnl = returns @ dense.sum(axis=0)
+    assert np.isclose(risk["firm_var"][0], -np.quantile(firm_pnl, 0.05))
+    assert np.allclose(risk["diversification"], risk["var"].sum(axis=1) - risk["firm_var"])
+    assert np.all(risk["diversification"] > 0)
+    assert np.isclose(risk["component_var"][0].sum(), 1.6448536 * firm_pnl.std(ddof=1))
+
+def test_firm_risk_drops_incomplete_days_per_portfolio_but_not_for_the_firm():
+    rng = np.random.default_rng(8)
+    returns = rng.normal(0, 0.01, (250, 3))
+    returns[:200, 2] = np.nan
+    exposures = np.array([[1e6, 5e5, 0.0], [1e6, 0.0, 2e5]])
+    
+    risk = calculate_firm_risk(returns, np.zeros((1, 3)), exposures, [0.95])
+    
+    full_history = returns[:, :2] @ exposures[0, :2]
+    listed_only = returns[200:] @ exposures[1]
+    assert np.isclose(risk["var"][0, 0], -np.quantile(full_history, 0.05))
+    assert np.isclose(risk["var"][0, 1], -np.quantile(listed_only, 0.05))
+    assert np.isclose(risk["volatility"][1], listed_only.std(ddof=1))
+    
+    filled = np.nan_to_num(returns)
+    firm_pnl = filled @ exposures.sum(axis=0)
+    assert np.isclose(risk["firm_var"][0], -np.quantile(firm_pnl, 0.05))
+    assert np.isclose(risk["firm_volatility"], firm_pnl.std(ddof=1))
+    
+    same_rows_var = [-np.quantile(filled @ exposures[p], 0.05) for p in range(2)]
+    assert np.isclose(risk["diversification"][0], sum(same_rows_var) - risk["firm_var"][0])
+    assert np.isclose(risk["component_var"][0].sum(), 1.6448536 * firm_pnl.std(ddof=1))
+
+def make_risk_returns() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.normal(0.0005, 0.01, (300, 4)),
+        index=pd.bdate_range("2023-01-02", periods=300),
+        columns=["A", "B", "C", "D"]
+    )
+
+@pytest.mark.asyncio
+async def test_var_grid_matches_single_var_and_cvar_calls(monkeypatch):
+    monkeypatch.setattr(settings, "MONTE_CARLO_SEED", 11)
+    returns = make_risk_returns()
+    weights = np.array([0.4, 0.3, 0.2, 0.1])
+    levels, horizons = [0.95, 0.975, 0.99], [1, 5, 10]
+    context = RiskContext(
+        portfolio=None, positions=[SimpleNamespace()], portfolio_value=1.0, as_of=date(2024, 2, 23),
+        lookback_days=252, returns=returns, weights=weights, benchmark_ticker="SPY"
+    )
+    
+    grid = calculate_var_grid_from_returns(
+        returns, weights, levels, horizons, ["historical", "parametric", "monte_carlo"], 50000
+    )
+    assert len(grid) == 27
+    
+    for point in grid:
+        confidence, horizon = point["confidence"], point["horizon"]
+        var = point["var_percentage"] / 100
+        
+        if point["method"] == "historical":
+            assert np.isclose(var, calculate_historical_var(returns, weights, confidence, horizon))
+            cvar = await calculate_cvar(None, confidence, horizon, "historical", 0, None, None, context=context)
+            assert np.isclose(point["cvar_percentage"] / 100, cvar["cvar"])
+        elif point["method"] == "parametric":
+            assert np.isclose(var, calculate_parametric_var(returns, weights, confidence, horizon))
+        else:
+            simulation = simulate_portfolio_var(
+                returns.mean().values, returns.cov().values, weights, [confidence], horizon, 50000
+            )
+            assert np.isclose(var, simulation["var"][0], rtol=0.03)
+            assert np.isclose(point["cvar_percentage"] / 100, simulation["cvar"][0], rtol=0.03)
+
+@pytest.mark.asyncio
+async def test_store_var_grid_updates_the_days_risk_metric(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'risk.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    
+    as_of = date(2024, 2, 23)
+    grid = [
+        {"method": method, "confidence": confidence, "horizon": horizon, "var": var, "cvar": var * 1.2}
+        for method in ["historical", "parametric"]
+        for confidence, var in [(0.95, 100.0), (0.99, 150.0)]
+        for horizon in [1, 10]
+    ]
+    
+    async with async_sessionmaker(engine)() as db:
+        db.add(RiskMetric(portfolio_id=7, calculation_date=as_of, var_95=1, volatility=0.2))
+        await db.commit()
+        
+        await store_var_grid(7, as_of, grid, db)
+        await store_var_grid(7, as_of, grid, db)
+        
+        metrics = (await db.execute(select(RiskMetric))).scalars().all()
+        assert len(metrics) == 1
+        assert float(metrics[0].var_95) == 100.0
+        assert float(metrics[0].cvar_99) == 180.0
+        assert metrics[0].volatility == 0.2
+    
+    await engine.dispose()
+
+async def make_risk_portfolio(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'context.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    
+    async with async_sessionmaker(engine)() as db:
+        db.add_all([
+            User(id=1, email="owner@example.com", hashed_password="x"),
+            User(id=2, email="other@example.com", hashed_password="x"),
+            Portfolio(id=5, name="Core", benchmark="D", inception_date=date(2020, 1, 1), owner_id=1)
+        ])
+        db.add_all([
+            Position(portfolio_id=5, ticker="A", shares=10, market_value=400),
+            Position(portfolio_id=5, ticker="B", shares=10, market_value=100),
+            Position(portfolio_id=5, ticker="B", shares=5, market_value=200),
+            Position(portfolio_id=5, ticker="GONE", shares=1, market_value=300)
+        ])
+        await db.commit()
+    
+    return engine
+
+@pytest.mark.asyncio
+async def test_risk_context_aligns_weights_with_the_returns_it_loaded(tmp_path, monkeypatch):
+    returns = make_risk_returns()
+    returns.iloc[3, 0] = np.nan
+    requests = []
+    
+    async def get_returns_matrix(tickers, start_date, end_date, db):
+        requests.append((sorted(tickers), start_date, end_date))
+        return returns[["D", "C", "B", "A"]]
+    
+    async def get_covariance(tickers, db, lookback_days, as_of, returns=None):
+        return None
+    
+    monkeypatch.setattr(risk_management, "get_returns_matrix", get_returns_matrix)
+    monkeypatch.setattr(risk_management, "get_covariance", get_covariance)
+    engine = await make_risk_portfolio(tmp_path)
+    
+    async with async_sessionmaker(engine)() as db:
+        context = await build_risk_context(5, db, 1, lookback_days=90, as_of=date(2024, 2, 23))
+    await engine.dispose()
+    
+    assert requests == [(["A", "B", "B", "D", "GONE"], date(2023, 11, 25), date(2024, 2, 23))]
+    assert context.portfolio_value == 1000.0
+    assert context.tickers == ["B", "A"]
+    assert np.allclose(context.weights, [0.3, 0.4])
+    assert len(context.returns) == len(returns) - 1
+    assert not context.returns.isna().any().any()
+    assert len(context.benchmark_returns) == len(returns)
+    assert np.allclose(context.portfolio_returns, context.returns["B"] * 0.3 + context.returns["A"] * 0.4)
+    
+    mean, covariance = context.moments()
+    assert np.allclose(mean, context.returns.mean())
+    assert np.allclose(covariance, context.returns.cov())
+
+@pytest.mark.asyncio
+async def test_risk_context_rejects_portfolios_owned_by_someone_else(tmp_path, monkeypatch):
+    async def get_returns_matrix(tickers, start_date, end_date, db):
+        raise AssertionError("returns loaded for a portfolio the user does not own")
+    
+    monkeypatch.setattr(risk_management, "get_returns_matrix", get_returns_matrix)
+    engine = await make_risk_portfolio(tmp_path)
+    
+    async with async_sessionmaker(engine)() as db:
+        with pytest.raises(ValueError, match="Portfolio not found"):
+            await build_risk_context(5, db, 2)
+        with pytest.raises(ValueError, match="Portfolio not found"):
+            await build_risk_context(6, db, 1)
+    await engine.dispose()
+
+def test_risk_context_moments_prefer_the_stored_estimate():
+    returns = make_risk_returns()
+    estimate = CovarianceEstimate(
+        np.array(["A", "B", "C", "D"]), np.full(4, 0.001), np.eye(4) * 0.0004, 300, "ewma"
+    )
+    context = RiskContext(
+        portfolio=None, positions=[], portfolio_value=1.0, as_of=date(2024, 2, 23), lookback_days=252,
+        returns=returns, weights=np.full(4, 0.25), benchmark_ticker="SPY",
+        mean_returns=estimate.mean_series(), covariance=estimate.to_frame()
+    )
+    
+    mean, covariance = context.moments()
+    
+    assert np.allclose(mean, 0.001)
+    assert np.allclose(covariance, np.eye(4) * 0.0004)
+
+def test_risk_context_window_keeps_only_the_trailing_days():
+    returns = make_risk_returns()
+    context = RiskContext(
+        portfolio=None, positions=[], portfolio_value=1.0, as_of=returns.index[-1].date(), lookback_days=252,
+        returns=returns, weights=np.full(4, 0.25), benchmark_ticker="SPY"
+    )
+    
+    window = context.window(30)
+    
+    assert window.index[0] >= returns.index[-1] - pd.Timedelta(days=30)
+    assert window.index[0] - pd.Timedelta(days=3) < returns.index[-1] - pd.Timedelta(days=30)
+    assert window.index[-1] == returns.index[-1]
+    assert window.equals(returns.loc[window.index[0]:])
+    assert context.window(252) is returns
+    assert context.window(400) is returns
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from backend.services.columnar_store import ColumnarPriceStore
+
+def make_records(ticker: str, start: str, days: int, close: float) -> pd.DataFrame:
+    dates = pd.date_range(start, periods=days, freq='D').date
+    closes = close + np.arange(days, dtype=np.float64)
+    return pd.DataFrame({
+        'ticker': ticker,
+        'date': dates,
+        'open': closes,
+        'high': closes + 1,
+        'low': closes - 1,
+        'close': closes,
+        'volume': 1000.0,
+        'adjusted_close': closes
+    })
+
+def test_write_and_read_by_range_and_column(tmp_path):
+    store = ColumnarPriceStore(str(tmp_path))
+    
+    assert store.write(pd.concat([make_records("AAPL", "2024-01-01", 10, 100.0), make_records("BRK/B", "2024-01-01", 5, 50.0)])) == 15
+    
+    series = store.read("AAPL", date(2024, 1, 3), date(2024, 1, 5), ['close'])
+    assert list(series.columns) == ['close']
+    assert series.dates[0] == np.datetime64('2024-01-03')
+    assert series.dates[-1] == np.datetime64('2024-01-05')
+    assert series.columns['close'].tolist() == [102.0, 103.0, 104.0]
+    
+    assert len(store.read("BRK/B", date(2024, 1, 1), date(2024, 1, 31)).dates) == 5
+    
+    missing = store.read("MSFT", date(2024, 1, 1), date(2024, 1, 31), ['close'])
+    assert len(missing.dates) == 0
+    assert len(missing.columns['close']) == 0
+
+def test_merge_keeps_existing_bars_and_adds_new_dates_in_order(tmp_path):
+    store = ColumnarPriceStore(str(tmp_path))
+    store.write(make_records("AAPL", "2024-01-05", 5, 100.0))
+    
+    assert store.write(make_records("AAPL", "2024-01-07", 5, 500.0)) == 2
+    assert store.write(make_records("AAPL", "2024-01-01", 3, 10.0)) == 3
+    assert store.write(make_records("AAPL", "2024-01-05", 3, 900.0)) == 0
+    
+    series = store.read("AAPL", date(2024, 1, 1), date(2024, 1, 31), ['close'])
+    assert np.all(np.diff(series.dates.astype(np.int64)) > 0)
+    assert len(series.dates) == 10
+    assert series.columns['close'].tolist() == [10.0, 11.0, 12.0, 100.0, 101.0, 102.0, 103.0, 104.0, 503.0, 504.0]
+
+def test_write_swaps_current_version_atomically(tmp_path):
+    store = ColumnarPriceStore(str(tmp_path))
+    store.write(make_records("AAPL", "2024-01-01", 5, 100.0))
+    
+    ticker_dir = tmp_path / "AAPL"
+    first_version = (ticker_dir / "CURRENT").read_text().strip()
+    held = store.read("AAPL", date(2024, 1, 1), date(2024, 1, 31), ['close'])
+    
+    store.write(make_records("AAPL", "2024-01-06", 2, 200.0))
+    
+    second_version = (ticker_dir / "CURRENT").read_text().strip()
+    assert second_version != first_version
+    assert not (ticker_dir / first_version).exists()
+    assert sorted(p.name for p in ticker_dir.iterdir() if not p.name.startswith(".")) == sorted(["CURRENT", second_version])
+    
+    assert held.columns['close'].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert len(store.read("AAPL", date(2024, 1, 1), date(2024, 1, 31)).dates) == 7
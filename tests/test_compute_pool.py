@@ -0,0 +1,66 @@
+import asyncio
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.core.executors import ComputePool
+
+def column_sums(frame: pd.DataFrame, scale: np.ndarray):
+    return (frame.sum() * scale.sum()).to_dict(), os.getpid(), frame.to_numpy().flags.writeable
+
+@pytest.mark.asyncio
+async def test_runs_kernels_in_worker_processes_through_shared_memory():
+    pool = ComputePool(workers=1, shared_memory_min_bytes=1024, start_method="spawn")
+    frame = pd.DataFrame(np.ones((2000, 4)), columns=list("ABCD"))
+    
+    await pool.start()
+    try:
+        sums, pid, writeable = await pool.run(column_sums, frame, scale=np.full(1000, 0.5))
+    finally:
+        await pool.shutdown()
+    
+    assert sums == {"A": 1e6, "B": 1e6, "C": 1e6, "D": 1e6}
+    assert pid != os.getpid()
+    assert not writeable
+    
+    metrics = pool.metrics()
+    assert metrics["completed"] == 1
+    assert metrics["in_flight"] == 0
+    assert metrics["latency"]["p50_ms"] >= metrics["run_time"]["p50_ms"]
+
+@pytest.mark.asyncio
+async def test_runs_in_a_thread_until_started():
+    pool = ComputePool(workers=1, shared_memory_min_bytes=1024, start_method="spawn")
+    
+    sums, pid, _ = await pool.run(column_sums, pd.DataFrame({"A": [1.0, 2.0]}), np.ones(2))
+    
+    assert sums == {"A": 6.0}
+    assert pid == os.getpid()
+
+def crash_worker():
+    os._exit(1)
+
+@pytest.mark.asyncio
+async def test_concurrent_failures_restart_the_pool_once():
+    from concurrent.futures.process import BrokenProcessPool
+    
+    pool = ComputePool(workers=1, shared_memory_min_bytes=1024, start_method="spawn")
+    
+    await pool.start()
+    
+    created = []
+    create_executor = pool._create_executor
+    pool._create_executor = lambda: created.append(1) or create_executor()
+    try:
+        results = await asyncio.gather(pool.run(crash_worker), pool.run(crash_worker), return_exceptions=True)
+        assert all(isinstance(result, BrokenProcessPool) for result in results)
+        
+        sums, pid, _ = await pool.run(column_sums, pd.DataFrame({"A": [1.0, 2.0]}), np.ones(2))
+    finally:
+        await pool.shutdown()
+    
+    assert sums == {"A": 6.0}
+    assert pid != os.getpid()
+    assert pool.metrics()["errors"] == 2
+    assert len(created) == 1
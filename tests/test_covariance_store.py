@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from backend.services.covariance_store import (
+    CovarianceCache,
+    CovarianceStore,
+    EWMACovariance,
+    FactorCovariance,
+    estimate_covariance,
+    portfolio_variance
+)
+
+def make_returns(days: int, tickers: int, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    mixing = rng.normal(0, 0.01, (tickers, tickers))
+    return pd.DataFrame(
+        rng.normal(0, 1, (days, tickers)) @ mixing,
+        index=pd.bdate_range('2023-01-02', periods=days),
+        columns=[f"T{i}" for i in range(tickers)]
+    )
+
+def test_incremental_update_matches_full_recalculation():
+    returns = make_returns(400, 6)
+    
+    state = EWMACovariance.from_returns(returns.iloc[:390], decay=0.94)
+    state.update_frame(returns)
+    full = EWMACovariance.from_returns(returns, decay=0.94)
+    
+    assert state.as_of == full.as_of == returns.index[-1].date()
+    assert state.observations == 400
+    assert np.allclose(state.mean, full.mean, rtol=1e-6, atol=1e-12)
+    assert np.allclose(state.covariance, full.covariance, rtol=1e-6, atol=1e-12)
+
+def test_recent_incomplete_days_stay_pending_until_their_returns_arrive():
+    returns = make_returns(300, 4)
+    late = returns.copy()
+    late.iloc[-2, 1] = np.nan
+    settle_before = returns.index[-5].date()
+    
+    state = EWMACovariance.from_returns(returns.iloc[:290], decay=0.94)
+    state.update_frame(late, settle_before)
+    assert state.as_of == returns.index[-3].date()
+    
+    state.update_frame(returns, settle_before)
+    assert state.as_of == returns.index[-1].date()
+    assert np.allclose(state.covariance, EWMACovariance.from_returns(returns, decay=0.94).covariance)
+    
+    stale = returns.copy()
+    stale.iloc[-8, 1] = np.nan
+    state = EWMACovariance.from_returns(returns.iloc[:290], decay=0.94)
+    state.update_frame(stale, settle_before)
+    assert state.as_of == returns.index[-1].date()
+
+def test_subset_updates_match_universe_updates():
+    returns = make_returns(300, 8)
+    returns.iloc[:250, 7] = np.nan
+    
+    universe = EWMACovariance.from_returns(returns.iloc[:295], decay=0.97)
+    subset = universe.select(["T3", "T1"], min_observations=60)
+    
+    universe.update_frame(returns)
+    subset.update_frame(returns[["T3", "T1"]])
+    
+    expected = universe.select(["T3", "T1"])
+    assert np.allclose(subset.covariance, expected.covariance)
+    assert np.allclose(subset.mean, expected.mean)
+    assert universe.select(["T1", "T7"], min_observations=60) is None
+    assert universe.select(["T1", "MISSING"]) is None
+
+def test_store_keeps_dated_versions(tmp_path):
+    store = CovarianceStore(str(tmp_path), retain_versions=2)
+    returns = make_returns(120, 3)
+    
+    for end in [100, 110, 120]:
+        store.save("firm", EWMACovariance.from_returns(returns.iloc[:end], decay=0.94))
+    
+    assert store.versions("firm") == [returns.index[109].date(), returns.index[119].date()]
+    
+    latest = store.load("firm")
+    assert latest.as_of == returns.index[119].date()
+    assert np.allclose(latest.covariance, EWMACovariance.from_returns(returns, decay=0.94).covariance)
+    
+    assert store.load("firm", as_of=returns.index[115].date()).as_of == returns.index[109].date()
+    assert store.load("firm", as_of=date(2020, 1, 1)) is None
+
+def test_estimators_match_reference_calculations():
+    returns = make_returns(200, 4)
+    
+    sample = estimate_covariance(returns, "sample")
+    assert np.allclose(sample.covariance, returns.cov().to_numpy())
+    assert np.allclose(sample.mean, returns.mean().to_numpy())
+    
+    ewma = estimate_covariance(returns, "ewma", decay=0.94)
+    assert np.allclose(ewma.covariance, EWMACovariance.from_returns(returns, decay=0.94).covariance)
+    
+    subset = sample.select(["T2", "T0"])
+    assert np.allclose(subset.to_frame(), returns[["T2", "T0"]].cov())
+
+def test_cache_serves_exact_and_subset_hits_and_evicts():
+    returns = make_returns(200, 5)
+    as_of = returns.index[-1].date()
+    cache = CovarianceCache(max_entries=2, max_bytes=10 ** 6)
+    
+    cache.put(list(returns.columns), 252, as_of, "sample", estimate_covariance(returns, "sample"))
+    
+    exact = cache.get(list(reversed(returns.columns)), 252, as_of, "sample")
+    assert list(exact.tickers) == list(reversed(returns.columns))
+    assert np.allclose(exact.to_frame(), returns.cov().loc[exact.tickers, exact.tickers])
+    
+    subset = cache.get(["T4", "T1"], 252, as_of, "sample")
+    assert np.allclose(subset.to_frame(), returns[["T4", "T1"]].cov())
+    
+    assert cache.get(["T1"], 252, as_of, "ewma") is None
+    assert cache.get(["T1"], 126, as_of, "sample") is None
+    assert cache.get(["T1", "OTHER"], 252, as_of, "sample") is None
+    
+    cache.put(["T0"], 252, as_of, "ewma", estimate_covariance(returns[["T0"]], "ewma"))
+    cache.put(["T1"], 252, as_of, "ewma", estimate_covariance(returns[["T1"]], "ewma"))
+    
+    assert cache.get(["T4"], 252, as_of, "sample") is None
+    assert cache.metrics()["entries"] == 2
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["subset_hits"] == 1
+
+def test_cache_only_serves_subsets_estimated_on_the_same_rows():
+    returns = make_returns(200, 3)
+    as_of = returns.index[-1].date()
+    cache = CovarianceCache(max_entries=4, max_bytes=10 ** 6)
+    
+    superset = returns.copy()
+    superset.iloc[:150, 2] = np.nan
+    superset = superset.dropna()
+    cache.put(list(superset.columns), 252, as_of, "sample", estimate_covariance(superset, "sample"), cache.returns_window(superset))
+    
+    full = returns[["T0", "T1"]]
+    assert cache.get(["T0", "T1"], 252, as_of, "sample", cache.returns_window(full)) is None
+    
+    short = superset[["T0", "T1"]]
+    hit = cache.get(["T0", "T1"], 252, as_of, "sample", cache.returns_window(short))
+    assert np.allclose(hit.to_frame(), short.cov())
+
+def test_subset_hits_match_a_fresh_estimate_or_miss():
+    returns = make_returns(200, 6)
+    as_of = returns.index[-1].date()
+    subset = ["T4", "T1", "T2"]
+    
+    cache = CovarianceCache(max_entries=8, max_bytes=10 ** 6)
+    window = cache.returns_window(returns)
+    
+    for estimator in ["sample", "ewma"]:
+        cache.put(list(returns.columns), 252, as_of, estimator, estimate_covariance(returns, estimator), window)
+        hit = cache.get(subset, 252, as_of, estimator, window)
+        assert np.allclose(hit.to_frame(), estimate_covariance(returns[subset], estimator).to_frame())
+    
+    factor_model = estimate_covariance(returns, "pca", factors=2)
+    for estimator in ["ledoit_wolf", "pca"]:
+        cache.put(list(returns.columns), 252, as_of, estimator, factor_model, window)
+        assert cache.get(subset, 252, as_of, estimator, window) is None
+
+def test_factor_model_matches_its_dense_covariance():
+    returns = make_returns(120, 300)
+    model = estimate_covariance(returns, "pca", factors=10)
+    dense = model.to_frame().to_numpy()
+    weights = np.random.default_rng(3).random((4, 300))
+    
+    assert isinstance(model, FactorCovariance)
+    assert model.loadings.shape == (300, 10)
+    assert np.allclose(model.variance(), np.diag(dense))
+    assert np.allclose(model.portfolio_variance(weights), portfolio_variance(dense, weights))
+    assert np.allclose(model.dot(weights[0]), dense @ weights[0])
+    
+    correlation = dense / np.sqrt(np.outer(np.diag(dense), np.diag(dense)))
+    assert np.isclose(model.average_correlation(), correlation[np.triu_indices(300, 1)].mean())
+    
+    subset = model.select(["T5", "T2"])
+    assert np.allclose(subset.to_frame(), model.to_frame().loc[["T5", "T2"], ["T5", "T2"]])
+    assert np.isclose(
+        model.scale(252).portfolio_variance(weights[0]) / model.portfolio_variance(weights[0]), 252
+    )
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from backend.services.data_quality import validate_price_records, count_missing_sessions
+
+def make_records(ticker: str, closes: np.ndarray, start: str = "2024-01-02") -> pd.DataFrame:
+    dates = pd.bdate_range(start, periods=len(closes)).date
+    return pd.DataFrame({
+        'ticker': ticker,
+        'date': dates,
+        'open': closes,
+        'high': closes * 1.01,
+        'low': closes * 0.99,
+        'close': closes,
+        'volume': pd.array([1000] * len(closes), dtype='Int64'),
+        'adjusted_close': closes
+    })
+
+def test_flags_bad_rows_and_keeps_clean_ones():
+    rng = np.random.default_rng(11)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, 60))
+    records = make_records("AAPL", closes)
+    
+    records.loc[10, ['close', 'adjusted_close']] = -1.0
+    records.loc[20, 'high'] = records.loc[20, 'low'] - 1
+    records.loc[30, ['open', 'high', 'low', 'close', 'adjusted_close']] *= 3.5
+    records.loc[45:, ['open', 'high', 'low', 'close', 'adjusted_close']] /= 2
+    
+    clean, quarantined, report = validate_price_records(records)
+    
+    assert dict(zip(quarantined.index, quarantined['reasons'])) == {
+        10: "non_positive,ohlc_inconsistent",
+        20: "ohlc_inconsistent",
+        30: "extreme_return",
+        45: "split_suspect",
+        **{row: "split_pending" for row in range(46, 60)}
+    }
+    assert len(clean) == 42
+    assert report["quarantined"] == 18
+    assert report["checks"] == {
+        "non_positive": 1, "ohlc_inconsistent": 2, "extreme_return": 1, "split_suspect": 1, "split_pending": 14
+    }
+
+def test_uses_history_for_incremental_batches_and_reports_gaps():
+    rng = np.random.default_rng(5)
+    history = make_records("MSFT", 100 * np.cumprod(1 + rng.normal(0, 0.01, 40)), "2024-01-02")
+    last_close = history['close'].iloc[-1]
+    batch = make_records("MSFT", np.array([last_close * 1.005, last_close * 0.4]), "2024-03-04")
+    
+    clean, quarantined, report = validate_price_records(batch, history[['ticker', 'date', 'adjusted_close']])
+    
+    assert quarantined['reasons'].tolist() == ["extreme_return"]
+    assert report["gaps"] == {"MSFT": 4}
+
+def test_holds_bars_after_a_pending_split_until_adjusted_history_is_reloaded():
+    rng = np.random.default_rng(7)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, 60))
+    history = make_records("NVDA", closes[:40])[['ticker', 'date', 'adjusted_close']]
+    unadjusted = make_records("NVDA", closes[40:] / 4, "2024-02-27")
+    split_date = unadjusted['date'].iloc[0]
+    
+    clean, quarantined, report = validate_price_records(unadjusted, history)
+    
+    assert clean.empty
+    assert quarantined['reasons'].tolist() == ["split_suspect"] + ["split_pending"] * 19
+    
+    clean, quarantined, report = validate_price_records(unadjusted.iloc[5:], None, {"NVDA": split_date})
+    
+    assert clean.empty
+    assert set(quarantined['reasons']) == {"split_pending"}
+    assert report["splits_cleared"] == []
+    
+    reloaded = make_records("NVDA", closes / 4)
+    clean, quarantined, report = validate_price_records(reloaded, None, {"NVDA": split_date})
+    
+    assert quarantined.empty
+    assert report["splits_cleared"] == ["NVDA"]
+
+def test_keeps_extreme_returns_when_the_market_moved_with_them():
+    rng = np.random.default_rng(3)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.004, 40))
+    closes[-1] = closes[-2] * 0.88
+    records = make_records("KO", closes)
+    market = pd.Series(100 * np.cumprod(1 + rng.normal(0, 0.01, 40)), index=records['date'])
+    market.iloc[-1] = market.iloc[-2] * 0.91
+    
+    clean, quarantined, report = validate_price_records(records)
+    assert quarantined['reasons'].tolist() == ["extreme_return"]
+    
+    clean, quarantined, report = validate_price_records(records, market=market)
+    assert quarantined.empty
+    assert len(clean) == 40
+    assert report["market_moves"] == 1
+
+def test_trading_calendar_skips_weekends_and_holidays():
+    previous = np.array(['2024-07-03', '2024-12-20'], dtype='datetime64[D]')
+    current = np.array(['2024-07-05', '2024-12-27'], dtype='datetime64[D]')
+    
+    assert count_missing_sessions(previous, current).tolist() == [0, 3]
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.core.http_client import ProviderClientManager
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = []
+    
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        body = json.dumps({"results": [{"c": 101.5}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    StubProviderHandler.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubProviderHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def build_manager() -> ProviderClientManager:
+    return ProviderClientManager(
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=30.0,
+        timeout=5.0,
+        connect_timeout=2.0
+    )
+
+@pytest.mark.asyncio
+async def test_provider_client_reuses_connection(stub_server):
+    manager = build_manager()
+    await manager.start()
+    
+    for _ in range(5):
+        response = await manager.client.get(f"{stub_server}/v2/aggs")
+        assert response.status_code == 200
+        assert response.json()["results"][0]["c"] == 101.5
+    
+    await manager.close()
+    
+    assert len(StubProviderHandler.client_ports) == 5
+    assert len(set(StubProviderHandler.client_ports)) == 1
+
+@pytest.mark.asyncio
+async def test_provider_client_restarts_after_close(stub_server):
+    manager = build_manager()
+    await manager.start()
+    first_client = manager.client
+    await manager.close()
+    
+    assert first_client.is_closed
+    
+    response = await manager.client.get(f"{stub_server}/query")
+    assert response.status_code == 200
+    assert manager.client is not first_client
+    
+    await manager.close()
+
+@pytest.mark.asyncio
+async def test_provider_client_closes_the_client_left_on_another_loop(stub_server):
+    manager = build_manager()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    
+    async def fetch():
+        response = await manager.client.get(f"{stub_server}/v2/aggs")
+        return manager.client, response.status_code
+    
+    try:
+        other_client, status = asyncio.run_coroutine_threadsafe(fetch(), other_loop).result(5)
+        assert status == 200
+        
+        client = manager.client
+        assert client is not other_client
+        
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), other_loop))
+        assert other_client.is_closed
+        assert not client.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(5)
+        other_loop.close()
+    
+    await manager.close()
+
+@pytest.mark.asyncio
+async def test_provider_client_drops_the_client_of_a_closed_loop(stub_server):
+    manager = build_manager()
+    other_loop = asyncio.new_event_loop()
+    
+    async def fetch():
+        await manager.client.get(f"{stub_server}/v2/aggs")
+        return manager.client
+    
+    clients = []
+    thread = threading.Thread(target=lambda: clients.append(other_loop.run_until_complete(fetch())))
+    thread.start()
+    thread.join(5)
+    other_loop.close()
+    other_client = clients[0]
+    
+    response = await manager.client.get(f"{stub_server}/v2/aggs")
+    
+    assert response.status_code == 200
+    assert manager.client is not other_client
+    assert manager._loop is asyncio.get_running_loop()
+    
+    await manager.close()
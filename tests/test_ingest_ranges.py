@@ -0,0 +1,23 @@
+from datetime import date, datetime, timezone
+
+from backend.services.data_ingestion import plan_ingest_ranges
+from backend.services.data_quality import last_completed_session
+
+def test_last_completed_session_excludes_the_open_session():
+    assert last_completed_session(datetime(2024, 7, 10, 18, 0, tzinfo=timezone.utc)) == date(2024, 7, 9)
+    assert last_completed_session(datetime(2024, 7, 10, 20, 30, tzinfo=timezone.utc)) == date(2024, 7, 10)
+    assert last_completed_session(datetime(2024, 7, 8, 13, 0, tzinfo=timezone.utc)) == date(2024, 7, 5)
+    assert last_completed_session(datetime(2024, 7, 5, 12, 0, tzinfo=timezone.utc)) == date(2024, 7, 3)
+
+def test_plans_ranges_from_the_watermarks():
+    end_date = date(2024, 7, 9)
+    watermarks = {"AAPL": date(2024, 7, 5), "MSFT": date(2024, 7, 9), "SPY": date(2024, 7, 8)}
+    
+    ranges = plan_ingest_ranges(["AAPL", "MSFT", "SPY", "NVDA", "AAPL"], watermarks, end_date, date(2024, 1, 2))
+    
+    assert ranges == {
+        "AAPL": (date(2024, 7, 6), end_date),
+        "SPY": (date(2024, 7, 9), end_date),
+        "NVDA": (date(2024, 1, 2), end_date)
+    }
+    assert plan_ingest_ranges(["AAPL"], {"AAPL": date(2024, 7, 5)}, date(2024, 7, 7), date(2024, 1, 2)) == {}
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+
+from backend.services.intraday_store import IntradayBarStore, rollup_bars, bars_from_frame
+
+def make_minute_bars(ticker: str, day: date, minutes: int) -> pd.DataFrame:
+    timestamps = pd.date_range(f"{day.isoformat()} 14:30", periods=minutes, freq="1min")
+    closes = 100 + np.arange(minutes, dtype=np.float64)
+    return pd.DataFrame({
+        'ticker': ticker,
+        'timestamp': timestamps,
+        'open': closes - 0.5,
+        'high': closes + 1,
+        'low': closes - 1,
+        'close': closes,
+        'volume': 10.0
+    })
+
+def test_rollup_aggregates_ohlcv_per_bucket():
+    bars = bars_from_frame(make_minute_bars("AAPL", date(2024, 3, 1), 10))
+    
+    rolled, offsets = rollup_bars(bars, 300)
+    
+    assert len(rolled) == 2
+    assert offsets.tolist() == [0, 2]
+    assert rolled['open'].tolist() == [99.5, 104.5]
+    assert rolled['high'].tolist() == [105.0, 110.0]
+    assert rolled['low'].tolist() == [99.0, 104.0]
+    assert rolled['close'].tolist() == [104.0, 109.0]
+    assert rolled['volume'].tolist() == [50.0, 50.0]
+
+def test_writes_merge_and_roll_up(tmp_path):
+    store = IntradayBarStore(str(tmp_path), retention_days={"1m": 5, "5m": 0, "1h": 0})
+    day = date(2024, 3, 1)
+    frame = make_minute_bars("AAPL", day, 90)
+    
+    store.write(frame.iloc[:60])
+    store.write(frame.iloc[50:])
+    store.write(make_minute_bars("MSFT", day, 30))
+    
+    assert len(store.read("AAPL", day)) == 90
+    assert len(store.read("MSFT", day, "5m")) == 6
+    assert len(store.read("AAPL", day, "5m")) == 18
+    assert len(store.read("AAPL", day, "1h")) == 2
+    
+    daily = store.daily_bars(["AAPL", "NVDA"], day)
+    assert daily['ticker'].tolist() == ["AAPL"]
+    assert daily['close'].iloc[0] == 189.0
+    assert daily['volume'].iloc[0] == 900.0
+
+def test_compaction_drops_old_minute_days_but_keeps_rollups(tmp_path):
+    store = IntradayBarStore(str(tmp_path), retention_days={"1m": 5, "5m": 0, "1h": 0})
+    day = date(2024, 3, 1)
+    store.write(make_minute_bars("AAPL", day, 30))
+    
+    removed = store.compact(date(2024, 3, 10))
+    
+    assert removed == {"1m": 1}
+    assert len(store.read("AAPL", day)) == 0
+    assert len(store.read("AAPL", day, "5m")) == 6
+    assert store.daily_bars(["AAPL"], day)['close'].iloc[0] == 129.0
@@ -0,0 +1,38 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from backend.core.database import Base
+from backend.core.models import LatestPrice
+from backend.services import latest_prices, quote_service
+
+@pytest.mark.asyncio
+async def test_stale_marks_are_repriced_from_live_quotes(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'marks.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    
+    now = datetime.now(timezone.utc)
+    quoted = []
+    
+    async def fake_quotes(tickers):
+        quoted.extend(tickers)
+        return {ticker: 1.0 for ticker in tickers}
+    
+    monkeypatch.setattr(quote_service, "get_quotes", fake_quotes)
+    monkeypatch.setattr(latest_prices, "_latest_marks", {})
+    
+    async with async_sessionmaker(engine)() as db:
+        db.add_all([
+            LatestPrice(ticker="FRESH", price=100, as_of=now - timedelta(hours=1), source="quote"),
+            LatestPrice(ticker="STALE", price=50, as_of=now - timedelta(days=30), source="close")
+        ])
+        await db.commit()
+        
+        prices = await latest_prices.get_mark_prices(["FRESH", "STALE", "NEW"], db)
+        assert prices == {"FRESH": 100.0, "STALE": 1.0, "NEW": 1.0}
+        assert sorted(quoted) == ["NEW", "STALE"]
+        
+        assert await latest_prices.get_latest_prices(["FRESH", "STALE"], db) == {"FRESH": 100.0}
+    
+    await engine.dispose()
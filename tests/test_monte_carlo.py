@@ -0,0 +1,68 @@
+import numpy as np
+from scipy import stats
+
+from backend.services.covariance_store import FactorCovariance
+from backend.services.monte_carlo import simulate_portfolio_var, get_covariance_factor
+
+def make_inputs(assets: int = 20):
+    rng = np.random.default_rng(3)
+    loadings = rng.normal(0, 0.01, (assets, 3))
+    cov = loadings @ loadings.T + np.diag(rng.uniform(1e-5, 4e-5, assets))
+    mean = rng.normal(0.0003, 0.0002, assets)
+    weights = np.full(assets, 1 / assets)
+    return mean, cov, weights
+
+def analytic_var(mean, cov, weights, confidence):
+    sigma = np.sqrt(weights @ cov @ weights)
+    return abs(mean @ weights + stats.norm.ppf(1 - confidence) * sigma)
+
+def test_seeded_runs_are_reproducible():
+    mean, cov, weights = make_inputs()
+    
+    first = simulate_portfolio_var(mean, cov, weights, [0.95, 0.99], simulations=20000, seed=7)
+    second = simulate_portfolio_var(mean, cov, weights, [0.95, 0.99], simulations=20000, seed=7)
+    
+    assert first["var"] == second["var"]
+    assert first["cvar"] == second["cvar"]
+
+def test_samplers_converge_to_the_analytic_normal_var():
+    mean, cov, weights = make_inputs()
+    expected = analytic_var(mean, cov, weights, 0.99)
+    
+    for sampler in ["pseudo", "antithetic", "sobol"]:
+        result = simulate_portfolio_var(mean, cov, weights, [0.95, 0.99], simulations=65536, sampler=sampler, seed=1)
+        
+        assert abs(result["var"][1] - expected) / expected < 0.03
+        assert result["cvar"][1] > result["var"][1] > result["var"][0]
+        assert result["convergence"]["chunks"] >= 8
+        assert result["convergence"]["relative_error"][1] < 0.05
+
+def test_chunked_tail_matches_single_pass_and_reuses_factor():
+    mean, cov, weights = make_inputs()
+    
+    chunked = simulate_portfolio_var(mean, cov, weights, [0.99], simulations=8192, sampler="pseudo", seed=2, chunk_size=512)
+    
+    rng = np.random.default_rng(2)
+    factor = get_covariance_factor(cov)
+    shocks = rng.standard_normal((8192, len(weights)), dtype=np.float32)
+    portfolio = ((shocks @ factor.T + mean.astype(np.float32)) @ weights.astype(np.float32)).astype(np.float64)
+    
+    assert np.isclose(chunked["var"][0], abs(np.percentile(portfolio, 1)), rtol=1e-5)
+    assert get_covariance_factor(cov.copy()) is factor
+
+def test_factor_model_simulation_matches_the_analytic_var():
+    rng = np.random.default_rng(4)
+    assets = 500
+    model = FactorCovariance(
+        np.array([f"T{i}" for i in range(assets)]),
+        rng.normal(0.0003, 0.0002, assets),
+        rng.normal(0, 0.01, (assets, 5)),
+        rng.uniform(1e-5, 4e-5, assets),
+        252
+    )
+    weights = np.full(assets, 1 / assets)
+    expected = analytic_var(model.mean, model.to_frame().to_numpy(), weights, 0.99)
+    
+    result = simulate_portfolio_var(model.mean, model, weights, [0.99], simulations=65536, sampler="sobol", seed=1)
+    
+    assert abs(result["var"][0] - expected) / expected < 0.03
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+from datetime import date
+
+from backend.services.price_cache import PriceCache, PriceSeries
+
+class StubRedis:
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.mget_calls = []
+    
+    def pipeline(self, transaction=True):
+        return StubPipeline(self)
+    
+    async def mget(self, keys):
+        self.mget_calls.append(list(keys))
+        return [self.values.get(key) for key in keys]
+
+class StubPipeline:
+    def __init__(self, client: StubRedis):
+        self.client = client
+        self.results = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def set(self, key, value, ex=None):
+        self.client.values[key] = value
+        self.results.append(True)
+    
+    def sadd(self, key, member):
+        self.client.sets.setdefault(key, set()).add(member.encode())
+        self.results.append(1)
+    
+    def expire(self, key, seconds):
+        self.results.append(True)
+    
+    def smembers(self, key):
+        self.results.append(set(self.client.sets.get(key, set())))
+    
+    async def execute(self):
+        results, self.results = self.results, []
+        return results
+
+def make_series(ticker: str, start_date: date, end_date: date) -> PriceSeries:
+    dates = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+    closes = np.linspace(100.0, 110.0, len(dates))
+    return PriceSeries(
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        dates=dates,
+        columns={'close': closes, 'adjusted_close': closes}
+    )
+
+def build_cache(max_bytes: int = 1024 * 1024) -> PriceCache:
+    return PriceCache(max_bytes=max_bytes, local_ttl=60.0, redis_url=None, redis_ttl=60)
+
+@pytest.mark.asyncio
+async def test_narrower_request_is_sliced_from_cached_range():
+    cache = build_cache()
+    await cache.set_many([make_series("AAPL", date(2024, 1, 1), date(2024, 3, 31))])
+    
+    found = await cache.get_many(["AAPL", "MSFT"], date(2024, 2, 1), date(2024, 2, 10), ['close'])
+    
+    assert list(found) == ["AAPL"]
+    assert found["AAPL"].dates[0] == np.datetime64('2024-02-01')
+    assert found["AAPL"].dates[-1] == np.datetime64('2024-02-10')
+    assert len(found["AAPL"].columns['close']) == 10
+
+@pytest.mark.asyncio
+async def test_wider_request_or_missing_column_misses():
+    cache = build_cache()
+    await cache.set_many([make_series("AAPL", date(2024, 1, 1), date(2024, 3, 31))])
+    
+    assert await cache.get_many(["AAPL"], date(2023, 12, 1), date(2024, 2, 1), ['close']) == {}
+    assert await cache.get_many(["AAPL"], date(2024, 1, 1), date(2024, 2, 1), ['volume']) == {}
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_ticker_entries():
+    cache = build_cache()
+    await cache.set_many([
+        make_series("AAPL", date(2024, 1, 1), date(2024, 3, 31)),
+        make_series("MSFT", date(2024, 1, 1), date(2024, 3, 31))
+    ])
+    
+    await cache.invalidate(["AAPL"])
+    found = await cache.get_many(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 3, 31), ['close'])
+    
+    assert list(found) == ["MSFT"]
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    series_bytes = make_series("AAPL", date(2024, 1, 1), date(2024, 3, 31)).nbytes
+    cache = build_cache(max_bytes=series_bytes * 2)
+    
+    await cache.set_many([make_series("AAPL", date(2024, 1, 1), date(2024, 3, 31))])
+    await cache.set_many([make_series("MSFT", date(2024, 1, 1), date(2024, 3, 31))])
+    await cache.get_many(["AAPL"], date(2024, 1, 1), date(2024, 1, 31), ['close'])
+    await cache.set_many([make_series("GOOGL", date(2024, 1, 1), date(2024, 3, 31))])
+    
+    found = await cache.get_many(["AAPL", "MSFT", "GOOGL"], date(2024, 1, 1), date(2024, 1, 31), ['close'])
+    
+    assert sorted(found) == ["AAPL", "GOOGL"]
+    assert cache.current_bytes <= series_bytes * 2
+
+def test_series_round_trips_through_bytes():
+    series = make_series("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+    
+    restored = PriceSeries.from_bytes("AAPL", series.start_date, series.end_date, series.to_bytes())
+    
+    np.testing.assert_array_equal(restored.dates, series.dates)
+    np.testing.assert_allclose(restored.columns['close'], series.columns['close'])
+
+@pytest.mark.asyncio
+async def test_every_covering_redis_range_is_tried_before_missing():
+    client = StubRedis()
+    cache = build_cache()
+    cache._redis_client = lambda: client
+    
+    await cache.set_many([
+        make_series("AAPL", date(2024, 1, 1), date(2024, 3, 31)),
+        make_series("AAPL", date(2024, 1, 15), date(2024, 2, 29)),
+        make_series("AAPL", date(2024, 2, 1), date(2024, 2, 15))
+    ])
+    del client.values[cache._series_key("AAPL", date(2024, 2, 1), date(2024, 2, 15))]
+    cache.clear_local()
+    
+    found = await cache.get_many(["AAPL"], date(2024, 2, 1), date(2024, 2, 10), ['close'])
+    
+    assert client.mget_calls == [[
+        cache._series_key("AAPL", date(2024, 2, 1), date(2024, 2, 15)),
+        cache._series_key("AAPL", date(2024, 1, 15), date(2024, 2, 29)),
+        cache._series_key("AAPL", date(2024, 1, 1), date(2024, 3, 31))
+    ]]
+    assert found["AAPL"].dates[0] == np.datetime64('2024-02-01')
+    assert found["AAPL"].dates[-1] == np.datetime64('2024-02-10')
+    assert list(cache._entries) == [("AAPL", date(2024, 1, 15), date(2024, 2, 29))]
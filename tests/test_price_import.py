@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from backend.services.data_ingestion import PRICE_COLUMNS, build_price_records
+from backend.services.price_import import normalize_price_chunk
+
+def test_aliases_columns_and_parses_dates():
+    chunk = pd.DataFrame({
+        "Symbol": [" aapl", "msft "],
+        "Timestamp": ["2024-01-02T21:00:00Z", "2024-01-03T21:00:00Z"],
+        "Adj Close": [184.5, 370.1],
+        "C": [185.6, 370.6],
+        "V": [1000, 2000]
+    })
+    
+    records = normalize_price_chunk(chunk)
+    
+    assert list(records.columns) == PRICE_COLUMNS
+    assert records["ticker"].tolist() == ["AAPL", "MSFT"]
+    assert records["date"].tolist() == [pd.Timestamp("2024-01-02 21:00:00"), pd.Timestamp("2024-01-03 21:00:00")]
+    assert records["date"].dt.tz is None
+    assert records["adjusted_close"].tolist() == [184.5, 370.1]
+    assert records["close"].tolist() == [185.6, 370.6]
+    assert records["open"].isna().all()
+
+def test_unparseable_dates_become_missing_so_the_rows_are_dropped_on_store():
+    chunk = pd.DataFrame({"date": ["2024-01-02", "not a date", None], "close": [1.0, 2.0, 3.0]})
+    
+    records = normalize_price_chunk(chunk, "spy")
+    
+    assert records["ticker"].tolist() == ["SPY", "SPY", "SPY"]
+    assert records["date"].isna().tolist() == [False, True, True]
+    assert len(build_price_records(records)) == 1
+
+def test_requires_a_ticker_and_the_core_columns():
+    with pytest.raises(ValueError, match="no ticker column"):
+        normalize_price_chunk(pd.DataFrame({"date": ["2024-01-02"], "close": [1.0]}))
+    
+    with pytest.raises(ValueError, match="close"):
+        normalize_price_chunk(pd.DataFrame({"ticker": ["SPY"], "date": ["2024-01-02"]}))
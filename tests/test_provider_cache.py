@@ -0,0 +1,49 @@
+import os
+import numpy as np
+from datetime import date
+
+from backend.services.price_cache import PriceSeries
+from backend.services.provider_cache import ProviderResponseCache
+
+def make_series(dates, closes) -> PriceSeries:
+    dates = np.array(dates, dtype='datetime64[D]')
+    return PriceSeries(
+        ticker="IBM",
+        start_date=dates[0].astype(object),
+        end_date=dates[-1].astype(object),
+        dates=dates,
+        columns={'close': np.array(closes, dtype=np.float64)}
+    )
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = ProviderResponseCache(str(tmp_path), ttl=60.0)
+    cache.store("alpha_vantage", "IBM", "TIME_SERIES_DAILY_ADJUSTED", make_series(['2024-01-02', '2024-01-03'], [10.0, 11.0]))
+    
+    series, fetched_at = cache.load("alpha_vantage", "IBM", "TIME_SERIES_DAILY_ADJUSTED")
+    
+    assert cache.is_fresh(fetched_at)
+    assert series.start_date == date(2024, 1, 2)
+    assert series.end_date == date(2024, 1, 3)
+    assert series.columns['close'].tolist() == [10.0, 11.0]
+    assert cache.load("alpha_vantage", "IBM", "TIME_SERIES_WEEKLY") is None
+
+def test_stale_entry_is_not_fresh(tmp_path):
+    cache = ProviderResponseCache(str(tmp_path), ttl=60.0)
+    cache.store("alpha_vantage", "IBM", "TIME_SERIES_DAILY_ADJUSTED", make_series(['2024-01-02'], [10.0]))
+    path = cache._path("alpha_vantage", "IBM", "TIME_SERIES_DAILY_ADJUSTED")
+    os.utime(path, (0, 0))
+    
+    _, fetched_at = cache.load("alpha_vantage", "IBM", "TIME_SERIES_DAILY_ADJUSTED")
+    
+    assert not cache.is_fresh(fetched_at)
+
+def test_merge_appends_delta_and_prefers_new_bars(tmp_path):
+    cache = ProviderResponseCache(str(tmp_path), ttl=60.0)
+    cached = make_series(['2024-01-02', '2024-01-03'], [10.0, 11.0])
+    delta = make_series(['2024-01-03', '2024-01-04'], [11.5, 12.0])
+    
+    merged = cache.merge(cached, delta)
+    
+    assert merged.dates.tolist() == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+    assert merged.columns['close'].tolist() == [10.0, 11.5, 12.0]
+    assert merged.end_date == date(2024, 1, 4)
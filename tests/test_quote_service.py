@@ -0,0 +1,88 @@
+import asyncio
+import time
+import pytest
+
+from backend.services.quote_service import QuoteService
+
+class CountingFetcher:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.batches = []
+    
+    def __call__(self, tickers):
+        self.batches.append(list(tickers))
+        time.sleep(self.delay)
+        return {ticker: 100.0 + i for i, ticker in enumerate(tickers) if ticker != "MISSING"}
+
+def build_service(fetcher, ttl: float = 60.0, max_batch_size: int = 50) -> QuoteService:
+    return QuoteService(ttl=ttl, batch_window=0.01, max_batch_size=max_batch_size, fetch_quotes=fetcher)
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_are_batched_and_coalesced():
+    fetcher = CountingFetcher()
+    service = build_service(fetcher)
+    
+    results = await asyncio.gather(
+        service.get_quotes(["AAPL"]),
+        service.get_quotes(["AAPL", "MSFT"]),
+        service.get_quotes(["MSFT", "GOOGL"])
+    )
+    
+    assert len(fetcher.batches) == 1
+    assert sorted(fetcher.batches[0]) == ["AAPL", "GOOGL", "MSFT"]
+    assert results[0]["AAPL"] == results[1]["AAPL"]
+    assert results[1]["MSFT"] == results[2]["MSFT"]
+
+@pytest.mark.asyncio
+async def test_cached_quotes_skip_upstream_until_ttl_expires():
+    fetcher = CountingFetcher(delay=0)
+    service = build_service(fetcher, ttl=0.2)
+    
+    await service.get_quotes(["AAPL"])
+    await service.get_quotes(["AAPL"])
+    assert len(fetcher.batches) == 1
+    
+    await asyncio.sleep(0.25)
+    await service.get_quotes(["AAPL"])
+    assert len(fetcher.batches) == 2
+
+@pytest.mark.asyncio
+async def test_missing_quotes_return_zero_and_are_not_cached():
+    fetcher = CountingFetcher(delay=0)
+    service = build_service(fetcher)
+    
+    first = await service.get_quotes(["MISSING"])
+    second = await service.get_quotes(["MISSING"])
+    
+    assert first["MISSING"] == 0.0
+    assert second["MISSING"] == 0.0
+    assert len(fetcher.batches) == 2
+
+@pytest.mark.asyncio
+async def test_large_requests_are_split_into_batches():
+    fetcher = CountingFetcher(delay=0)
+    service = build_service(fetcher, max_batch_size=10)
+    
+    quotes = await service.get_quotes([f"T{i}" for i in range(25)])
+    
+    assert len(quotes) == 25
+    assert [len(batch) for batch in fetcher.batches] == [10, 10, 5]
+
+@pytest.mark.asyncio
+async def test_fetched_quotes_are_handed_to_the_recorder():
+    recorded = []
+    
+    async def record(quotes):
+        recorded.append(quotes)
+    
+    service = QuoteService(
+        ttl=60.0,
+        batch_window=0.01,
+        max_batch_size=50,
+        fetch_quotes=CountingFetcher(delay=0),
+        on_quotes=record
+    )
+    
+    await service.get_quotes(["AAPL", "MISSING"])
+    
+    assert recorded == [{"AAPL": 100.0}]